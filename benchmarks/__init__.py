@@ -0,0 +1 @@
+# Benchmarks - timing scripts comparing algorithm variants
@@ -0,0 +1,102 @@
+"""
+Benchmark: per-action `score_action` vs batched `score_actions`.
+
+Builds seeded positions from headless games stopped at different turns
+(hands topped up so every action type, bank trades included, is on
+offer) and scores each position's candidate list both ways. Before
+timing, it checks that every score is identical and that both pick the
+same action. The batch path is timed as configured (NumPy only for long
+columns), with NumPy forced for every column (when installed) and with
+the plain-Python fallback.
+
+Run from the repo root:
+    python -m benchmarks.action_scoring_bench --positions 40 --repeat 20
+"""
+
+import argparse
+import time
+from typing import Callable, List, Optional, Tuple
+
+from engine import cpu_player
+from engine.cpu_player import CPUAction, CPUPlayer
+from engine.headless import HeadlessGame
+
+Position = Tuple[CPUPlayer, List[CPUAction]]
+
+
+def build_positions(positions: int, seed: int, top_up: int = 3) -> List[Position]:
+    """Reproducible positions at turns 5..40, each with its candidate actions."""
+    result: List[Position] = []
+    for i in range(positions):
+        runner = HeadlessGame(num_players=4, max_turns=5 + i % 36, seed=seed + i, record_events=False)
+        runner.play()
+        for player in runner.game.players:
+            for resource in list(player.resources):
+                player.add_resource(resource, top_up)
+        adapter = runner.setup.rules_adapter
+        adapter.start_turn()
+        cpu = CPUPlayer(adapter)
+        result.append((cpu, cpu.generate_candidate_actions()))
+    return result
+
+
+def best_index(scores: List[float]) -> int:
+    return max(range(len(scores)), key=lambda i: (scores[i], -i))
+
+
+def time_scoring(positions: List[Position], score: Callable[[CPUPlayer, List[CPUAction]], List[float]],
+                 repeat: int) -> float:
+    """Seconds per decision, best of `repeat` passes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for cpu, actions in positions:
+            score(cpu, actions)
+        best = min(best, time.perf_counter() - start)
+    return best / max(1, len(positions))
+
+
+def scalar(cpu: CPUPlayer, actions: List[CPUAction]) -> List[float]:
+    return [cpu.score_action(a) for a in actions]
+
+
+def batch(cpu: CPUPlayer, actions: List[CPUAction]) -> List[float]:
+    return cpu.score_actions(actions)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare per-action and batched CPU action scoring")
+    parser.add_argument("--positions", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=20, help="timing passes (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    positions = build_positions(args.positions, args.seed)
+
+    numpy, min_column = cpu_player.np, cpu_player.NUMPY_MIN_COLUMN
+    backends = [("configured", numpy, min_column), ("plain Python", None, min_column)]
+    if numpy is not None:
+        backends.insert(1, ("NumPy always", numpy, 0))
+
+    # Step 1: Same scores, same choice, on every backend
+    for cpu, actions in positions:
+        expected = scalar(cpu, actions)
+        for _, cpu_player.np, cpu_player.NUMPY_MIN_COLUMN in backends:
+            got = batch(cpu, actions)
+            if got != expected or best_index(got) != best_index(expected):
+                raise AssertionError(f"batch scores differ: {got} vs {expected}")
+
+    # Step 2: Time them over the same candidate lists
+    actions_per_decision = sum(len(actions) for _, actions in positions) / len(positions)
+    scalar_time = time_scoring(positions, scalar, args.repeat)
+    print(f"{len(positions)} decisions, {actions_per_decision:.1f} actions each")
+    print(f"  score_action per action:  {scalar_time * 1e6:8.1f} µs/decision")
+    for label, cpu_player.np, cpu_player.NUMPY_MIN_COLUMN in backends:
+        batch_time = time_scoring(positions, batch, args.repeat)
+        print(f"  score_actions ({label + '):':14} {batch_time * 1e6:8.1f} µs/decision"
+              f"  speed-up {scalar_time / batch_time:.2f}x")
+    cpu_player.np, cpu_player.NUMPY_MIN_COLUMN = numpy, min_column
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: MCTS search quality per worker count at a fixed wall clock.
+
+Builds seeded mid-game positions (headless games stopped after a few
+rounds, with every hand topped up so there is something to decide) and
+searches each one for the same time limit with 1, 2, 4, ... workers in
+root- and leaf-parallel mode. Reports iterations per decision (how much
+search the wall clock buys) and how often the move matches a reference
+search with a much larger single-process budget (whether that search
+turns into better moves).
+
+Run from the repo root:
+    python -m benchmarks.parallel_search_bench --positions 10 --time-limit 0.2 --workers 1 2 4
+"""
+
+import argparse
+from dataclasses import replace
+from typing import List, Optional, Tuple
+
+from engine.headless import HeadlessGame
+from engine.mcts import MCTSConfig, MCTSPlayer, action_key
+from engine.parallel_search import LEAF_PARALLEL, ROOT_PARALLEL, search_player, shutdown_pools
+from engine.rules_adapter import GameRulesAdapter
+
+
+def build_positions(positions: int, seed: int, turns: int = 20) -> List[GameRulesAdapter]:
+    """Reproducible mid-game positions, the player to move holding cards to spend."""
+    adapters = []
+    for i in range(positions):
+        runner = HeadlessGame(num_players=4, max_turns=turns, seed=seed + i, record_events=False)
+        runner.play()
+        for player in runner.game.players:
+            for resource in list(player.resources):
+                player.add_resource(resource, 2)
+        adapter = runner.setup.rules_adapter
+        adapter.start_turn()
+        adapters.append(adapter)
+    return adapters
+
+
+def run(adapters: List[GameRulesAdapter], config: MCTSConfig, references: List[Tuple]) -> Tuple[float, float]:
+    """(mean iterations per decision, share of decisions matching the reference)."""
+    iterations = 0
+    matches = 0
+    for adapter, reference in zip(adapters, references):
+        player = search_player(adapter, None, config)
+        if action_key(player.choose_action()) == reference:
+            matches += 1
+        iterations += player.stats.iterations
+    return iterations / len(adapters), matches / len(adapters)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare parallel MCTS modes at a fixed time limit")
+    parser.add_argument("--positions", type=int, default=10)
+    parser.add_argument("--time-limit", type=float, default=0.2, help="seconds per decision")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--reference", type=int, default=400, help="iterations of the reference search")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    adapters = build_positions(args.positions, args.seed)
+    reference_config = MCTSConfig(iterations=args.reference)
+    references = [action_key(MCTSPlayer(adapter, None, reference_config).choose_action()) for adapter in adapters]
+    timed = MCTSConfig(iterations=None, time_limit=args.time_limit)
+
+    print(f"{len(adapters)} positions, {args.time_limit * 1000:.0f} ms per decision, "
+          f"reference = {args.reference} iterations")
+    try:
+        for mode in (ROOT_PARALLEL, LEAF_PARALLEL):
+            for workers in args.workers:
+                config = replace(timed, workers=workers, parallel=mode)
+                iterations, agreement = run(adapters, config, references)
+                print(f"  {mode:4} x{workers}: {iterations:7.1f} iterations/decision, "
+                      f"{agreement:5.0%} match the reference")
+    finally:
+        shutdown_pools()
+
+
+if __name__ == "__main__":
+    main()
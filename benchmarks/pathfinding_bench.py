@@ -0,0 +1,98 @@
+"""
+Benchmark: heap Dijkstra vs 0-1 BFS for CPU road planning.
+
+Builds seeded mid-game positions (a settlement per player plus random
+roads) and times both algorithms over the same queries: the nearest vertex
+of each resource (short paths, the CPU's usual question) and a vertex
+chosen at random anywhere on the board (long paths, where copying the path
+on every relaxation hurts the most). Also checks they agree on every distance.
+
+Run from the repo root:
+    python -m benchmarks.pathfinding_bench --positions 50 --repeat 20
+"""
+
+import argparse
+import random
+import time
+from typing import List, Optional, Tuple
+
+from model.board import BoardGraph, create_standard_board
+from search.pathfinding import DIJKSTRA, ZERO_ONE_BFS, Pathfinding
+from services.building_service import TRADEABLE_RESOURCES
+
+Query = Tuple[Pathfinding, List[str], List[str], int]  # pathfinding, starts, targets, player
+
+
+def build_position(seed: int, num_players: int = 4, num_roads: int = 30) -> BoardGraph:
+    """Random but reproducible position: one settlement per player, then roads."""
+    rng = random.Random(seed)
+    board = create_standard_board(rng)
+    names = list(board.vertices)
+    for pid in range(num_players):
+        board.set_vertex_owner(rng.choice(names), pid)
+    for _ in range(num_roads):
+        e = rng.randrange(len(board.edges))
+        if board.edges[e].owner is None:
+            board.set_edge_owner(e, rng.randrange(num_players))
+    return board
+
+
+def build_queries(positions: int, seed: int, num_players: int = 4) -> Tuple[List[Query], List[Query]]:
+    """(nearest-resource queries, random-vertex queries) over the same positions."""
+    rng = random.Random(seed)
+    resource_queries: List[Query] = []
+    vertex_queries: List[Query] = []
+    for i in range(positions):
+        pathfinding = Pathfinding(build_position(seed + i, num_players))
+        names = list(pathfinding.board.vertices)
+        for pid in range(num_players):
+            starts = pathfinding.get_player_connected_vertices(pid)
+            for resource in TRADEABLE_RESOURCES:
+                targets = pathfinding._find_vertices_with_resource(resource)
+                resource_queries.append((pathfinding, starts, targets, pid))
+            vertex_queries.append((pathfinding, starts, [rng.choice(names)], pid))
+    return resource_queries, vertex_queries
+
+
+def time_algorithm(queries: List[Query], algorithm: str, repeat: int) -> float:
+    """Seconds per query, best of `repeat` passes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for pathfinding, starts, targets, pid in queries:
+            pathfinding._shortest_path(starts, targets, pid, algorithm)
+        best = min(best, time.perf_counter() - start)
+    return best / max(1, len(queries))
+
+
+def compare(label: str, queries: List[Query], repeat: int) -> None:
+    # Step 1: Both algorithms must agree on every distance
+    for pathfinding, starts, targets, pid in queries:
+        heap = pathfinding._shortest_path(starts, targets, pid, DIJKSTRA)
+        bfs = pathfinding._shortest_path(starts, targets, pid, ZERO_ONE_BFS)
+        if (heap is None) != (bfs is None) or (heap is not None and heap[1] != bfs[1]):
+            raise AssertionError(f"distance mismatch for player {pid} to {targets}: {heap} vs {bfs}")
+
+    # Step 2: Time them over the same queries
+    heap_time = time_algorithm(queries, DIJKSTRA, repeat)
+    bfs_time = time_algorithm(queries, ZERO_ONE_BFS, repeat)
+    print(f"{label}: {len(queries)} queries")
+    print(f"  Dijkstra (heap, path copies): {heap_time * 1e6:8.1f} µs/query")
+    print(f"  0-1 BFS (deque, parents):     {bfs_time * 1e6:8.1f} µs/query")
+    print(f"  speed-up: {heap_time / bfs_time:.2f}x")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare Dijkstra and 0-1 BFS road planning")
+    parser.add_argument("--positions", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20, help="timing passes (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    resource_queries, vertex_queries = build_queries(args.positions, args.seed)
+    compare("Nearest resource", resource_queries, args.repeat)
+    compare("Random vertex", vertex_queries, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
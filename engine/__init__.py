@@ -1,17 +1,21 @@
-from .cpu_player import (
-	CPUPlayer,
-	CPUAction,
-	ActionType,
-	CPUWeights,
-	# RulesAdapter is a Protocol; export for typing users
-	RulesAdapter,
-)
-
-__all__ = [
-	"CPUPlayer",
-	"CPUAction",
-	"ActionType",
-	"CPUWeights",
-	"RulesAdapter",
-]
-
+from .cpu_player import (
+	CPUPlayer,
+	CPUAction,
+	ActionType,
+	CPUWeights,
+	# RulesAdapter is a Protocol; export for typing users
+	RulesAdapter,
+	select_best,
+	select_top,
+)
+
+__all__ = [
+	"CPUPlayer",
+	"CPUAction",
+	"ActionType",
+	"CPUWeights",
+	"RulesAdapter",
+	"select_best",
+	"select_top",
+]
+
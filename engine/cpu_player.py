@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum, auto
+from functools import total_ordering
 from typing import Any, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple
 import heapq
 import math
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch scoring falls back to plain Python
+    np = None
+
+# Feature columns shorter than this are combined in plain Python: below it
+# NumPy's per-call overhead costs more than the arithmetic it vectorises
+NUMPY_MIN_COLUMN = 128
+
 # External enums expected from model
 try:
     from ColabCatan.model.enums import Resource
@@ -35,25 +45,115 @@ class ActionType(Enum):
     PASS = auto()
 
 
-@dataclass(order=True)
+# Argument names of each action type, in `CPUAction.args` order
+ACTION_PARAMS: Dict[ActionType, Tuple[str, ...]] = {
+    ActionType.BUILD_SETTLEMENT: ("vertex_id",),
+    ActionType.BUILD_ROAD: ("edge_id",),
+    ActionType.BUILD_CITY: ("vertex_id",),
+    ActionType.BUY_DEV_CARD: (),
+    ActionType.BANK_TRADE: ("give", "get", "rate"),
+    ActionType.PLAYER_TRADE: (),
+    ActionType.MOVE_ROBBER: ("hex_id", "steal_from"),
+    ActionType.PASS: (),
+}
+
+# Explanations, formatted from the params only when someone asks for one
+ACTION_EXPLANATIONS: Dict[ActionType, str] = {
+    ActionType.BUILD_SETTLEMENT: "Build settlement",
+    ActionType.BUILD_ROAD: "Build road",
+    ActionType.BUILD_CITY: "Upgrade settlement to city",
+    ActionType.BUY_DEV_CARD: "Buy development card",
+    ActionType.BANK_TRADE: "Bank trade {rate}:1 {give.name}->{get.name}",
+    ActionType.PLAYER_TRADE: "Trade with a player",
+    ActionType.MOVE_ROBBER: "Move robber",
+    ActionType.PASS: "Pass / save resources",
+}
+
+
+@total_ordering
 class CPUAction:
     """
     Represents one possible action the CPU might take.
     Each action gets a score, and we use that score to decide what’s “best”.
-    
+
+    A compact `__slots__` record: the action's arguments are a plain tuple
+    (`args`, named by `ACTION_PARAMS`). The `params` dict and the
+    `explanation` string are only built when read, so the hundreds of
+    candidates a decision (or a search) throws away never pay for them.
+    `CPUAction.of` is the allocation-only constructor move generation uses.
+
     sort_index:
-        heapq only supports min-heaps, so we store negative scores so the
-        highest-scoring action comes out first.
+        The negative score, so sorting (or heapq) puts the highest-scoring
+        action first. `select_best` / `select_top` compare scores directly.
+        Ordering and equality compare (sort_index, score), as before.
     """
-    sort_index: float = field(init=False, repr=False)
-    score: float  # this will be updated later
-    action_type: ActionType = field(compare=False)
-    params: Dict[str, Any] = field(default_factory=dict, compare=False)
-    explanation: Optional[str] = field(default=None, compare=False)
 
-    def __post_init__(self) -> None:
-        # Negative score because heapq pops the smallest element first.
-        self.sort_index = -self.score
+    __slots__ = ("sort_index", "score", "action_type", "args", "_params", "_explanation")
+
+    def __init__(
+        self,
+        score: float,
+        action_type: ActionType,
+        params: Optional[Dict[str, Any]] = None,
+        explanation: Optional[str] = None,
+    ) -> None:
+        params = {} if params is None else params
+        self.score = score
+        self.sort_index = -score  # this will be updated later, with the score
+        self.action_type = action_type
+        self.args = tuple(params.get(name) for name in ACTION_PARAMS[action_type])
+        self._params = params
+        self._explanation = explanation
+
+    @classmethod
+    def of(cls, action_type: ActionType, *args: Any) -> "CPUAction":
+        """Unscored action from positional arguments (in `ACTION_PARAMS` order)."""
+        action = cls.__new__(cls)
+        action.score = 0.0
+        action.sort_index = -0.0
+        action.action_type = action_type
+        action.args = args
+        action._params = None
+        action._explanation = None
+        return action
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        if self._params is None:
+            self._params = dict(zip(ACTION_PARAMS[self.action_type], self.args))
+        return self._params
+
+    @property
+    def explanation(self) -> str:
+        if self._explanation is None:
+            try:
+                self._explanation = ACTION_EXPLANATIONS[self.action_type].format(**self.params)
+            except (KeyError, AttributeError):
+                self._explanation = self.action_type.name  # params missing or incomplete
+        return self._explanation
+
+    @explanation.setter
+    def explanation(self, value: Optional[str]) -> None:
+        self._explanation = value
+
+    def _key(self) -> Tuple[float, float]:
+        return self.sort_index, self.score
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __lt__(self, other: "CPUAction") -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() < other._key()
+
+    __hash__ = None  # mutable and compared by score, like the dataclass it replaced
+
+    def __repr__(self) -> str:
+        return (f"CPUAction(score={self.score!r}, action_type={self.action_type!r}, "
+                f"params={self.params!r}, explanation={self.explanation!r})")
 
 
 @dataclass
@@ -180,67 +280,31 @@ class CPUPlayer:
         player_id = self.rules.current_player_id()
         actions: List[CPUAction] = []
 
+        make = CPUAction.of  # bare records: no params dict, no explanation yet
+
         # Add every settlement spot the player is allowed to build
-        for v in self.rules.legal_settlement_vertices(player_id):
-            actions.append(CPUAction(
-                score=0.0,
-                action_type=ActionType.BUILD_SETTLEMENT,
-                params={"vertex_id": v},
-                explanation="Build settlement"
-            ))
+        actions.extend([make(ActionType.BUILD_SETTLEMENT, v) for v in self.rules.legal_settlement_vertices(player_id)])
 
         # Add every place they can build a road in
-        for e in self.rules.legal_road_edges(player_id):
-            actions.append(CPUAction(
-                score=0.0,
-                action_type=ActionType.BUILD_ROAD,
-                params={"edge_id": e},
-                explanation="Build road"
-            ))
+        actions.extend([make(ActionType.BUILD_ROAD, e) for e in self.rules.legal_road_edges(player_id)])
 
         # Add every possible settlement→city upgrade
-        for v in self.rules.upgradeable_vertices(player_id):
-            actions.append(CPUAction(
-                score=0.0,
-                action_type=ActionType.BUILD_CITY,
-                params={"vertex_id": v},
-                explanation="Upgrade settlement to city"
-            ))
+        actions.extend([make(ActionType.BUILD_CITY, v) for v in self.rules.upgradeable_vertices(player_id)])
 
         # Dev card buy is just a yes/no based on resources
         if self.rules.can_buy_dev_card(player_id):
-            actions.append(CPUAction(
-                score=0.0,
-                action_type=ActionType.BUY_DEV_CARD,
-                params={},
-                explanation="Buy development card"
-            ))
+            actions.append(make(ActionType.BUY_DEV_CARD))
 
         # Add all 4:1 trades (or port trades if the adapter gives them)
-        for give, get, rate in self.rules.bank_trade_options(player_id):
-            actions.append(CPUAction(
-                score=0.0,
-                action_type=ActionType.BANK_TRADE,
-                params={"give": give, "get": get, "rate": rate},
-                explanation=f"Bank trade {rate}:1 {give.name}->{get.name}"
-            ))
+        actions.extend([make(ActionType.BANK_TRADE, give, get, rate)
+                        for give, get, rate in self.rules.bank_trade_options(player_id)])
 
         # Add all legal robber targets
-        for hex_id, steal_from in self.rules.robber_move_options(player_id):
-            actions.append(CPUAction(
-                score=0.0,
-                action_type=ActionType.MOVE_ROBBER,
-                params={"hex_id": hex_id, "steal_from": steal_from},
-                explanation="Move robber"
-            ))
+        actions.extend([make(ActionType.MOVE_ROBBER, hex_id, steal_from)
+                        for hex_id, steal_from in self.rules.robber_move_options(player_id)])
 
         # Always include “do nothing”
-        actions.append(CPUAction(
-            score=0.0,
-            action_type=ActionType.PASS,
-            params={},
-            explanation="Pass / save resources"
-        ))
+        actions.append(make(ActionType.PASS))
 
         return actions
 
@@ -260,29 +324,7 @@ class CPUPlayer:
 
         score = 0.0  # will gradually add to this
 
-        # Helper to scale actions depending on what stage of the game we’re in
-        def phase_multiplier_for(action_type: ActionType) -> float:
-            if phase == "early":
-                if action_type == ActionType.BUILD_SETTLEMENT:
-                    return weights.early_weight_settlement
-                if action_type == ActionType.BUILD_ROAD:
-                    return weights.early_weight_road
-            elif phase == "mid":
-                if action_type == ActionType.BUILD_CITY:
-                    return weights.mid_weight_city
-                if action_type == ActionType.BUY_DEV_CARD:
-                    return weights.mid_weight_dev
-            elif phase == "late":
-                if action_type == ActionType.BUILD_CITY:
-                    return weights.late_weight_city
-                if action_type == ActionType.BUY_DEV_CARD:
-                    return weights.late_weight_dev
-                # In late game, blocking actions (roads, robber, settlements) matter a lot
-                if action_type in (ActionType.MOVE_ROBBER, ActionType.BUILD_ROAD, ActionType.BUILD_SETTLEMENT):
-                    return weights.late_weight_blocking
-            return 1.0  # default multiplier
-
-        pm = phase_multiplier_for(action.action_type)
+        pm = self._phase_multiplier(phase, action.action_type)
 
         # Scoring logic for each kind of action
         if action.action_type == ActionType.BUILD_SETTLEMENT:
@@ -372,34 +414,214 @@ class CPUPlayer:
         # Return final score
         return score
 
-    # Step 3: Pick the highest-scoring action using a max-heap
+    # Step 2b: Score a whole candidate list at once
+    def score_actions(self, actions: Sequence[CPUAction]) -> List[float]:
+        """
+        Batch version of `score_action`: the same scores, in order.
+
+        The context every score shares (phase multipliers, the player, their
+        hand, production profile, board scarcity, build costs and progress
+        before trading) is looked up once per call instead of once per action.
+        Each action type's feature columns (pip, diversity, block value, ...)
+        are then combined by one formula (over NumPy arrays once a column is
+        `NUMPY_MIN_COLUMN` long). Bank trade progress only re-counts the two
+        resources a trade changes.
+        Every operation happens in the same order as in `score_action`, so the
+        floats match bit for bit.
+
+        Time Complexity: O(A + B × O) for A actions, B of them bank trades, O opponents
+        - Shared context: one adapter query each per call
+        - Space: O(A) feature columns
+        """
+        rules = self.rules
+        weights = self.weights
+        phase = rules.game_phase()
+        player_id = rules.current_player_id()
+        scores = [0.0] * len(actions)
+
+        # Step 1: Group positions by action type
+        groups: Dict[ActionType, List[int]] = {}
+        for i, action in enumerate(actions):
+            groups.setdefault(action.action_type, []).append(i)
+
+        def assign(indices: List[int], values: List[float]) -> None:
+            for i, value in zip(indices, values):
+                scores[i] = value
+
+        # Step 2: One formula per action type over its feature columns
+        indices = groups.get(ActionType.BUILD_SETTLEMENT)
+        if indices:
+            pm = self._phase_multiplier(phase, ActionType.BUILD_SETTLEMENT)
+            vertices = [int(actions[i].args[0]) for i in indices]
+            pips = [rules.vertex_pip(v) for v in vertices]
+            diversity = [weights.resource_diversity_bonus if len(set(rules.vertex_resource_set(v))) >= 2 else 0.0
+                         for v in vertices]
+            blocks = [rules.settlement_blocks_opponent_value(v) * weights.block_leader_bonus for v in vertices]
+            assign(indices, _combine(
+                lambda pip, div, block: (weights.base_value_settlement + pip * weights.pip_value_per_point
+                                         + div + block) * pm,
+                pips, diversity, blocks,
+            ))
+
+        indices = groups.get(ActionType.BUILD_CITY)
+        if indices:
+            pm = self._phase_multiplier(phase, ActionType.BUILD_CITY)
+            pips = [rules.vertex_pip(int(actions[i].args[0])) for i in indices]
+            assign(indices, _combine(
+                lambda pip: (weights.base_value_city + pip * weights.city_on_high_pip_bonus_factor) * pm,
+                pips,
+            ))
+
+        indices = groups.get(ActionType.BUILD_ROAD)
+        if indices:
+            pm = self._phase_multiplier(phase, ActionType.BUILD_ROAD)
+            edges = [int(actions[i].args[0]) for i in indices]
+            towards = [rules.road_expands_towards_value(e) for e in edges]
+            longest = [rules.road_contributes_longest(player_id, e) * weights.longest_road_push for e in edges]
+            assign(indices, _combine(
+                lambda value, pressure: (weights.base_value_road + value + pressure) * pm,
+                towards, longest,
+            ))
+
+        indices = groups.get(ActionType.BUY_DEV_CARD)
+        if indices:
+            pm = self._phase_multiplier(phase, ActionType.BUY_DEV_CARD)
+            assign(indices, [(weights.base_value_dev + weights.largest_army_push) * pm] * len(indices))
+
+        indices = groups.get(ActionType.BANK_TRADE)
+        if indices:
+            pm = self._phase_multiplier(phase, ActionType.BANK_TRADE)
+            opponents = list(rules.opponents())
+            profile = rules.resource_production_profile(player_id)
+            scarcity = rules.board_resource_scarcity()
+            hand = rules.player_resources(player_id)
+            # Progress per build before trading: (cost, total needed, already held)
+            costs = [(cost, sum(max(0, c) for c in cost.values()),
+                      sum(min(hand.get(r, 0), c) for r, c in cost.items()))
+                     for cost in self._build_costs()]
+            before = _total_progress(hand, [cost for cost, _, _ in costs])
+            gains: Dict[Resource, Tuple[int, ...]] = {}  # per received resource
+            losses: Dict[Tuple[Resource, int], Tuple[int, ...]] = {}  # per (given resource, rate)
+
+            safe: List[int] = []
+            progress: List[float] = []
+            excess: List[float] = []
+            give_scarcity: List[float] = []
+            need: List[float] = []
+            for i in indices:
+                give, get, rate = actions[i].args
+                rate = int(rate)
+                if any(rules.would_trade_enable_opponent_win(opp, give, get, rate) for opp in opponents):
+                    scores[i] = -weights.trade_enable_opponent_win_penalty
+                    continue
+                # Only the two traded resources change what each build has
+                if give == get:
+                    changes = _held_change(hand, costs, give, 1 - rate)
+                else:
+                    if get not in gains:
+                        gains[get] = _held_change(hand, costs, get, 1)
+                    if (give, rate) not in losses:
+                        losses[give, rate] = _held_change(hand, costs, give, -rate)
+                    changes = tuple(g + l for g, l in zip(gains[get], losses[give, rate]))
+                after = 0.0
+                for (_, needed, held), change in zip(costs, changes):
+                    if needed:
+                        after += (held + change) / needed
+                safe.append(i)
+                progress.append(max(0.0, after - before))
+                excess.append(max(0.0, profile.get(give, 0.0) - 1.0))
+                give_scarcity.append(scarcity.get(give, 0.0))
+                need.append(1.0 + scarcity.get(get, 0.0))
+            if safe:
+                assign(safe, _combine(
+                    lambda gain, spare, scarce, wanted: (
+                        gain * weights.bank_trade_progress_weight
+                        + spare * weights.bank_trade_excess_bonus
+                        - scarce * weights.bank_trade_scarcity_penalty
+                        + wanted
+                    ) * pm,
+                    progress, excess, give_scarcity, need,
+                ))
+
+        indices = groups.get(ActionType.MOVE_ROBBER)
+        if indices:
+            pm = self._phase_multiplier(phase, ActionType.MOVE_ROBBER)
+            for i in indices:
+                block_value = weights.block_leader_bonus if actions[i].args[1] is not None else 0.0
+                scores[i] = (weights.base_value_robber_block + block_value) * pm
+
+        for i in groups.get(ActionType.PASS, ()):
+            scores[i] = -weights.pass_small_penalty
+
+        return scores
+
+    # Step 3: Pick the highest-scoring action in one linear pass
     def choose_action(self) -> CPUAction:
         """
         Main decision point.
-        Creates a priority queue, scores every action, and returns the one
-        with the highest score.
-        
-        Algorithm: Priority Queue (Heap) - uses min-heap with negated scores to simulate max-heap
-        Time Complexity: O(A log A) average and worst case
+        Scores every action (in one batch, see `score_actions`) and returns
+        the one with the highest score; ties go to the action generated first.
+
+        Algorithm: Linear argmax (see `select_best`)
+        Time Complexity: O(A) average and worst case
         - A = number of candidate actions
-        - Building heap: O(A log A)
-        - Extract max: O(log A)
-        - Space: O(A) for priority queue
+        - Space: O(1) beyond the candidate list
         """
-        actions = self.generate_candidate_actions()
-        pq: List[CPUAction] = []
+        best = select_best(self._scored_candidates())
+        if best is None:
+            return CPUAction(score=0.0, action_type=ActionType.PASS, params={}, explanation="No actions")
+        return best
 
-        for a in actions:
-            a.score = self.score_action(a)
-            a.sort_index = -a.score  # keep heap ordering correct
-            heapq.heappush(pq, a)
+    def rank_actions(self, k: Optional[int] = None) -> List[CPUAction]:
+        """
+        The k best actions, best first, with their scores set (all of them
+        when k is None), e.g. for search priors or logging. Same ordering as
+        `choose_action`: `rank_actions(1)[0]` is the action it would choose.
 
-        if not pq:
-            return CPUAction(score=0.0, action_type=ActionType.PASS, params={}, explanation="No actions")
+        Algorithm: Bounded heap selection (see `select_top`)
+        Time Complexity: O(A log k)
+        - Space: O(k)
+        """
+        return select_top(self._scored_candidates(), k)
 
-        # Best action = highest score = lowest negative sort_index
-        best = heapq.heappop(pq)
-        return best
+    def _scored_candidates(self) -> List[CPUAction]:
+        actions = self.generate_candidate_actions()
+        for a, score in zip(actions, self.score_actions(actions)):
+            a.score = score
+            a.sort_index = -score  # keep CPUAction ordering consistent
+        return actions
+
+    # Helper: scale actions depending on what stage of the game we’re in
+    def _phase_multiplier(self, phase: str, action_type: ActionType) -> float:
+        weights = self.weights
+        if phase == "early":
+            if action_type == ActionType.BUILD_SETTLEMENT:
+                return weights.early_weight_settlement
+            if action_type == ActionType.BUILD_ROAD:
+                return weights.early_weight_road
+        elif phase == "mid":
+            if action_type == ActionType.BUILD_CITY:
+                return weights.mid_weight_city
+            if action_type == ActionType.BUY_DEV_CARD:
+                return weights.mid_weight_dev
+        elif phase == "late":
+            if action_type == ActionType.BUILD_CITY:
+                return weights.late_weight_city
+            if action_type == ActionType.BUY_DEV_CARD:
+                return weights.late_weight_dev
+            # In late game, blocking actions (roads, robber, settlements) matter a lot
+            if action_type in (ActionType.MOVE_ROBBER, ActionType.BUILD_ROAD, ActionType.BUILD_SETTLEMENT):
+                return weights.late_weight_blocking
+        return 1.0  # default multiplier
+
+    # Helper: the costs trades are measured against
+    def _build_costs(self) -> Tuple[Dict[Resource, int], ...]:
+        return (
+            self.rules.build_cost_settlement(),
+            self.rules.build_cost_city(),
+            self.rules.build_cost_road(),
+            self.rules.build_cost_dev_card(),
+        )
 
     # Helper: check affordability (not heavily used yet)
     def _can_afford(self, cost: Dict[Resource, int]) -> bool:
@@ -429,37 +651,82 @@ class CPUPlayer:
         res_after[give] = res_after.get(give, 0) - rate
         res_after[get] = res_after.get(get, 0) + 1
 
-        def progress(res: Dict[Resource, int], cost: Dict[Resource, int]) -> float:
-            have = 0
-            need = 0
-            for r, needed in cost.items():
-                need += max(0, needed)
-                have += min(res.get(r, 0), needed)
-            if need == 0:
-                return 0.0
-            return have / need  # 0.0 = no progress, 1.0 = can afford
-
         # Check progress before vs after trade
-        settle_cost = self.rules.build_cost_settlement()
-        city_cost = self.rules.build_cost_city()
-        road_cost = self.rules.build_cost_road()
-        dev_cost = self.rules.build_cost_dev_card()
-
-        before = (
-            progress(res_before, settle_cost) +
-            progress(res_before, city_cost) +
-            progress(res_before, road_cost) +
-            progress(res_before, dev_cost)
-        )
-        after = (
-            progress(res_after, settle_cost) +
-            progress(res_after, city_cost) +
-            progress(res_after, road_cost) +
-            progress(res_after, dev_cost)
-        )
+        costs = self._build_costs()
+        before = _total_progress(res_before, costs)
+        after = _total_progress(res_after, costs)
 
         return max(0.0, after - before)
 
+
+def _progress(res: Dict[Resource, int], cost: Dict[Resource, int]) -> float:
+    have = 0
+    need = 0
+    for r, needed in cost.items():
+        need += max(0, needed)
+        have += min(res.get(r, 0), needed)
+    if need == 0:
+        return 0.0
+    return have / need  # 0.0 = no progress, 1.0 = can afford
+
+
+def _total_progress(res: Dict[Resource, int], costs: Sequence[Dict[Resource, int]]) -> float:
+    total = 0.0
+    for cost in costs:
+        total += _progress(res, cost)
+    return total
+
+
+def select_best(actions: Sequence[CPUAction]) -> Optional[CPUAction]:
+    """
+    Highest-scoring action, or None for an empty list. Ties go to the
+    earliest action, so a given candidate list always gives the same choice.
+
+    Time Complexity: O(A) - one pass, no heap
+    """
+    best: Optional[CPUAction] = None
+    for action in actions:
+        if best is None or action.score > best.score:
+            best = action
+    return best
+
+
+def select_top(actions: Sequence[CPUAction], k: Optional[int] = None) -> List[CPUAction]:
+    """
+    The k highest-scoring actions, best first (all of them when k is None).
+    Ties keep candidate order, like `select_best`.
+
+    Time Complexity: O(A log k) - `heapq.nlargest` keeps only k actions in its heap
+    """
+    if k is None:
+        return sorted(actions, key=_score, reverse=True)
+    return heapq.nlargest(k, actions, key=_score)
+
+
+def _score(action: CPUAction) -> float:
+    return action.score
+
+
+def _held_change(
+    hand: Dict[Resource, int],
+    costs: Sequence[Tuple[Dict[Resource, int], int, int]],
+    resource: Resource,
+    delta: int,
+) -> Tuple[int, ...]:
+    """Per build cost: how many more of its cards are held after `delta` of `resource`."""
+    held = hand.get(resource, 0)
+    return tuple(
+        min(held + delta, cost[resource]) - min(held, cost[resource]) if resource in cost else 0
+        for cost, _, _ in costs
+    )
+
+
+def _combine(formula, *columns: List[float]) -> List[float]:
+    """Apply a scoring formula to feature columns: one NumPy pass for long columns, else row by row."""
+    if np is not None and len(columns[0]) >= NUMPY_MIN_COLUMN:
+        return np.asarray(formula(*(np.asarray(column, dtype=float) for column in columns))).tolist()
+    return [formula(*row) for row in zip(*columns)]
+
 #to do:
 #test code
 #add more weights maybe
@@ -2,7 +2,9 @@ import random
 
 class Dice:
     "This will be our 2 dices with 6 sides each"
-    def __init__(self):
+    def __init__(self, rng=None):
+        # Pass the game's random.Random to make rolls reproducible
+        self.rng = rng if rng is not None else random.Random()
         self.last_roll = (0, 0)
 
     def roll(self):
@@ -11,8 +13,8 @@ class Dice:
         
         Time Complexity: O(1) - constant time random number generation
         """
-        die1 = random.randint(1, 6)
-        die2 = random.randint(1, 6)
+        die1 = self.rng.randint(1, 6)
+        die2 = self.rng.randint(1, 6)
         total = die1 + die2
         self.last_roll = (die1, die2, total)
         return self.last_roll
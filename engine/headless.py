@@ -0,0 +1,148 @@
+"""
+Headless, print-free game runner for simulations.
+
+Plays a complete game with CPU seats only - board creation, turn order,
+snake-order setup, then turns until someone reaches 10 VP (or a turn cap).
+Nothing is printed and nothing reads stdin; everything that happens is
+recorded as a `GameEvent` instead, so thousands of games can be simulated
+without stdout formatting in the hot path.
+
+Usage:
+    result = HeadlessGame(num_players=4).play()
+    print(result.winner_id, result.turns)
+
+Note: import this module directly (`engine.headless`), it is not re-exported
+from `engine/__init__.py` because it depends on `model.game`, which itself
+imports the engine package.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from model.game import GamePhase, GameSetup, GameState
+from .cpu_player import CPUWeights
+from .mcts import MCTSConfig
+
+DEFAULT_COLOURS = ["red", "blue", "white", "orange"]
+VICTORY_POINTS_TO_WIN = 10
+
+
+@dataclass
+class GameEvent:
+    """One structured event from a headless game."""
+
+    kind: str  # "turn_order", "settlement_placed", "road_placed", "dice", "build", "trade", "victory", ...
+    turn: int  # 0 during setup, then 1-based main-game turn number
+    player_id: Optional[int]
+    data: Dict[str, object] = field(default_factory=dict)
+
+
+@dataclass
+class GameResult:
+    """Summary of a finished headless game."""
+
+    winner_id: Optional[int]  # None if the turn cap was hit first
+    turns: int
+    victory_points: Dict[int, int]
+    events: List[GameEvent] = field(default_factory=list)
+
+    @property
+    def finished(self) -> bool:
+        return self.winner_id is not None
+
+
+class HeadlessGame:
+    """
+    Runs one CPU-only game from start to finish without any I/O.
+
+    Args:
+        num_players: 3 or 4 CPU seats
+        max_turns: Turn cap so a stalled game still terminates
+        record_events: Keep every GameEvent on the result (turn off for bulk runs)
+        seed: Seed for the game's randomness, so a game can be replayed exactly
+        seat_weights: Optional CPUWeights per seat index; seats without an entry use defaults
+        seat_search: Optional MCTSConfig per seat index; those seats play with MCTSPlayer
+    """
+
+    def __init__(
+        self,
+        num_players: int = 4,
+        max_turns: int = 1000,
+        record_events: bool = True,
+        seed: Optional[int] = None,
+        seat_weights: Optional[Dict[int, CPUWeights]] = None,
+        seat_search: Optional[Dict[int, MCTSConfig]] = None,
+    ):
+        if not (3 <= num_players <= 4):
+            raise ValueError("Catan requires 3-4 players")
+        self.num_players = num_players
+        self.max_turns = max_turns
+        self.record_events = record_events
+        self.seed = seed
+        self.seat_weights = dict(seat_weights or {})
+        self.seat_search = dict(seat_search or {})
+
+        self.setup = GameSetup(
+            verbose=False,
+            on_event=self._record if record_events else None,
+            seed=seed,
+        )
+        self.setup.cpu_weights = self.seat_weights
+        self.setup.cpu_search = self.seat_search
+        self.events: List[GameEvent] = []
+        self._turn = 0
+
+    @property
+    def game(self) -> Optional[GameState]:
+        return self.setup.game
+
+    def play(self) -> GameResult:
+        """Play the whole game and return its result."""
+        self._create_and_place()
+        return self._run_main_game()
+
+    # Internal steps
+
+    def _create_and_place(self) -> None:
+        names = [f"CPU {i + 1}" for i in range(self.num_players)]
+        colours = DEFAULT_COLOURS[:self.num_players]
+        self.setup.create_game(names, colours, [True] * self.num_players)
+        self.setup.determine_turn_order()
+
+        # Snake order: next_turn() flips direction after the first round
+        while self.game.current_phase in (
+            GamePhase.FIRST_SETTLEMENT_ROUND,
+            GamePhase.SECOND_SETTLEMENT_ROUND,
+        ):
+            player = self.game.get_current_player()
+            if not self.setup.place_cpu_initial(player):
+                raise RuntimeError(f"No legal setup placement left for {player.name}")
+
+        self.setup.distribute_initial_resources()
+
+    def _run_main_game(self) -> GameResult:
+        game = self.game
+        winner_id: Optional[int] = None
+
+        while self._turn < self.max_turns:
+            self._turn += 1
+            player = game.get_current_player()
+            if self.setup.play_turn(player):
+                winner_id = player.id
+                break
+            game.next_turn()
+
+        return GameResult(
+            winner_id=winner_id,
+            turns=self._turn,
+            victory_points={p.id: p.victory_points for p in game.players},
+            events=self.events,
+        )
+
+    def _record(self, kind: str, data: Dict[str, object]) -> None:
+        self.events.append(GameEvent(kind=kind, turn=self._turn, player_id=data.get("player_id"), data=data))
+
+
+__all__ = ["HeadlessGame", "GameResult", "GameEvent", "VICTORY_POINTS_TO_WIN"]
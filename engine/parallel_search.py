@@ -0,0 +1,228 @@
+"""
+Process-pool MCTS: root parallelism and leaf parallelism.
+
+`MCTSPlayer` searches on one core. `ParallelMCTSPlayer` spreads each
+decision over `MCTSConfig.workers` processes in one of two modes:
+
+- root parallelism (`parallel="root"`): every worker grows its own tree
+  from the same position with its own seed and a share of the iteration
+  budget (or the whole time limit), and the root visit counts are summed.
+  No communication during the search, so it scales almost linearly.
+- leaf parallelism (`parallel="leaf"`): this process keeps the one tree,
+  selects a batch of leaves (counting each pending leaf as a visit with no
+  reward yet - "virtual loss" - so the batch spreads out), and the workers
+  play the rollouts.
+
+Workers never receive a pickled `GameState`. The position goes out once per
+task as `model.codec.encode_game` bytes (~300 bytes), and leaves as tuples
+of action keys. Each worker decodes a position once and keeps it for later
+tasks on the same position. Pools are shared per worker count for the
+life of the process (`shared_pool` / `shutdown_pools`).
+
+Algorithms referenced:
+- Root-parallel MCTS with visit-count merging.
+- Leaf-parallel MCTS with virtual loss and batched rollouts.
+
+Method time complexities:
+- Root mode: `O(I / W)` iterations per worker for W workers, plus an
+  `O(A * W)` merge of root statistics.
+- Leaf mode: `O(I / B)` batches of B rollouts; selection stays in this process.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+import math
+import random
+import time
+
+from model.codec import decode_game, encode_game
+from services.building_service import BuildingService
+from .cpu_player import CPUWeights
+from .mcts import ActionKey, MCTSConfig, MCTSPlayer, SearchStats, _Simulation, action_from_key, action_key
+from .rules_adapter import GameRulesAdapter
+
+if TYPE_CHECKING:
+    from model.game import GameState
+
+ROOT_PARALLEL = "root"
+LEAF_PARALLEL = "leaf"
+
+RootVisits = Dict[ActionKey, Tuple[int, float, float]]
+
+_pools: Dict[int, ProcessPoolExecutor] = {}
+
+
+def shared_pool(workers: int) -> ProcessPoolExecutor:
+    """The process-wide pool with `workers` processes, started on first use."""
+    pool = _pools.get(workers)
+    if pool is None:
+        pool = _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+    return pool
+
+
+def shutdown_pools() -> None:
+    """Stop every shared pool (they are also stopped at interpreter exit)."""
+    for pool in _pools.values():
+        pool.shutdown()
+    _pools.clear()
+
+
+# Worker side
+
+@dataclass(frozen=True)
+class RootTask:
+    """One worker's independent search (root parallelism)."""
+
+    state: bytes
+    trade_memory: frozenset
+    weights: CPUWeights
+    config: MCTSConfig  # already split: this worker's budget and seed
+
+
+@dataclass(frozen=True)
+class LeafTask:
+    """One rollout below a selected leaf (leaf parallelism)."""
+
+    state: bytes
+    trade_memory: frozenset
+    weights: CPUWeights
+    config: MCTSConfig
+    player_id: int
+    path: Tuple[ActionKey, ...]  # actions from the root to the leaf
+    seed: int
+
+
+@lru_cache(maxsize=4)
+def _position(state: bytes) -> Tuple[GameRulesAdapter, "GameState"]:
+    """Decode a position once per worker; searches only ever clone it."""
+    game = decode_game(state)
+    return GameRulesAdapter(game, BuildingService(game)), game
+
+
+def _root_worker(task: RootTask) -> Tuple[RootVisits, SearchStats]:
+    adapter, _ = _position(task.state)
+    adapter.set_trade_memory(task.trade_memory)
+    player = MCTSPlayer(adapter, task.weights, task.config)
+    player.stats = SearchStats(decisions=1)
+    started = time.perf_counter()
+    visits = player.root_visits()
+    player.stats.elapsed = time.perf_counter() - started
+    return visits, player.stats
+
+
+def _leaf_worker(task: LeafTask) -> Tuple[float, SearchStats]:
+    _, game = _position(task.state)
+    stats = SearchStats()
+    sim = _Simulation(game, task.trade_memory, task.weights, random.Random(task.seed), task.config, stats)
+    sim.begin()
+    for key in task.path:
+        if not sim.play(action_from_key(key)):
+            break
+    return sim.rollout(task.player_id), stats
+
+
+# Search side
+
+class ParallelMCTSPlayer(MCTSPlayer):
+    """`MCTSPlayer` that splits each decision's budget over a process pool."""
+
+    def root_visits(self) -> RootVisits:
+        if self.config.workers <= 1:
+            return super().root_visits()
+        if self.config.parallel == LEAF_PARALLEL:
+            return self._leaf_parallel()
+        if self.config.parallel == ROOT_PARALLEL:
+            return self._root_parallel()
+        raise ValueError(f"Unknown parallel search mode: {self.config.parallel}")
+
+    def _root_parallel(self) -> RootVisits:
+        config = self.config
+        workers = config.workers
+        state = encode_game(self.rules.game)
+        memory = self.rules.trade_memory()
+
+        # Step 1: Split the iteration budget; a time limit applies to every worker as is
+        per_worker = math.ceil(config.iterations / workers) if config.iterations is not None else None
+        tasks = [
+            RootTask(state, memory, self.weights,
+                     replace(config, workers=1, iterations=per_worker, seed=config.seed + i))
+            for i in range(workers)
+        ]
+
+        # Step 2: Search independently, then sum visits and rewards per root action
+        merged: RootVisits = {}
+        for visits, stats in shared_pool(workers).map(_root_worker, tasks):
+            for key, (count, value, prior) in visits.items():
+                total_count, total_value, _ = merged.get(key, (0, 0.0, prior))
+                merged[key] = (total_count + count, total_value + value, prior)
+            self.stats.iterations += stats.iterations
+            self.stats.rollouts += stats.rollouts
+            self.stats.rollout_turns += stats.rollout_turns
+            self.stats.simulated_actions += stats.simulated_actions
+        return merged
+
+    def _leaf_parallel(self) -> RootVisits:
+        config = self.config
+        started = time.perf_counter()
+        deadline = started + config.time_limit if config.time_limit is not None else None
+        batch_size = config.leaf_batch or 2 * config.workers
+        pool = shared_pool(config.workers)
+
+        player_id = self.rules.current_player_id()
+        state = encode_game(self.rules.game)
+        memory = self.rules.trade_memory()
+        sim = self._new_simulation()
+        root = self._new_root(sim)
+
+        while True:
+            # Step 1: Select a batch of leaves, each pending one counted as a visit
+            size = batch_size
+            if config.iterations is not None:
+                size = min(size, config.iterations - self.stats.iterations)
+            paths = []
+            for _ in range(size):
+                path = self._descend(root, sim)
+                for node in path:
+                    node.visits += 1  # virtual loss: a visit whose reward is not in yet
+                paths.append(path)
+
+            # Step 2: Roll out in the workers, then add the rewards
+            tasks = [
+                LeafTask(state, memory, self.weights, config, player_id,
+                         tuple(action_key(node.action) for node in path[1:]), sim.rng.getrandbits(32))
+                for path in paths
+            ]
+            for path, (reward, stats) in zip(paths, pool.map(_leaf_worker, tasks)):
+                for node in path:
+                    node.value += reward
+                self.stats.rollouts += stats.rollouts
+                self.stats.rollout_turns += stats.rollout_turns
+                self.stats.simulated_actions += stats.simulated_actions
+            self.stats.iterations += len(paths)
+
+            if config.iterations is not None and self.stats.iterations >= config.iterations:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return {action_key(c.action): (c.visits, c.value, c.prior) for c in root.children}
+
+
+def search_player(rules: GameRulesAdapter, weights: Optional[CPUWeights], config: MCTSConfig) -> MCTSPlayer:
+    """The right search player for `config`: in-process, or over a pool when `workers` > 1."""
+    if config.workers > 1:
+        return ParallelMCTSPlayer(rules, weights, config)
+    return MCTSPlayer(rules, weights, config)
+
+
+__all__ = [
+    "ParallelMCTSPlayer",
+    "search_player",
+    "shared_pool",
+    "shutdown_pools",
+    "ROOT_PARALLEL",
+    "LEAF_PARALLEL",
+]
@@ -0,0 +1,126 @@
+"""
+Roll-indexed production table for the turn engine.
+
+For every dice total (2-12) the table holds the list of payouts that roll
+produces right now: `(player, resource, amount)` with settlements paying 1,
+cities 2, and the robber's tile paying nothing. Distributing resources is
+then one dict lookup plus a handful of adds, instead of scanning all 19
+tiles and their corners on every roll.
+
+The table is kept current incrementally by the `TurnEngine`:
+- a settlement/city change on vertex v only rebuilds the rolls of the (≤3)
+  tiles touching v
+- a robber move only rebuilds the rolls of the old and new robber tiles
+
+Because it always knows the exact payout per roll, it also gives the
+expected income per player (see `expected_income`), which the CPU's
+`resource_production_profile` can reuse.
+
+Algorithms referenced:
+- Inverted index (roll -> tiles, vertex -> tiles) with dirty-bucket rebuilds.
+
+Method time complexities:
+- `ProductionTable(board)`: `O(T * 6)` to index tiles and build every bucket.
+- `payouts`: `O(1)`.
+- `vertex_changed` / `robber_moved`: `O(1)` - at most 3 (resp. 2) buckets of
+  ≤2 tiles x 6 corners each are rebuilt.
+- `expected_income` / `payout_view`: `O(P)` over the ≤10 roll buckets' payouts.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .turn_engine import BoardSnapshot, PlayerID, Resource
+
+# Ways (out of 36) to roll each total with two dice
+ROLL_WAYS = {2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 7: 6, 8: 5, 9: 4, 10: 3, 11: 2, 12: 1}
+CITY_YIELD = 2
+SETTLEMENT_YIELD = 1
+
+Payout = Tuple["PlayerID", "Resource", int]
+
+
+class ProductionTable:
+    """Roll -> payouts index over a `BoardSnapshot`."""
+
+    def __init__(self, board: "BoardSnapshot"):
+        self.board = board
+        self._tiles_by_roll: Dict[int, List[int]] = {}
+        self._tiles_of_vertex: Dict[str, List[int]] = {}
+        self._payouts: Dict[int, List[Payout]] = {roll: [] for roll in ROLL_WAYS}
+
+        # Step 1: Index producing tiles by number and by corner
+        for tile in board.tiles.values():
+            if tile.resource is None or tile.number not in ROLL_WAYS:
+                continue
+            self._tiles_by_roll.setdefault(tile.number, []).append(tile.tile_id)
+            for vertex_id in tile.vertices:
+                self._tiles_of_vertex.setdefault(vertex_id, []).append(tile.tile_id)
+
+        # Step 2: Fill every bucket once
+        for roll in self._tiles_by_roll:
+            self._rebuild_roll(roll)
+
+    def payouts(self, roll: int) -> List[Payout]:
+        """Everything `roll` pays out right now (empty for 7 and unused numbers)."""
+        return self._payouts.get(roll, [])
+
+    # Incremental updates
+
+    def vertex_changed(self, vertex_id: str) -> None:
+        """Call after the building on `vertex_id` was placed, upgraded or removed."""
+        tiles = self.board.tiles
+        for roll in {tiles[tile_id].number for tile_id in self._tiles_of_vertex.get(vertex_id, ())}:
+            self._rebuild_roll(roll)
+
+    def robber_moved(self, old_tile_id: Optional[int], new_tile_id: Optional[int]) -> None:
+        """Call after the robber moved from `old_tile_id` to `new_tile_id`."""
+        rolls = set()
+        for tile_id in (old_tile_id, new_tile_id):
+            tile = self.board.tiles.get(tile_id)
+            if tile is not None and tile.number in self._tiles_by_roll:
+                rolls.add(tile.number)
+        for roll in rolls:
+            self._rebuild_roll(roll)
+
+    def _rebuild_roll(self, roll: int) -> None:
+        board = self.board
+        totals: Dict[Tuple["PlayerID", "Resource"], int] = {}
+        for tile_id in self._tiles_by_roll.get(roll, ()):
+            tile = board.tiles[tile_id]
+            if tile.has_robber or board.robber_tile_id == tile_id:
+                continue
+            for vertex_id in tile.vertices:
+                owner, structure = board.vertex_owners.get(vertex_id, (None, None))
+                if owner is None:
+                    continue
+                key = (owner, tile.resource)
+                amount = CITY_YIELD if structure == "city" else SETTLEMENT_YIELD
+                totals[key] = totals.get(key, 0) + amount
+        self._payouts[roll] = [(owner, resource, amount) for (owner, resource), amount in totals.items()]
+
+    # Read-only views for heuristics
+
+    def payout_view(self, player_id: "PlayerID") -> Dict[int, Dict["Resource", int]]:
+        """Exact cards `player_id` receives for each roll, e.g. {8: {"ore": 2}, 5: {"wood": 1}}."""
+        view: Dict[int, Dict["Resource", int]] = {}
+        for roll, payouts in self._payouts.items():
+            for owner, resource, amount in payouts:
+                if owner == player_id:
+                    view.setdefault(roll, {})[resource] = amount
+        return view
+
+    def expected_income(self, player_id: "PlayerID") -> Dict["Resource", float]:
+        """Expected cards of each resource `player_id` receives per dice roll."""
+        income: Dict["Resource", float] = {}
+        for roll, payouts in self._payouts.items():
+            chance = ROLL_WAYS[roll] / 36
+            for owner, resource, amount in payouts:
+                if owner == player_id:
+                    income[resource] = income.get(resource, 0.0) + amount * chance
+        return income
+
+
+__all__ = ["ProductionTable", "ROLL_WAYS"]
@@ -0,0 +1,355 @@
+"""
+Production `RulesAdapter` for `CPUPlayer`, backed by a live `GameState`.
+
+`CPUPlayer` only talks to the game through the `RulesAdapter` protocol in
+`cpu_player.py`. This adapter answers those questions from the structures
+the game already keeps in sync:
+
+- legality from the board core's move frontiers (`BoardGraph.core.moves`)
+- pips, resource sets and scarcity from the board's `PipCache`
+- road distances from the cached `RoadDistanceField` (`search/distance_field.py`)
+  and the top expansion plans (`Pathfinding.best_expansion_sites`)
+- actions executed through `BuildingService`, so every change goes through
+  the same validation as a human player's move
+
+Vertex IDs handed to the CPU are board-core indices (ints), edge IDs are the
+board's edge IDs. `vertex_name()` turns an index back into "A", "B3", ...
+
+Position-dependent answers (legal sets, scarcity, production profiles) are
+memoised per board version (bumped by every `set_vertex_owner` /
+`set_edge_owner`) and robber hex, so scoring dozens of actions costs one
+bitboard query per kind instead of one board scan per action. Affordability
+is checked live because resources change on every roll.
+
+Algorithms referenced:
+- Memoisation keyed on a monotonically increasing state version.
+- Incremental move generation (see `model/move_generator.py`).
+
+Method time complexities:
+- Legal-move queries: `O(1)` when memoised, `O(R)` to list the frontier otherwise.
+- `vertex_pip` / `vertex_resource_set`: `O(1)`.
+- `board_resource_scarcity` / `resource_production_profile`: `O(1)` memoised, `O(H)` / `O(B)` otherwise.
+- `road_expands_towards_value`: `O(1)` memoised, one path rebuild per
+  reachable site from the cached distance field plus `O(S log k)` to rank
+  the expansion plans otherwise.
+- `settlement_blocks_opponent_value`: `O(P)` reads of the opponents' cached distance fields.
+- `road_contributes_longest`: one batched `longest_with` call per position,
+  then `O(1)` per edge.
+- `execute`: whatever the matching `BuildingService` call costs.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple
+
+from model.bitboard import iter_bits
+from model.enums import Resource
+from model.longest_road import LONGEST_ROAD_MIN
+from rules.building_rules import CITY_COST, ROAD_COST, SETTLEMENT_COST
+from services.building_service import BANK_TRADE_RATE, TRADEABLE_RESOURCES
+from .cpu_player import ActionType, CPUAction
+
+if TYPE_CHECKING:
+    from model.game import GameState
+    from services.building_service import BuildingService
+
+# Development cards are not implemented yet; the CPU still needs their cost
+DEV_CARD_COST = {Resource.ORE: 1, Resource.GRAIN: 1, Resource.WOOL: 1}
+
+# Game phase thresholds on the leader's victory points
+MID_GAME_VP = 4
+LATE_GAME_VP = 7
+
+# Extra road pressure when a road would take the Longest Road card
+LONGEST_ROAD_CLAIM_BONUS = 1.0
+
+# A road's "towards value" is the best site's pips per road needed, divided by this
+ROAD_VALUE_PIP_SCALE = 5.0
+
+# Roads that start one of the best few expansion plans get up to this on top
+EXPANSION_PLANS = 3
+EXPANSION_PLAN_BONUS = 0.5
+
+# Opponents more roads than this away from a vertex don't count as blocked
+BLOCK_ROAD_REACH = 2
+
+
+class GameRulesAdapter:
+    """
+    `RulesAdapter` implementation over a `GameState` + `BuildingService`.
+
+    Call `start_turn()` at the beginning of each CPU turn: it resets the
+    per-turn trade memory that stops the CPU from trading a card straight back.
+    """
+
+    def __init__(self, game_state: "GameState", building_service: "BuildingService"):
+        self.game = game_state
+        self.board = game_state.board
+        self.service = building_service
+        self._memo: Dict[Tuple, object] = {}
+        self._memo_key: Optional[Tuple[int, int]] = None
+        self._received_by_trade: Set[Resource] = set()
+
+    # Memoisation
+
+    def _cached(self, key: Tuple, compute):
+        """Return a memoised value, dropping the whole memo when the position changed."""
+        state_key = (self.board.version, self.game.robber_hex_id)
+        if state_key != self._memo_key:
+            self._memo.clear()
+            self._memo_key = state_key
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def start_turn(self) -> None:
+        self._received_by_trade.clear()
+
+    def trade_memory(self) -> frozenset:
+        """Resources received from the bank this turn (never offered back)."""
+        return frozenset(self._received_by_trade)
+
+    def set_trade_memory(self, resources) -> None:
+        """Restore a `trade_memory()`, e.g. on an adapter over a cloned game."""
+        self._received_by_trade = set(resources)
+
+    def vertex_name(self, vertex_id: int) -> str:
+        return self.board.core.vertex_names[vertex_id]
+
+    # Core lookups
+
+    def current_player_id(self) -> int:
+        return self.game.get_current_player().id
+
+    def opponents(self) -> Sequence[int]:
+        current = self.current_player_id()
+        return [p.id for p in self.game.players if p.id != current]
+
+    def visible_victory_points(self, player_id: int) -> int:
+        return self.game.players[player_id].victory_points
+
+    def estimated_hidden_vp(self, player_id: int) -> float:
+        return 0.0  # no development cards yet, so nothing is hidden
+
+    def total_victory_points_estimate(self, player_id: int) -> float:
+        return self.visible_victory_points(player_id) + self.estimated_hidden_vp(player_id)
+
+    def game_phase(self) -> str:
+        leader = max(p.victory_points for p in self.game.players)
+        if leader >= LATE_GAME_VP:
+            return "late"
+        if leader >= MID_GAME_VP:
+            return "mid"
+        return "early"
+
+    # Resource / cost info
+
+    def player_resources(self, player_id: int) -> Dict[Resource, int]:
+        return self.game.players[player_id].resources
+
+    def resource_production_profile(self, player_id: int) -> Dict[Resource, float]:
+        """Expected cards per roll by resource (cities count double)."""
+        return self._cached(("profile", player_id), lambda: self._production_profile(player_id))
+
+    def _production_profile(self, player_id: int) -> Dict[Resource, float]:
+        bits = self.board.core.bits
+        income = self.board.pip_cache.income
+        profile: Dict[Resource, float] = {}
+        for mask, multiplier in ((bits.settlements.get(player_id, 0), 1), (bits.cities.get(player_id, 0), 2)):
+            for v in iter_bits(mask):
+                for resource, amount in income[v].items():
+                    profile[resource] = profile.get(resource, 0.0) + amount * multiplier
+        return profile
+
+    def board_resource_scarcity(self) -> Dict[Resource, float]:
+        """0.0 for a resource with average (or better) pips on the board, up to 1.0 for none at all."""
+        return self._cached(("scarcity",), self._scarcity)
+
+    def _scarcity(self) -> Dict[Resource, float]:
+        pips = self.board.pip_cache.resource_pips()
+        average = sum(pips.get(r, 0) for r in TRADEABLE_RESOURCES) / len(TRADEABLE_RESOURCES)
+        if average == 0:
+            return {r: 0.0 for r in TRADEABLE_RESOURCES}
+        return {r: max(0.0, (average - pips.get(r, 0)) / average) for r in TRADEABLE_RESOURCES}
+
+    def build_cost_settlement(self) -> Dict[Resource, int]:
+        return SETTLEMENT_COST
+
+    def build_cost_road(self) -> Dict[Resource, int]:
+        return ROAD_COST
+
+    def build_cost_city(self) -> Dict[Resource, int]:
+        return CITY_COST
+
+    def build_cost_dev_card(self) -> Dict[Resource, int]:
+        return DEV_CARD_COST
+
+    # What is currently legal (and affordable) for the player
+
+    def legal_settlement_vertices(self, player_id: int) -> List[int]:
+        player = self.game.players[player_id]
+        if player.settlements_remaining <= 0 or not player.has_resources(SETTLEMENT_COST):
+            return []
+        return self._cached(
+            ("settlements", player_id),
+            lambda: list(iter_bits(self.board.core.moves.legal_settlements(player_id))),
+        )
+
+    def legal_road_edges(self, player_id: int) -> List[int]:
+        player = self.game.players[player_id]
+        if player.roads_remaining <= 0 or not player.has_resources(ROAD_COST):
+            return []
+        return self._cached(
+            ("roads", player_id),
+            lambda: list(iter_bits(self.board.core.moves.legal_roads(player_id))),
+        )
+
+    def upgradeable_vertices(self, player_id: int) -> List[int]:
+        player = self.game.players[player_id]
+        if player.cities_remaining <= 0 or not player.has_resources(CITY_COST):
+            return []
+        return self._cached(
+            ("cities", player_id),
+            lambda: list(iter_bits(self.board.core.moves.upgradeable(player_id))),
+        )
+
+    def can_buy_dev_card(self, player_id: int) -> bool:
+        return False  # development cards are not implemented yet
+
+    def bank_trade_options(self, player_id: int) -> List[Tuple[Resource, Resource, int]]:
+        """
+        4:1 trades the player can afford. A resource received from the bank
+        this turn is never offered back, so trades cannot cycle.
+        """
+        resources = self.game.players[player_id].resources
+        options = []
+        for give in TRADEABLE_RESOURCES:
+            if resources.get(give, 0) < BANK_TRADE_RATE or give in self._received_by_trade:
+                continue
+            for get in TRADEABLE_RESOURCES:
+                if get != give:
+                    options.append((give, get, BANK_TRADE_RATE))
+        return options
+
+    def robber_move_options(self, player_id: int) -> List[Tuple[int, Optional[int]]]:
+        return []  # the robber is moved by the TurnEngine during the dice phase
+
+    # Board scoring
+
+    def vertex_pip(self, vertex_id: int) -> float:
+        return self.board.pip_cache.pips[vertex_id]
+
+    def vertex_resource_set(self, vertex_id: int) -> Sequence[Resource]:
+        return self.board.pip_cache.resource_sets[vertex_id]
+
+    def road_expands_towards_value(self, edge_id: int) -> float:
+        """
+        How good the best free settlement spot this road leads to is: its pips
+        divided by the roads still needed to reach it (this one included).
+        The next road of one of the player's top expansion plans also gets
+        `EXPANSION_PLAN_BONUS`, scaled by the plan's ratio against the best one.
+        """
+        player_id = self.current_player_id()
+        towards = self._cached(("towards", player_id), lambda: self._road_towards(player_id))
+        plans = self._cached(("plans", player_id), lambda: self._plan_bonuses(player_id))
+        return towards.get(edge_id, 0.0) + plans.get(edge_id, 0.0)
+
+    def _road_towards(self, player_id: int) -> Dict[int, float]:
+        """
+        Every site the player can reach, credited to the first road of its
+        path in the player's distance field (sites already reachable need no road).
+        """
+        field = self.service.pathfinding.distances
+        pips = self.board.pip_cache.pips
+        best: Dict[int, float] = {}
+        for v, roads in field.site_distances(player_id).items():
+            if roads == 0 or not pips[v]:
+                continue
+            first = field.path_to(player_id, v)[0]
+            value = pips[v] / roads
+            if value > best.get(first, 0.0):
+                best[first] = value
+        return {e: value / ROAD_VALUE_PIP_SCALE for e, value in best.items()}
+
+    def _plan_bonuses(self, player_id: int) -> Dict[int, float]:
+        """Bonus for the first road of each of the top `EXPANSION_PLANS` site plans."""
+        plans = self.service.pathfinding.best_expansion_sites(player_id, k=EXPANSION_PLANS, min_roads=1)
+        bonuses: Dict[int, float] = {}
+        for plan in plans:  # best first, so a shared first road keeps the best plan's bonus
+            bonuses.setdefault(plan.path_edges[0], EXPANSION_PLAN_BONUS * plan.ratio / plans[0].ratio)
+        return bonuses
+
+    def road_contributes_longest(self, player_id: int, edge_id: int) -> float:
+        """
+        How much the road lengthens the player's longest road, plus 1.0 if
+        that would take the Longest Road card.
+        """
+        gains = self._cached(("longest", player_id), lambda: self._longest_road_gains(player_id))
+        if edge_id not in gains:
+            gains[edge_id] = self._longest_road_gain(player_id, edge_id)
+        return gains[edge_id]
+
+    def _longest_road_gains(self, player_id: int) -> Dict[int, float]:
+        """Gains for the whole legal road frontier, from one batched longest-road call."""
+        edges = iter_bits(self.board.core.moves.legal_roads(player_id))
+        lengths = self.board.core.longest.longest_with(player_id, edges)
+        return {e: self._gain(player_id, length) for e, length in lengths.items()}
+
+    def _longest_road_gain(self, player_id: int, edge_id: int) -> float:
+        length = self.board.core.longest.longest_with(player_id, (edge_id,))[edge_id]
+        return self._gain(player_id, length)
+
+    def _gain(self, player_id: int, new_length: int) -> float:
+        longest = self.board.core.longest
+        gain = float(new_length - longest.length(player_id))
+        if gain > 0 and not self.game.players[player_id].has_longest_road and new_length >= LONGEST_ROAD_MIN:
+            if all(new_length > longest.length(opp) for opp in self.opponents() if opp != player_id):
+                gain += LONGEST_ROAD_CLAIM_BONUS
+        return gain
+
+    def settlement_blocks_opponent_value(self, vertex_id: int) -> float:
+        """
+        How much settling here gets in the opponents' way: each opponent
+        counts 1 / (roads + 1) for the roads they need to reach this vertex
+        or a neighbour (0 beyond `BLOCK_ROAD_REACH`), averaged over opponents.
+        """
+        opponents = self.opponents()
+        if not opponents:
+            return 0.0
+        area = self.board.core.topology.closed_neighbourhood[vertex_id]
+        field = self.service.pathfinding.distances
+        blocked = 0.0
+        for opp in opponents:
+            distance = field.distances(opp)
+            roads = min(distance[v] for v in area)
+            if roads <= BLOCK_ROAD_REACH:
+                blocked += 1.0 / (roads + 1)
+        return blocked / len(opponents)
+
+    def would_trade_enable_opponent_win(self, target_player_id: int, give: Resource, get: Resource, rate: int) -> bool:
+        return False  # bank trades never hand cards to an opponent
+
+    # Execution
+
+    def execute(self, action: CPUAction) -> Tuple[bool, str]:
+        """Carry out a chosen action through BuildingService."""
+        player_id = self.current_player_id()
+        args = action.args  # positional, see cpu_player.ACTION_PARAMS
+        if action.action_type == ActionType.BUILD_SETTLEMENT:
+            return self.service.build_settlement(player_id, self.vertex_name(int(args[0])))
+        if action.action_type == ActionType.BUILD_CITY:
+            return self.service.upgrade_to_city(player_id, self.vertex_name(int(args[0])))
+        if action.action_type == ActionType.BUILD_ROAD:
+            return self.service.build_road(player_id, int(args[0]))
+        if action.action_type == ActionType.BANK_TRADE:
+            give, get, rate = args
+            success, message = self.service.bank_trade(player_id, give, get, int(rate))
+            if success:
+                self._received_by_trade.add(get)
+            return success, message
+        if action.action_type == ActionType.PASS:
+            return True, "Pass"
+        return False, f"{action.action_type.name} is not supported yet"
+
+
+__all__ = ["GameRulesAdapter", "DEV_CARD_COST"]
@@ -0,0 +1,264 @@
+"""
+Parallel self-play tournaments for tuning `CPUWeights`.
+
+Each weight set under test plays `games_per_set` headless games. In every
+game one seat uses the candidate weights and the other seats use the
+baseline, and the candidate's seat rotates with the game index so no set
+gets an unfair share of first-player starts. Games are sharded over a
+`ProcessPoolExecutor` (one worker per core by default).
+
+Seeds are deterministic: game `i` of every weight set is seeded with
+`base_seed + i`, so all sets face the same boards and dice (common random
+numbers) and any single game can be replayed with
+`HeadlessGame(seed=..., seat_weights=...)`.
+
+Usage:
+    report = run_tournament({"default": CPUWeights(), "greedy": CPUWeights(base_value_city=14.0)},
+                            games_per_set=1000)
+    print(report.format())
+
+or from the command line:
+    python -m <package>.engine.tournament --games 1000 --workers 8
+
+Algorithms referenced:
+- Static sharding of independent tasks over a process pool (`executor.map`
+  with a chunk size of roughly four chunks per worker).
+
+Method time complexities:
+- `run_tournament`: `O(S * G * T / W)` wall time for S weight sets, G games
+  per set, T turns per game and W workers.
+- `TournamentReport` aggregation: `O(S * G)`.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import argparse
+import os
+import time
+
+from .cpu_player import CPUWeights
+from .headless import HeadlessGame
+
+
+@dataclass(frozen=True)
+class GameTask:
+    """Everything a worker needs to play one game (kept small so it pickles cheaply)."""
+
+    weight_set: str
+    game_index: int
+    seed: int
+    seat: int  # seat played by the candidate weights
+    weights: CPUWeights
+    baseline: CPUWeights
+    num_players: int
+    max_turns: int
+
+
+@dataclass(frozen=True)
+class GameOutcome:
+    """What a worker sends back for one game."""
+
+    weight_set: str
+    game_index: int
+    seed: int
+    seat: int
+    winner_id: Optional[int]
+    turns: int
+    seat_victory_points: int
+
+
+@dataclass
+class WeightSetStats:
+    """Aggregated results for one weight set."""
+
+    name: str
+    games: int = 0
+    wins: int = 0
+    unfinished: int = 0  # games that hit the turn cap
+    game_lengths: List[int] = field(default_factory=list)
+    vp_distribution: Counter = field(default_factory=Counter)  # final VP of the candidate seat -> games
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def mean_game_length(self) -> float:
+        return sum(self.game_lengths) / len(self.game_lengths) if self.game_lengths else 0.0
+
+    @property
+    def mean_victory_points(self) -> float:
+        total = sum(vp * count for vp, count in self.vp_distribution.items())
+        return total / self.games if self.games else 0.0
+
+    def add(self, outcome: GameOutcome) -> None:
+        self.games += 1
+        if outcome.winner_id is None:
+            self.unfinished += 1
+        elif outcome.winner_id == outcome.seat:
+            self.wins += 1
+        self.game_lengths.append(outcome.turns)
+        self.vp_distribution[outcome.seat_victory_points] += 1
+
+
+@dataclass
+class TournamentReport:
+    """Per-weight-set statistics plus overall throughput."""
+
+    stats: Dict[str, WeightSetStats]
+    total_games: int
+    elapsed_seconds: float
+    workers: int
+
+    @property
+    def games_per_second(self) -> float:
+        return self.total_games / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def format(self) -> str:
+        lines = [f"{'weights':<16}{'games':>7}{'win %':>8}{'avg turns':>11}{'avg VP':>8}{'capped':>8}"]
+        for s in self.stats.values():
+            lines.append(
+                f"{s.name:<16}{s.games:>7}{100 * s.win_rate:>8.1f}"
+                f"{s.mean_game_length:>11.1f}{s.mean_victory_points:>8.2f}{s.unfinished:>8}"
+            )
+        lines.append(
+            f"{self.total_games} games in {self.elapsed_seconds:.1f}s on {self.workers} worker(s) "
+            f"- {self.games_per_second:.1f} games/sec"
+        )
+        return "\n".join(lines)
+
+
+def play_task(task: GameTask) -> GameOutcome:
+    """
+    Worker entry point: play one seeded headless game.
+    Must stay a module-level function so the process pool can pickle it.
+    """
+    seat_weights = {seat: task.baseline for seat in range(task.num_players)}
+    seat_weights[task.seat] = task.weights
+    game = HeadlessGame(
+        num_players=task.num_players,
+        max_turns=task.max_turns,
+        record_events=False,
+        seed=task.seed,
+        seat_weights=seat_weights,
+    )
+    result = game.play()
+    return GameOutcome(
+        weight_set=task.weight_set,
+        game_index=task.game_index,
+        seed=task.seed,
+        seat=task.seat,
+        winner_id=result.winner_id,
+        turns=result.turns,
+        seat_victory_points=result.victory_points[task.seat],
+    )
+
+
+def make_tasks(
+    weight_sets: Dict[str, CPUWeights],
+    games_per_set: int,
+    num_players: int = 4,
+    max_turns: int = 1000,
+    base_seed: int = 0,
+    baseline: Optional[CPUWeights] = None,
+) -> List[GameTask]:
+    """Build the deterministic task list (same seeds for every weight set)."""
+    baseline = baseline if baseline is not None else CPUWeights()
+    tasks = []
+    for name, weights in weight_sets.items():
+        for i in range(games_per_set):
+            tasks.append(GameTask(
+                weight_set=name,
+                game_index=i,
+                seed=base_seed + i,
+                seat=i % num_players,
+                weights=weights,
+                baseline=baseline,
+                num_players=num_players,
+                max_turns=max_turns,
+            ))
+    return tasks
+
+
+def run_tournament(
+    weight_sets: Dict[str, CPUWeights],
+    games_per_set: int,
+    num_players: int = 4,
+    max_turns: int = 1000,
+    base_seed: int = 0,
+    baseline: Optional[CPUWeights] = None,
+    workers: Optional[int] = None,
+    verbose: bool = True,
+) -> TournamentReport:
+    """
+    Play every weight set against the baseline and aggregate the results.
+
+    Args:
+        weight_sets: Name -> candidate weights
+        games_per_set: Games played by each candidate
+        num_players: Seats per game (3 or 4)
+        max_turns: Turn cap per game
+        base_seed: Game i of each set uses seed base_seed + i
+        baseline: Weights for the other seats (defaults to CPUWeights())
+        workers: Process count; None uses every core, 1 plays in-process
+        verbose: Print the throughput line when the run finishes
+
+    Returns:
+        TournamentReport with per-set statistics
+
+    Time Complexity: O(S * G * T / W), see the module docstring
+    """
+    if not weight_sets:
+        raise ValueError("run_tournament needs at least one weight set")
+    tasks = make_tasks(weight_sets, games_per_set, num_players, max_turns, base_seed, baseline)
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    if workers == 1:
+        outcomes = [play_task(task) for task in tasks]
+    else:
+        # A few chunks per worker keeps the pool balanced without per-game IPC
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(play_task, tasks, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+
+    stats = {name: WeightSetStats(name) for name in weight_sets}
+    for outcome in outcomes:
+        stats[outcome.weight_set].add(outcome)
+
+    report = TournamentReport(stats=stats, total_games=len(tasks), elapsed_seconds=elapsed, workers=workers)
+    if verbose:
+        print(report.format())
+    return report
+
+
+__all__ = ["run_tournament", "TournamentReport", "WeightSetStats", "GameTask", "GameOutcome", "play_task"]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a CPU self-play tournament")
+    parser.add_argument("--games", type=int, default=100, help="games per weight set")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0, help="base seed")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    run_tournament(
+        {"default": CPUWeights()},
+        games_per_set=args.games,
+        num_players=args.players,
+        max_turns=args.max_turns,
+        base_seed=args.seed,
+        workers=args.workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
+
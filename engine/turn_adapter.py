@@ -1,21 +1,19 @@
 from __future__ import annotations
 
-from collections import Counter
-from typing import Dict, Optional, Tuple, TYPE_CHECKING
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, Optional, Tuple, TYPE_CHECKING
+import random
 
-from ..model.enums import Resource
+from model.enums import Resource
 
 if TYPE_CHECKING:  # pragma: no cover type-checking only
-    from ..model.game import GameState, Player
+    from model.game import GameState, Player
 
 from .turn_engine import (
     BoardSnapshot,
     PlayerView,
     TileView,
     TurnEngine,
-    default_choose_discard,
-    default_choose_steal_resource,
-    default_choose_victim,
 )
 
 RESOURCE_TO_STR: Dict[Resource, str] = {
@@ -29,73 +27,126 @@ RESOURCE_TO_STR: Dict[Resource, str] = {
 STR_TO_RESOURCE: Dict[str, Resource] = {v: k for k, v in RESOURCE_TO_STR.items()}
 
 
+class ResourceView(MutableMapping):
+    """
+    Live, string-keyed view onto a Player's resource dict.
+
+    The TurnEngine reads and writes `PlayerView.resources` like a Counter, so
+    missing names read as 0, deleting a name zeroes it and iteration only
+    yields names the player actually holds. Writes go straight into the
+    Player (through `set_resource`, so the position hash follows), so nothing
+    has to be copied in before a roll or diffed back after.
+    """
+
+    __slots__ = ("_player",)
+
+    def __init__(self, player: "Player"):
+        self._player = player
+
+    def __getitem__(self, name: str) -> int:
+        return self._player.resources.get(STR_TO_RESOURCE[name], 0)
+
+    def __setitem__(self, name: str, amount: int) -> None:
+        self._player.set_resource(STR_TO_RESOURCE[name], amount)
+
+    def __delitem__(self, name: str) -> None:
+        self._player.set_resource(STR_TO_RESOURCE[name], 0)
+
+    def __iter__(self) -> Iterator[str]:
+        for res_enum, amount in self._player.resources.items():
+            if amount > 0 and res_enum in RESOURCE_TO_STR:
+                yield RESOURCE_TO_STR[res_enum]
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"ResourceView({dict(self.items())})"
+
+
 class TurnEngineAdapter:
     """
     Bridges the core GameState (BoardGraph, Player objects) with the modular TurnEngine.
-    Rebuilds snapshots on demand so the engine stays decoupled from internal structures.
+
+    The player views, board snapshot and TurnEngine are built once, on the first
+    roll, and then kept in sync instead of being rebuilt per roll:
+    - resources: each PlayerView wraps its Player in a live `ResourceView`
+    - buildings: the adapter listens to `BoardGraph.set_vertex_owner`
+    - robber: the snapshot is compared with `GameState.robber_hex_id` before each
+      roll, and the engine's move is written back afterwards
+    Both kinds of change go through the engine, which keeps its roll-indexed
+    `ProductionTable` current as well.
+
+    Time Complexity:
+    - First roll: O(H + V) to build the snapshot
+    - Every later roll: no snapshot work, only the TurnEngine's own dice phase
+    - Building change: O(1) snapshot update
     """
 
-    def __init__(self, game_state: "GameState"):
+    def __init__(self, game_state: "GameState", rng: Optional[random.Random] = None):
         self.game_state = game_state
+        self.rng = rng if rng is not None else random.Random()
+        self._engine: Optional[TurnEngine] = None
+        self._player_ids: Dict[int, str] = {}  # Player.id -> engine PlayerID
+
+    @property
+    def engine(self) -> TurnEngine:
+        """The long-lived TurnEngine, built on first use."""
+        if self._engine is None:
+            self._engine = self._build_engine()
+        return self._engine
 
     def run_dice_phase(self, current_player_id: int, roll: Optional[int] = None) -> Dict[str, object]:
-        players, baselines = self._build_player_views()
-        board = self._build_board_snapshot()
-        engine = TurnEngine(
-            players=players,
-            board=board,
-            choose_robber_target=self._choose_robber_target,
-            choose_robber_victim=default_choose_victim,
-            choose_discard=default_choose_discard,
-            choose_steal=default_choose_steal_resource,
-        )
-        events = engine.dice_phase(str(current_player_id), roll=roll)
-        self._sync_player_resources(players, baselines)
-        self.game_state.robber_hex_id = board.robber_tile_id or self.game_state.robber_hex_id
+        engine = self.engine
+        snapshot = engine.board
+        # Step 1: Pick up robber moves made outside the engine
+        if snapshot.robber_tile_id != self.game_state.robber_hex_id:
+            self.game_state.move_robber(self.game_state.robber_hex_id)
+            engine.move_robber(self.game_state.robber_hex_id)
+
+        # Step 2: Roll; resource changes land directly on the Player objects
+        events = engine.dice_phase(self._player_ids[current_player_id], roll=roll)
+
+        # Step 3: Write the engine's robber move back to the game state
+        if snapshot.robber_tile_id is not None:
+            self.game_state.move_robber(snapshot.robber_tile_id)
         return events
 
-    def _build_player_views(self) -> Tuple[Dict[str, PlayerView], Dict[str, Counter]]:
-        players: Dict[str, PlayerView] = {}
-        baselines: Dict[str, Counter] = {}
+    # Building the long-lived state
 
+    def _build_engine(self) -> TurnEngine:
+        players: Dict[str, PlayerView] = {}
         for player in self.game_state.players:
-            resources = Counter()
-            for res_enum, amount in player.resources.items():
-                if res_enum == Resource.DESERT:
-                    continue
-                resources[RESOURCE_TO_STR[res_enum]] = amount
+            pid = str(player.id)
+            self._player_ids[player.id] = pid
+            players[pid] = PlayerView(player_id=pid, name=player.name, resources=ResourceView(player))
 
-            view = PlayerView(player_id=str(player.id), name=player.name, resources=resources)
-            players[view.player_id] = view
-            baselines[view.player_id] = resources.copy()
-
-        return players, baselines
+        snapshot = self._build_board_snapshot()
+        self.game_state.board.add_vertex_listener(self._on_vertex_changed)
+        return TurnEngine(
+            players=players,
+            board=snapshot,
+            choose_robber_target=self._choose_robber_target,
+            rng=self.rng,
+        )
 
     def _build_board_snapshot(self) -> BoardSnapshot:
         tiles: Dict[int, TileView] = {}
         vertex_owners: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
 
-        hex_to_vertices: Dict[int, list[str]] = {hid: [] for hid in self.game_state.board.hexes}
-        for vertex_id, vertex in self.game_state.board.vertices.items():
-            for hid in vertex.hex_ids:
-                hex_to_vertices[hid].append(vertex_id)
-
-        for hex_id, hex_tile in self.game_state.board.hexes.items():
+        board = self.game_state.board
+        for hex_id, hex_tile in board.hexes.items():
             resource = RESOURCE_TO_STR.get(hex_tile.resource, None) if hex_tile.resource else None
             tiles[hex_id] = TileView(
                 tile_id=hex_id,
                 number=hex_tile.number or 0,
                 resource=resource,
-                vertices=tuple(hex_to_vertices[hex_id]),
+                vertices=board.vertices_of_hex(hex_id),
                 has_robber=(self.game_state.robber_hex_id == hex_id),
             )
 
-        for vertex_id, vertex in self.game_state.board.vertices.items():
-            if vertex.owner is None:
-                vertex_owners[vertex_id] = (None, None)
-                continue
-            structure = "city" if vertex.is_city else "settlement"
-            vertex_owners[vertex_id] = (str(vertex.owner), structure)
+        for vertex_id, vertex in board.vertices.items():
+            vertex_owners[vertex_id] = self._snapshot_owner(vertex.owner, vertex.is_city)
 
         return BoardSnapshot(
             tiles=tiles,
@@ -103,25 +154,32 @@ class TurnEngineAdapter:
             robber_tile_id=self.game_state.robber_hex_id,
         )
 
-    def _sync_player_resources(self, players: Dict[str, PlayerView], baselines: Dict[str, Counter]) -> None:
-        for pid, view in players.items():
-            baseline = baselines[pid]
-            player = self._get_player_by_id(int(pid))
-            for res_name, new_amount in view.resources.items():
-                old_amount = baseline.get(res_name, 0)
-                delta = new_amount - old_amount
-                if delta == 0:
-                    continue
-                res_enum = STR_TO_RESOURCE[res_name]
-                player.resources[res_enum] += delta
-
-            # Handle resources that were removed entirely (e.g., discard)
-            for res_name in list(baseline.keys()):
-                if res_name not in view.resources:
-                    res_enum = STR_TO_RESOURCE[res_name]
-                    player.resources[res_enum] = max(
-                        0, player.resources[res_enum] - baseline[res_name]
-                    )
+    # Incremental updates
+
+    def _on_vertex_changed(self, vertex_id: str, owner: Optional[int], is_city: bool) -> None:
+        if self._engine is not None:
+            self._engine.set_vertex_owner(vertex_id, *self._snapshot_owner(owner, is_city))
+
+    @staticmethod
+    def _snapshot_owner(owner: Optional[int], is_city: bool) -> Tuple[Optional[str], Optional[str]]:
+        if owner is None:
+            return (None, None)
+        return (str(owner), "city" if is_city else "settlement")
+
+    # Production queries (for CPU heuristics)
+
+    def resource_production_profile(self, player_id: int) -> Dict[Resource, float]:
+        """Expected cards of each resource per roll, read from the production table."""
+        income = self.engine.production.expected_income(str(player_id))
+        return {STR_TO_RESOURCE[name]: amount for name, amount in income.items()}
+
+    def payout_view(self, player_id: int) -> Dict[int, Dict[Resource, int]]:
+        """Exact cards the player receives for each roll."""
+        view = self.engine.production.payout_view(str(player_id))
+        return {
+            roll: {STR_TO_RESOURCE[name]: amount for name, amount in payouts.items()}
+            for roll, payouts in view.items()
+        }
 
     def _choose_robber_target(self, board: BoardSnapshot, current_player_id: str) -> int:
         """
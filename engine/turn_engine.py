@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import random
 
+from .production import ProductionTable
+
 # Basic type aliases
 Resource = str  # "wood", "brick", etc.
 StructureKind = str  # "settlement" or "city"
@@ -41,9 +44,10 @@ class PlayerView:
             return True
         return False
 
-    def remove_random_cards(self, n: int) -> Counter:
+    def remove_random_cards(self, n: int, rng: Optional[random.Random] = None) -> Counter:
         """
         Remove n random cards from player's resources.
+        `rng` is the game's generator (falls back to the global `random` module).
         
         Time Complexity: O(n * C) where C = total cards
         - Creates weighted pool each iteration: O(C)
@@ -51,12 +55,13 @@ class PlayerView:
         - Worst case: O(n * C) if pool rebuilt each time
         - Space: O(C) for pool creation
         """
+        rng = rng if rng is not None else random
         removed = Counter()
         for _ in range(n):
             if not self.resources:
                 break
             pool = [r for r, cnt in self.resources.items() for _ in range(cnt)]
-            res = random.choice(pool)
+            res = rng.choice(pool)
             self.remove(res, 1)
             removed[res] += 1
         return removed
@@ -92,11 +97,13 @@ ChooseDiscard = Callable[[PlayerView, int], Counter]
 ChooseStealResource = Callable[[PlayerView], Optional[Resource]]
 
 
-def default_choose_discard(player: PlayerView, n: int) -> Counter:
-    return player.remove_random_cards(n)
+def default_choose_discard(player: PlayerView, n: int, rng: Optional[random.Random] = None) -> Counter:
+    return player.remove_random_cards(n, rng)
 
 
-def default_choose_victim(candidates: Iterable[PlayerView]) -> Optional[PlayerView]:
+def default_choose_victim(
+    candidates: Iterable[PlayerView], rng: Optional[random.Random] = None
+) -> Optional[PlayerView]:
     """
     Random victim selection for robber.
     
@@ -105,10 +112,12 @@ def default_choose_victim(candidates: Iterable[PlayerView]) -> Optional[PlayerVi
     - Random choice: O(1)
     """
     cands = [p for p in candidates if p.total_cards() > 0]
-    return random.choice(cands) if cands else None
+    return (rng or random).choice(cands) if cands else None
 
 
-def default_choose_steal_resource(victim: PlayerView) -> Optional[Resource]:
+def default_choose_steal_resource(
+    victim: PlayerView, rng: Optional[random.Random] = None
+) -> Optional[Resource]:
     """
     Random resource selection from victim.
     
@@ -120,59 +129,89 @@ def default_choose_steal_resource(victim: PlayerView) -> Optional[Resource]:
     if victim.total_cards() == 0:
         return None
     pool = [r for r, cnt in victim.resources.items() for _ in range(cnt)]
-    return random.choice(pool) if pool else None
+    return (rng or random).choice(pool) if pool else None
 
 
 class TurnEngine:
-    """Handles the dice + robber portion of a player's turn."""
+    """
+    Handles the dice + robber portion of a player's turn.
+
+    All randomness (dice, discards, victim and stolen card) comes from `rng`,
+    so a game seeded with its own `random.Random` replays exactly. Callbacks
+    left as None use the random defaults bound to that generator.
+
+    Resource distribution reads a roll-indexed `ProductionTable`. Change
+    buildings and the robber through `set_vertex_owner` / `move_robber` so the
+    snapshot and the table stay in step.
+    """
 
     def __init__(
         self,
         players: Dict[PlayerID, PlayerView],
         board: BoardSnapshot,
         choose_robber_target: ChooseRobberTarget,
-        choose_robber_victim: ChooseRobberVictim = default_choose_victim,
-        choose_discard: ChooseDiscard = default_choose_discard,
-        choose_steal: ChooseStealResource = default_choose_steal_resource,
+        choose_robber_victim: Optional[ChooseRobberVictim] = None,
+        choose_discard: Optional[ChooseDiscard] = None,
+        choose_steal: Optional[ChooseStealResource] = None,
+        rng: Optional[random.Random] = None,
     ):
         self.players = players
         self.board = board
+        self.rng = rng if rng is not None else random.Random()
         self.choose_robber_target = choose_robber_target
-        self.choose_robber_victim = choose_robber_victim
-        self.choose_discard = choose_discard
-        self.choose_steal = choose_steal
+        self.choose_robber_victim = choose_robber_victim or partial(default_choose_victim, rng=self.rng)
+        self.choose_discard = choose_discard or partial(default_choose_discard, rng=self.rng)
+        self.choose_steal = choose_steal or partial(default_choose_steal_resource, rng=self.rng)
+        self.production = ProductionTable(board)
+
+    def set_vertex_owner(
+        self, vertex_id: str, owner: Optional[PlayerID], structure: Optional[StructureKind]
+    ) -> None:
+        """Record a building change on the snapshot and the production table."""
+        self.board.vertex_owners[vertex_id] = (owner, structure)
+        self.production.vertex_changed(vertex_id)
+
+    def move_robber(self, target_tile_id: int) -> None:
+        """Move the robber on the snapshot and the production table."""
+        old_tile_id = self.board.robber_tile_id
+        if old_tile_id is not None and old_tile_id in self.board.tiles:
+            old_tile = self.board.tiles[old_tile_id]
+            self.board.tiles[old_tile_id] = TileView(
+                old_tile.tile_id,
+                old_tile.number,
+                old_tile.resource,
+                old_tile.vertices,
+                has_robber=False,
+            )
+
+        new_tile = self.board.tiles[target_tile_id]
+        self.board.tiles[target_tile_id] = TileView(
+            new_tile.tile_id,
+            new_tile.number,
+            new_tile.resource,
+            new_tile.vertices,
+            has_robber=True,
+        )
+        self.board.robber_tile_id = target_tile_id
+        self.production.robber_moved(old_tile_id, target_tile_id)
 
-    @staticmethod
-    def roll_dice() -> int:
-        return random.randint(1, 6) + random.randint(1, 6)
+    def roll_dice(self) -> int:
+        return self.rng.randint(1, 6) + self.rng.randint(1, 6)
 
     def distribute_resources(self, roll: int) -> Dict[PlayerID, Counter]:
         """
         Distribute resources to players based on dice roll.
         
-        Time Complexity: O(T * V) where T = tiles, V = vertices per tile
-        - Iterates through all tiles: O(T)
-        - For each tile, checks vertices: O(V) where V ≈ 6 per tile
+        Time Complexity: O(A) where A = payouts for this roll (usually < 6)
+        - Production table lookup: O(1)
         - Counter operations: O(1) average
-        - Space: O(P * R) where P = players, R = resource types
+        - Space: O(A)
         """
         gained: Dict[PlayerID, Counter] = defaultdict(Counter)
 
-        for tile in self.board.tiles.values():
-            robber_on_tile = tile.has_robber or self.board.robber_tile_id == tile.tile_id
-            if tile.number != roll or robber_on_tile or tile.resource is None:
-                continue
-
-            for vertex_id in tile.vertices:
-                owner, structure = self.board.vertex_owners.get(vertex_id, (None, None))
-                if owner is None:
-                    continue
-                amount = 2 if structure == "city" else 1
-                gained[owner][tile.resource] += amount
-
-        for pid, resources in gained.items():
-            for res, amount in resources.items():
-                self.players[pid].add(res, amount)
+        for pid, res, amount in self.production.payouts(roll):
+            gained[pid][res] += amount
+            self.players[pid].add(res, amount)
 
         return gained
 
@@ -189,38 +228,23 @@ class TurnEngine:
                 events["discards"][player.player_id] = dict(removed)
 
         target_tile_id = self.choose_robber_target(self.board, current_player_id)
-        if self.board.robber_tile_id is not None and self.board.robber_tile_id in self.board.tiles:
-            old_tile = self.board.tiles[self.board.robber_tile_id]
-            self.board.tiles[self.board.robber_tile_id] = TileView(
-                old_tile.tile_id,
-                old_tile.number,
-                old_tile.resource,
-                old_tile.vertices,
-                has_robber=False,
-            )
-
+        self.move_robber(target_tile_id)
         new_tile = self.board.tiles[target_tile_id]
-        self.board.tiles[target_tile_id] = TileView(
-            new_tile.tile_id,
-            new_tile.number,
-            new_tile.resource,
-            new_tile.vertices,
-            has_robber=True,
-        )
-        self.board.robber_tile_id = target_tile_id
         events["robber"] = {"moved_to": target_tile_id}
 
-        adjacent: set[PlayerID] = set()
+        # dict rather than set: string IDs hash differently per process, and the
+        # victim order must not depend on PYTHONHASHSEED for seeded games to replay
+        adjacent: Dict[PlayerID, None] = {}
         for vertex_id in new_tile.vertices:
             owner, _ = self.board.vertex_owners.get(vertex_id, (None, None))
             if owner and owner != current_player_id:
-                adjacent.add(owner)
+                adjacent[owner] = None
 
         candidates = [self.players[pid] for pid in adjacent if self.players[pid].total_cards() > 0]
         victim = self.choose_robber_victim(candidates)
 
         if victim:
-            res = self.choose_steal(victim) or random.choice(
+            res = self.choose_steal(victim) or self.rng.choice(
                 [r for r, cnt in victim.resources.items() for _ in range(cnt)]
             )
             victim.remove(res, 1)
@@ -0,0 +1,154 @@
+"""
+Bitboard view of board ownership.
+
+Every vertex is one bit of a 54-bit Python int and every edge one bit of a
+72-bit int. With the neighbour masks precomputed in `BoardTopology`, the
+distance rule, road connectivity and "where can player P settle" turn into a
+few AND/OR operations instead of walking `Vertex` objects.
+
+The board core owns one `Bitboards` instance and keeps it in sync from
+`BoardCore.set_vertex_owner` / `set_edge_owner`, which is what
+`BuildingService.build_*` and the setup phase go through.
+
+Algorithms referenced:
+- Bitsets over ints: AND/OR/NOT on word-sized chunks.
+- Set-bit iteration with the `mask & -mask` lowest-bit trick.
+
+Method time complexities:
+- `place_building` / `place_road`: `O(1)` mask updates.
+- `clear_building` / `clear_road`: `O(B)` / `O(R)` to rebuild the derived masks
+  (only used by rollbacks and undo).
+- `distance_ok`, `is_on_network`: `O(1)`.
+- `network`, `legal_settlements`, `legal_initial_settlements`: `O(1)` big-int ops.
+- `legal_roads`: `O(N)` where `N` is the number of network vertices (≤ ~20).
+- `copy`: `O(P)`.
+"""
+
+from typing import Dict, Iterator
+
+from .topology import BoardTopology
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield the index of every set bit, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class Bitboards:
+    """Ownership of one board as integer bitsets."""
+
+    def __init__(self, topology: BoardTopology):
+        self.topology = topology
+        self.occupied = 0  # any settlement or city
+        self.blocked = 0  # vertices where the distance rule forbids a settlement
+        self.all_roads = 0
+        self.settlements: Dict[int, int] = {}  # player -> vertex bits (settlements only)
+        self.cities: Dict[int, int] = {}  # player -> vertex bits
+        self.roads: Dict[int, int] = {}  # player -> edge bits
+        self.road_vertices: Dict[int, int] = {}  # player -> vertex bits touched by their roads
+
+    def copy(self) -> "Bitboards":
+        """Independent copy sharing the topology (ints are immutable, so only the dicts are copied)."""
+        clone = Bitboards.__new__(Bitboards)
+        clone.topology = self.topology
+        clone.occupied = self.occupied
+        clone.blocked = self.blocked
+        clone.all_roads = self.all_roads
+        clone.settlements = dict(self.settlements)
+        clone.cities = dict(self.cities)
+        clone.roads = dict(self.roads)
+        clone.road_vertices = dict(self.road_vertices)
+        return clone
+
+    # Updates (called by BoardCore)
+
+    def place_building(self, v: int, player_id: int, is_city: bool) -> None:
+        bit = 1 << v
+        if is_city:
+            self.settlements[player_id] = self.settlements.get(player_id, 0) & ~bit
+            self.cities[player_id] = self.cities.get(player_id, 0) | bit
+        else:
+            self.cities[player_id] = self.cities.get(player_id, 0) & ~bit
+            self.settlements[player_id] = self.settlements.get(player_id, 0) | bit
+        self.occupied |= bit
+        self.blocked |= self.topology.closed_neighbourhood_mask[v]
+
+    def clear_building(self, v: int) -> None:
+        clear = ~(1 << v)
+        for masks in (self.settlements, self.cities):
+            for pid in masks:
+                masks[pid] &= clear
+        self.occupied &= clear
+        # Neighbourhoods can overlap, so rebuild the blocked mask from scratch
+        blocked = 0
+        closed = self.topology.closed_neighbourhood_mask
+        for u in iter_bits(self.occupied):
+            blocked |= closed[u]
+        self.blocked = blocked
+
+    def place_road(self, e: int, player_id: int) -> None:
+        bit = 1 << e
+        self.roads[player_id] = self.roads.get(player_id, 0) | bit
+        self.all_roads |= bit
+        self.road_vertices[player_id] = (
+            self.road_vertices.get(player_id, 0) | self.topology.edge_vertex_mask[e]
+        )
+
+    def clear_road(self, e: int) -> None:
+        clear = ~(1 << e)
+        self.all_roads &= clear
+        edge_vertex = self.topology.edge_vertex_mask
+        for pid, roads in self.roads.items():
+            if roads & ~clear:
+                roads &= clear
+                self.roads[pid] = roads
+                touched = 0
+                for edge in iter_bits(roads):
+                    touched |= edge_vertex[edge]
+                self.road_vertices[pid] = touched
+
+    # Queries
+
+    def buildings(self, player_id: int) -> int:
+        return self.settlements.get(player_id, 0) | self.cities.get(player_id, 0)
+
+    def distance_ok(self, v: int) -> bool:
+        """True if v is empty and no neighbour holds a settlement/city."""
+        return not (self.blocked >> v) & 1
+
+    def network(self, player_id: int) -> int:
+        """
+        Vertices the player can build roads from: their own buildings plus
+        the ends of their roads, minus vertices an opponent has built on.
+        """
+        own = self.buildings(player_id)
+        opponents = self.occupied & ~own
+        return own | (self.road_vertices.get(player_id, 0) & ~opponents)
+
+    def is_on_network(self, player_id: int, v: int) -> bool:
+        return bool((self.network(player_id) >> v) & 1)
+
+    def touches_own_road(self, player_id: int, v: int) -> bool:
+        return bool((self.road_vertices.get(player_id, 0) >> v) & 1)
+
+    def legal_initial_settlements(self) -> int:
+        """Setup phase: any vertex that passes the distance rule."""
+        return self.topology.all_vertices_mask & ~self.blocked
+
+    def legal_settlements(self, player_id: int) -> int:
+        """Main game: distance rule plus an adjacent road of the player's."""
+        return self.road_vertices.get(player_id, 0) & ~self.blocked
+
+    def legal_roads(self, player_id: int) -> int:
+        """Empty edges that touch the player's network."""
+        edges = 0
+        vertex_edge = self.topology.vertex_edge_mask
+        for v in iter_bits(self.network(player_id)):
+            edges |= vertex_edge[v]
+        return edges & ~self.all_roads
+
+    def upgradeable(self, player_id: int) -> int:
+        return self.settlements.get(player_id, 0)
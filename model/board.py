@@ -2,10 +2,14 @@
 This is the Settlers of Catan board implementation. Essential for everyone in the group to know what is happening here.
 """
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from collections import defaultdict
+import random
 
 from .enums import Resource, PortKind
+from .board_core import BoardCore
+from .pip_cache import PipCache
+from .topology import BoardTopology, topology_from_layout
 
 
 #This is a python dict that maps the node name with the adjacent node names. In other words, it represents the vertex adjacency list for the board.
@@ -91,6 +95,10 @@ HEX_LAYOUT={
 
 }
 
+#The board shape never changes, so the edge list, vertex/hex lookups and distance-rule
+#neighbourhoods are derived once here and shared by every board (see topology.py).
+STANDARD_TOPOLOGY: BoardTopology = topology_from_layout(catan_graph, HEX_LAYOUT)
+
 #This lists the types of terrains possible in the game. Each type of terrain produce their corresponfing resource
 RESOURCE_POOL = [
     "forest",
@@ -167,7 +175,22 @@ class BoardGraph:
     hexes: Dict[int, HexTile] = field(default_factory=dict)        # hex_id -> HexTile
     num_to_hexes: Dict[int, Set[int]] = field(default_factory=lambda: defaultdict(set))
     vertex_to_hexes: Dict[str, List[int]] = field(default_factory=dict)
-
+    # Shared static lookup tables; None for hand-built boards (derived on first use)
+    topology: Optional[BoardTopology] = field(default=None, repr=False, compare=False)
+    # Integer-indexed mirror of the board, built lazily on first use (see board_core.py)
+    _core: Optional[BoardCore] = field(default=None, init=False, repr=False, compare=False)
+    # Bumped by every ownership change, so derived caches know when to refresh
+    version: int = field(default=0, init=False, repr=False, compare=False)
+    # Per-vertex pips/resources/income, built lazily (see pip_cache.py)
+    _pip_cache: Optional[PipCache] = field(default=None, init=False, repr=False, compare=False)
+    # Callbacks run as (vertex_id, owner, is_city) after every building change
+    _vertex_listeners: List[Callable[[str, Optional[int], bool], None]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # Callbacks run as (edge_id, owner) after every road change
+    _edge_listeners: List[Callable[[int, Optional[int]], None]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         # Build num_to_hexes from hexes
@@ -186,11 +209,53 @@ class BoardGraph:
             if e.v2 in self.vertices and eid not in self.vertices[e.v2].edge_ids:
                 self.vertices[e.v2].edge_ids.append(eid)
 
+    @property
+    def core(self) -> BoardCore:
+        """Compact integer view of this board, built the first time it's needed."""
+        if self._core is None:
+            self._core = BoardCore.from_board(self)
+        return self._core
+
+    @property
+    def pip_cache(self) -> PipCache:
+        """Per-vertex production figures; GameState.move_robber keeps its robber in sync."""
+        if self._pip_cache is None:
+            self._pip_cache = PipCache(self)
+        return self._pip_cache
+
+    def clone(self) -> "BoardGraph":
+        """
+        Independent copy for search rollouts.
+
+        Hex tiles, the number/hex lookups and the topology never change, so
+        the clone shares them; it gets its own Vertex/Edge objects (which
+        share their static edge/hex lists) and copies of the core and pip
+        cache. Listeners are not copied - they belong to the original.
+        """
+        clone = BoardGraph.__new__(BoardGraph)
+        clone.vertices = {
+            vid: Vertex(vid, v.edge_ids, v.hex_ids, v.owner, v.is_city)
+            for vid, v in self.vertices.items()
+        }
+        clone.edges = {eid: Edge(eid, e.v1, e.v2, e.owner) for eid, e in self.edges.items()}
+        clone.hexes = self.hexes
+        clone.num_to_hexes = self.num_to_hexes
+        clone.vertex_to_hexes = self.vertex_to_hexes
+        clone.topology = self.topology
+        clone._core = self._core.copy() if self._core is not None else None
+        clone.version = self.version
+        clone._pip_cache = self._pip_cache.copy(clone) if self._pip_cache is not None else None
+        clone._vertex_listeners = []
+        clone._edge_listeners = []
+        return clone
+
     # SOME HELPER METHODS
+    # These go through the core so they hand back cached tuples instead of new lists.
 
-    def edges_of(self, v: str) -> List[int]:
-        """Returns list of edge IDs connected to vertex v."""
-        return list(self.vertices[v].edge_ids)
+    def edges_of(self, v: str) -> Tuple[int, ...]:
+        """Returns the edge IDs connected to vertex v."""
+        core = self.core
+        return core.edges_at(core.vertex_index[v])
 
     def other_end(self, e: int, v: str) -> str:
         """Given edge e and one vertex v, return the other vertex."""
@@ -201,9 +266,43 @@ class BoardGraph:
             return edge.v1
         raise ValueError(f"Vertex {v} is not an endpoint of edge {e}")
 
-    def neighbors(self, v: str) -> List[str]:
-        """Returns list of neighbor vertex IDs (vertices connected by edges)."""
-        return [self.other_end(eid, v) for eid in self.edges_of(v)]
+    def neighbors(self, v: str) -> Tuple[str, ...]:
+        """Returns the neighbor vertex IDs (vertices connected by edges)."""
+        core = self.core
+        return core.neighbour_names(core.vertex_index[v])
+
+    def vertices_of_hex(self, hex_id: int) -> Tuple[str, ...]:
+        """Returns the six corner vertex IDs of a hex."""
+        return self.core.topology.hex_vertex_names[hex_id]
+
+    # OWNERSHIP UPDATES
+    # Always change ownership through these so the dataclasses and the core stay in sync.
+
+    def set_vertex_owner(self, v: str, owner: Optional[int], is_city: bool = False) -> None:
+        """Place, upgrade or clear the building on vertex v."""
+        vertex = self.vertices[v]
+        vertex.owner = owner
+        vertex.is_city = is_city if owner is not None else False
+        self.core.set_vertex_owner(self.core.vertex_index[v], owner, vertex.is_city)
+        self.version += 1
+        for listener in self._vertex_listeners:
+            listener(v, owner, vertex.is_city)
+
+    def add_vertex_listener(self, listener: Callable[[str, Optional[int], bool], None]) -> None:
+        """Get told about every settlement/city change (used to keep derived views in sync)."""
+        self._vertex_listeners.append(listener)
+
+    def set_edge_owner(self, e: int, owner: Optional[int]) -> None:
+        """Place or clear the road on edge e."""
+        self.edges[e].owner = owner
+        self.core.set_edge_owner(e, owner)
+        self.version += 1
+        for listener in self._edge_listeners:
+            listener(e, owner)
+
+    def add_edge_listener(self, listener: Callable[[int, Optional[int]], None]) -> None:
+        """Get told about every road change."""
+        self._edge_listeners.append(listener)
     
 
 def build_catan_board(resource_assignment: List[Resource], 
@@ -211,45 +310,48 @@ def build_catan_board(resource_assignment: List[Resource],
     """
     Builds the complete Catan board from the graph structure.
     """
-    board = BoardGraph()
+    topology = STANDARD_TOPOLOGY
+    board = BoardGraph(topology=topology)
     
-    # Create all vertices
-    for vertex_id in catan_graph.keys():
-        board.vertices[vertex_id] = Vertex(id=vertex_id)
+    # Create all vertices, already linked to their edges and hexes
+    for v, vertex_id in enumerate(topology.vertex_names):
+        board.vertices[vertex_id] = Vertex(
+            id=vertex_id,
+            edge_ids=list(topology.vertex_edges[v]),
+            hex_ids=list(topology.vertex_hexes[v]),
+        )
+        board.vertex_to_hexes[vertex_id] = list(topology.vertex_hexes[v])
     
-    # Create edges from adjacency list
-    edge_id = 0
-    seen_edges = set()
-    for v1, neighbors in catan_graph.items():
-        for v2 in neighbors:
-            edge_key = tuple(sorted([v1, v2]))
-            if edge_key not in seen_edges:
-                board.edges[edge_id] = Edge(id=edge_id, v1=v1, v2=v2)
-                edge_id += 1
-                seen_edges.add(edge_key)
+    # Create edges from the precomputed edge list
+    for edge_id, (v1, v2) in enumerate(topology.edge_vertices):
+        board.edges[edge_id] = Edge(id=edge_id, v1=v1, v2=v2)
     
-    # Create hexes and link to vertices
-    for hex_id, vertices in HEX_LAYOUT.items():
+    # Create hexes
+    for hex_id in HEX_LAYOUT:
         board.hexes[hex_id] = HexTile(
             id=hex_id,
             resource=resource_assignment[hex_id],
             number=chit_assignment[hex_id]
         )
-        # Link vertices to this hex
-        for v_id in vertices:
-            board.vertices[v_id].hex_ids.append(hex_id)
+        if chit_assignment[hex_id] is not None:
+            board.num_to_hexes[chit_assignment[hex_id]].add(hex_id)
     
     return board
 
-def create_standard_board() -> BoardGraph:
-    """Creates a standard Catan board with shuffled resources and chits."""
-    import random
-    
+def create_standard_board(rng: Optional[random.Random] = None) -> BoardGraph:
+    """
+    Creates a standard Catan board with shuffled resources and chits.
+
+    Args:
+        rng: The game's random generator; the global `random` module is used when omitted
+    """
+    rng = rng if rng is not None else random
+
     resources = RESOURCE_POOL.copy()
-    random.shuffle(resources)
+    rng.shuffle(resources)
     
     chits = CHITS.copy()
-    random.shuffle(chits)
+    rng.shuffle(chits)
     
     # Find desert and assign None chit
     resource_assignment = [Resource.from_string(r) for r in resources]
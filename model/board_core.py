@@ -0,0 +1,185 @@
+"""
+Compact integer-indexed core that sits underneath `BoardGraph`.
+
+`BoardGraph` keys vertices by strings ("A", "B3", ...) and keeps mutable
+`Vertex`/`Edge` dataclasses in dicts, which is nice to read but slow in the
+hot paths (string hashing plus a fresh list for every `neighbors()` call).
+The core maps the 54 vertices and 72 edges to dense integer indices. The
+static tables (adjacency, edge endpoints, hex corners) come from a shared
+`BoardTopology`; the core itself only owns the preallocated ownership arrays.
+
+Algorithms referenced:
+- Fixed-width adjacency tables (every Catan vertex has degree 2-3), padded
+  with `NO_INDEX` so lookups are simple offset arithmetic.
+
+Method time complexities:
+- `BoardCore(topology)`: `O(V + E)` to allocate the ownership arrays.
+- `from_board`: `O(V + E)` plus topology derivation for non-standard boards.
+- `copy`: `O(V + E)` array copies plus `O(P * V)` for the network index.
+- `vertex_idx` / `vertex_name`: `O(1)`.
+- `neighbours` / `edges_at` / `other_end`: `O(1)` and allocation free (cached tuples).
+- `set_vertex_owner` / `set_edge_owner`: `O(1)` for placements (bitboards
+  included) plus `O(P)` to refresh the move frontiers around the change and
+  `O(α(V))` for the network index (`O(R)` when a building cuts a network)
+  and one component search for the longest-road index; clearing rebuilds the
+  derived bit masks and both indexes.
+"""
+
+from array import array
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from .bitboard import Bitboards
+from .longest_road import LongestRoadIndex
+from .move_generator import MoveGenerator
+from .network_index import NetworkIndex
+from .topology import BoardTopology, HEX_CORNERS, MAX_DEGREE, NO_INDEX, topology_from_board
+
+if TYPE_CHECKING:
+    from .board import BoardGraph
+
+NO_OWNER = -1  # ownership arrays use -1 for "nobody"
+
+
+class BoardCore:
+    """
+    Dense integer representation of a board.
+
+    Vertex indices follow the topology's vertex order, edge indices are the
+    edge IDs themselves (0..E-1) and hex indices are the hex IDs (0..18).
+    """
+
+    def __init__(self, topology: BoardTopology):
+        self.topology = topology
+        self.num_vertices = topology.num_vertices
+        self.num_edges = topology.num_edges
+        self.num_hexes = topology.num_hexes
+
+        # Shared, read-only tables (aliases onto the topology)
+        self.vertex_names = topology.vertex_names
+        self.vertex_index = topology.vertex_index
+        self.edge_v1 = topology.edge_v1
+        self.edge_v2 = topology.edge_v2
+        self.degree = topology.degree
+        self.adjacent_edges = topology.adjacent_edges
+        self.adjacent_vertices = topology.adjacent_vertices
+        self.hex_vertices = topology.hex_vertices
+        self._edges_at = topology.vertex_edges
+        self._neighbours = topology.vertex_neighbours
+        self._neighbour_names = topology.vertex_neighbour_names
+
+        # Ownership state, one array per board
+        self.vertex_owner = array("b", [NO_OWNER] * self.num_vertices)
+        self.vertex_is_city = array("b", [0] * self.num_vertices)
+        self.edge_owner = array("b", [NO_OWNER] * self.num_edges)
+        # Same ownership as bitsets, for O(1) legality checks (see bitboard.py)
+        self.bits = Bitboards(topology)
+        # Per-player legal-move frontiers, refreshed around each change (see move_generator.py)
+        self.moves = MoveGenerator(topology, self.bits)
+        # Per-player union-find over road networks (see network_index.py)
+        self.networks = NetworkIndex(topology, self.bits)
+        # Per-player road components and their longest trails (see longest_road.py)
+        self.longest = LongestRoadIndex(topology, self.bits)
+
+    @classmethod
+    def from_board(cls, board: "BoardGraph") -> "BoardCore":
+        """Index an existing BoardGraph and copy its current ownership."""
+        topology = board.topology if board.topology is not None else topology_from_board(board)
+        core = cls(topology)
+        index = topology.vertex_index
+        for name, vertex in board.vertices.items():
+            if vertex.owner is not None:
+                core.set_vertex_owner(index[name], vertex.owner, vertex.is_city)
+        for e, edge in board.edges.items():
+            if edge.owner is not None:
+                core.set_edge_owner(e, edge.owner)
+        return core
+
+    def copy(self) -> "BoardCore":
+        """
+        Independent copy of the ownership state, sharing the topology.
+
+        Every derived index (bitboards, move frontiers, networks, longest
+        road) is copied as it stands rather than rebuilt from the arrays.
+        """
+        clone = BoardCore.__new__(BoardCore)
+        clone.__dict__.update(self.__dict__)  # topology aliases
+        clone.vertex_owner = array("b", self.vertex_owner)
+        clone.vertex_is_city = array("b", self.vertex_is_city)
+        clone.edge_owner = array("b", self.edge_owner)
+        clone.bits = self.bits.copy()
+        clone.moves = self.moves.copy(clone.bits)
+        clone.networks = self.networks.copy(clone.bits)
+        clone.longest = self.longest.copy(clone.bits)
+        return clone
+
+    # Index translation
+
+    def vertex_idx(self, name: str) -> int:
+        return self.vertex_index[name]
+
+    def vertex_name(self, v: int) -> str:
+        return self.vertex_names[v]
+
+    # Topology lookups (all return cached tuples)
+
+    def edges_at(self, v: int) -> Tuple[int, ...]:
+        return self._edges_at[v]
+
+    def neighbours(self, v: int) -> Tuple[int, ...]:
+        return self._neighbours[v]
+
+    def neighbour_names(self, v: int) -> Tuple[str, ...]:
+        return self._neighbour_names[v]
+
+    def other_end(self, e: int, v: int) -> int:
+        a = self.edge_v1[e]
+        return self.edge_v2[e] if a == v else a
+
+    def hex_corners(self, h: int) -> array:
+        return self.hex_vertices[h * HEX_CORNERS:(h + 1) * HEX_CORNERS]
+
+    # Ownership
+
+    def set_vertex_owner(self, v: int, owner: Optional[int], is_city: bool = False) -> None:
+        previous = self.vertex_owner[v]
+        if owner is None:
+            self.vertex_owner[v] = NO_OWNER
+            self.vertex_is_city[v] = 0
+            if previous != NO_OWNER:
+                self.bits.clear_building(v)
+                self.moves.vertex_changed(v, previous)
+                self.networks.building_cleared(v)
+                self.longest.building_cleared(v)
+            return
+        if previous != NO_OWNER and previous != owner:
+            self.bits.clear_building(v)
+            self.networks.building_cleared(v)
+            self.longest.building_cleared(v)
+        self.vertex_owner[v] = owner
+        self.vertex_is_city[v] = 1 if is_city else 0
+        self.bits.place_building(v, owner, is_city)
+        self.moves.vertex_changed(v, owner)
+        if previous != owner:  # upgrades leave connectivity alone
+            self.networks.building_placed(v, owner)
+            self.longest.building_placed(v, owner)
+
+    def set_edge_owner(self, e: int, owner: Optional[int]) -> None:
+        previous = self.edge_owner[e]
+        if previous != NO_OWNER and previous != owner:
+            self.bits.clear_road(e)
+        if owner is None:
+            self.edge_owner[e] = NO_OWNER
+            if previous != NO_OWNER:
+                self.moves.edge_changed(e, previous)
+                self.networks.road_cleared(e)
+                self.longest.road_cleared(e)
+            return
+        if previous != NO_OWNER and previous != owner:
+            self.networks.road_cleared(e)
+            self.longest.road_cleared(e)
+        self.edge_owner[e] = owner
+        self.bits.place_road(e, owner)
+        self.moves.edge_changed(e, owner)
+        if previous != owner:
+            self.networks.road_placed(e, owner)
+            self.longest.road_placed(e, owner)
@@ -0,0 +1,151 @@
+"""
+Compact binary encoding of a game position.
+
+Search workers need the position, not the object graph: pickling a
+`GameState` drags along every `Vertex`/`Edge` dataclass, the board core's
+indexes and caches, and every listener. `encode_game` packs what defines
+a position into a few hundred bytes:
+
+- header: format version, phase, player to move, robber hex, player and turn-order counts
+- the 19 hexes as (resource code, number) byte pairs
+- vertex owners, city flags and edge owners as the board core's int8 arrays
+- per player: turn order, hand, victory points, pieces left, Longest Road flag
+
+`decode_game` rebuilds a full `GameState` from those bytes (the derived
+indexes are recomputed from ownership by `BoardCore`). Names and colours
+are not part of a position and come back as placeholders, and the setup
+placements are dropped. Only the standard board layout is supported.
+
+Algorithms referenced:
+- Fixed-layout binary records (`struct` + `array.tobytes`).
+
+Method time complexities:
+- `encode_game`: `O(V + E + H + P)`.
+- `decode_game`: `O(V + E + H + P)` plus the board core's index updates per piece.
+"""
+
+from array import array
+import struct
+from typing import TYPE_CHECKING, List, Optional
+
+from .board import STANDARD_TOPOLOGY, build_catan_board
+from .enums import Resource
+
+if TYPE_CHECKING:
+    from .game import GameState
+
+FORMAT_VERSION = 1
+
+# version, phase, current player index, robber hex, player count, turn order length
+_HEADER = struct.Struct("<BBbBBB")
+# per player: id, is_cpu, 5 resource counts, victory points, settlements, cities, roads, longest road
+_PLAYER = struct.Struct("<BB5HBBBBB")
+
+# Hand order on the wire
+_HAND = (Resource.LUMBER, Resource.WOOL, Resource.GRAIN, Resource.BRICK, Resource.ORE)
+_RESOURCES: List[Optional[Resource]] = [None] + list(Resource)  # code 0 = no resource
+
+
+def encode_game(game: "GameState") -> bytes:
+    """Pack the position of `game` into bytes (see module docstring for the layout)."""
+    from .game import GamePhase
+
+    board = game.board
+    if board.core.topology is not STANDARD_TOPOLOGY:
+        raise ValueError("Only the standard board layout can be encoded")
+    core = board.core
+    phases = list(GamePhase)
+
+    parts = [_HEADER.pack(
+        FORMAT_VERSION,
+        phases.index(game.current_phase),
+        game.current_player_idx,
+        game.robber_hex_id,
+        len(game.players),
+        len(game.turn_order),
+    )]
+    hexes = bytearray()
+    for hex_id in range(core.num_hexes):
+        tile = board.hexes[hex_id]
+        hexes.append(_RESOURCES.index(tile.resource))
+        hexes.append(tile.number or 0)
+    parts.append(bytes(hexes))
+    parts.append(core.vertex_owner.tobytes())
+    parts.append(core.vertex_is_city.tobytes())
+    parts.append(core.edge_owner.tobytes())
+    parts.append(bytes(game.turn_order))
+    for player in game.players:
+        parts.append(_PLAYER.pack(
+            player.id,
+            player.is_cpu,
+            *(player.resources.get(resource, 0) for resource in _HAND),
+            player.victory_points,
+            player.settlements_remaining,
+            player.cities_remaining,
+            player.roads_remaining,
+            player.has_longest_road,
+        ))
+    return b"".join(parts)
+
+
+def decode_game(data: bytes) -> "GameState":
+    """Rebuild a `GameState` from `encode_game` output."""
+    from .game import GamePhase, GameState, Player
+
+    version, phase, current_idx, robber_hex_id, num_players, num_turns = _HEADER.unpack_from(data, 0)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported game encoding version {version}")
+    offset = _HEADER.size
+    topology = STANDARD_TOPOLOGY
+
+    # Step 1: Board layout
+    resources = [_RESOURCES[data[offset + 2 * h]] for h in range(topology.num_hexes)]
+    numbers = [data[offset + 2 * h + 1] or None for h in range(topology.num_hexes)]
+    offset += 2 * topology.num_hexes
+    board = build_catan_board(resources, numbers)
+
+    # Step 2: Ownership
+    vertex_owner = array("b", data[offset:offset + topology.num_vertices])
+    offset += topology.num_vertices
+    vertex_is_city = array("b", data[offset:offset + topology.num_vertices])
+    offset += topology.num_vertices
+    edge_owner = array("b", data[offset:offset + topology.num_edges])
+    offset += topology.num_edges
+    for v, owner in enumerate(vertex_owner):
+        if owner >= 0:
+            board.set_vertex_owner(topology.vertex_names[v], owner, bool(vertex_is_city[v]))
+    for e, owner in enumerate(edge_owner):
+        if owner >= 0:
+            board.set_edge_owner(e, owner)
+
+    # Step 3: Players
+    turn_order = list(data[offset:offset + num_turns])
+    offset += num_turns
+    players = []
+    for _ in range(num_players):
+        (pid, is_cpu, *hand, victory_points, settlements, cities, roads, longest) = _PLAYER.unpack_from(data, offset)
+        offset += _PLAYER.size
+        players.append(Player(
+            id=pid,
+            name=f"Player {pid + 1}",
+            colour="",
+            is_cpu=bool(is_cpu),
+            resources=dict(zip(_HAND, hand)),
+            victory_points=victory_points,
+            settlements_remaining=settlements,
+            cities_remaining=cities,
+            roads_remaining=roads,
+            has_longest_road=bool(longest),
+        ))
+
+    return GameState(
+        board=board,
+        players=players,
+        current_phase=list(GamePhase)[phase],
+        turn_order=turn_order,
+        current_player_idx=current_idx,
+        robber_hex_id=robber_hex_id,
+    )
+
+
+__all__ = ["encode_game", "decode_game", "FORMAT_VERSION"]
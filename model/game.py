@@ -13,15 +13,22 @@ COMPLEX TECHNIQUES WE'RE USING HERE:
 * MODULAR DESIGN - Separating setup, rules, and building logic
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+import copy
 import random
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from enum import Enum
 
 from .board import BoardGraph, create_standard_board, Vertex, Edge
 from .enums import Resource
-from ..services.building_service import BuildingService
-from ..engine.turn_adapter import TurnEngineAdapter
+from .longest_road import LONGEST_ROAD_MIN, LONGEST_ROAD_VP
+from .zobrist import ZobristHash
+from services.building_service import BuildingService
+from engine.cpu_player import ActionType, CPUPlayer, CPUWeights
+from engine.mcts import MCTSConfig
+from engine.parallel_search import search_player
+from engine.rules_adapter import GameRulesAdapter
+from engine.turn_adapter import TurnEngineAdapter
 
 
 class GamePhase(Enum):
@@ -68,6 +75,11 @@ class Player:
 
     has_longest_road: bool = False
 
+    # Called as (player_id, resource, old, new) after every hand change
+    on_resource_change: Optional[Callable[[int, Resource, int, int], None]] = field(
+        default=None, repr=False, compare=False
+    )
+
     def add_resource(self, resource: Resource, amount: int = 1):
         """
         Add resources to the player's inventory.
@@ -76,7 +88,7 @@ class Player:
             resource: The type of resource to add
             amount: Quantity to add (default 1)
         """
-        self.resources[resource] += amount
+        self.set_resource(resource, self.resources[resource] + amount)
 
     def remove_resource(self, resource: Resource, amount: int = 1) -> bool:
         """
@@ -90,9 +102,21 @@ class Player:
             True if player had enough resources, False otherwise
         """
         if self.resources[resource] >= amount:
-            self.resources[resource] -= amount
+            self.set_resource(resource, self.resources[resource] - amount)
             return True
         return False
+
+    def set_resource(self, resource: Resource, amount: int) -> None:
+        """
+        Set how many of a resource the player holds.
+
+        Every hand change goes through here so `on_resource_change` (the
+        game's Zobrist hash) sees it.
+        """
+        old = self.resources.get(resource, 0)
+        self.resources[resource] = amount
+        if self.on_resource_change is not None and old != amount:
+            self.on_resource_change(self.id, resource, old, amount)
     
     def has_resources(self, cost: dict[Resource, int]) -> bool:
         """
@@ -129,7 +153,92 @@ class GameState:
 
     # Dice and robber tracking
     last_dice_total: int | None = None
-    robber_hex_id: int = 11  # Default robber position
+    robber_hex_id: int = 11  # Default robber position (create_game puts it on the desert)
+
+    # Incremental Zobrist hash of the position (see zobrist.py)
+    zobrist: ZobristHash = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.board.pip_cache.move_robber(self.robber_hex_id)
+        self._attach_zobrist(ZobristHash(self))
+
+    def _attach_zobrist(self, zobrist: ZobristHash) -> None:
+        """Keep `zobrist` current from the board's listeners and every player's hand."""
+        self.zobrist = zobrist
+        self.board.add_vertex_listener(zobrist.vertex_changed)
+        self.board.add_edge_listener(zobrist.edge_changed)
+        for player in self.players:
+            player.on_resource_change = zobrist.hand_changed
+
+    def clone(self) -> "GameState":
+        """
+        Independent copy of the game for search rollouts.
+
+        The clone gets its own board (see `BoardGraph.clone`), players and
+        hash, and shares only immutable data (topology, hex tiles), so moves
+        played on it never touch this game. Services and adapters are not
+        part of the state; build new ones over the clone if needed.
+
+        Time Complexity: O(V + E + P * R), no rebuilds
+        """
+        clone = copy.copy(self)
+        clone.board = self.board.clone()
+        clone.players = [
+            replace(player, resources=dict(player.resources), on_resource_change=None)
+            for player in self.players
+        ]
+        clone.turn_order = list(self.turn_order)
+        clone.setup_placements = list(self.setup_placements)
+        clone._attach_zobrist(self.zobrist.copy(clone))
+        return clone
+
+    def position_hash(self) -> int:
+        """
+        64-bit Zobrist hash of buildings, roads, hands, robber and player to move.
+
+        Time Complexity: O(1) - kept current incrementally
+        """
+        return self.zobrist.value
+
+    def move_robber(self, hex_id: int) -> None:
+        """Move the robber and refresh the board's per-vertex production cache."""
+        self.robber_hex_id = hex_id
+        self.board.pip_cache.move_robber(hex_id)
+
+    def update_longest_road(self) -> Optional[int]:
+        """
+        Hand the Longest Road card (and its 2 VP) to whoever has earned it.
+
+        The holder keeps it on a tie. If the holder's road is broken, the card
+        goes to the single longest road of at least 5, or to nobody if that
+        is shared. Lengths come from the board core's longest-road index.
+
+        Returns:
+            ID of the player holding the card afterwards, or None
+
+        Time Complexity: O(P)
+        """
+        longest = self.board.core.longest
+        holder = next((p for p in self.players if p.has_longest_road), None)
+        best = max((longest.length(p.id) for p in self.players), default=0)
+
+        # Step 1: The holder keeps the card while nobody is strictly longer
+        if holder is not None and longest.length(holder.id) >= max(best, LONGEST_ROAD_MIN):
+            return holder.id
+
+        # Step 2: Otherwise only a single longest road of 5+ can take it
+        leaders = [p for p in self.players if longest.length(p.id) == best]
+        winner = leaders[0] if best >= LONGEST_ROAD_MIN and len(leaders) == 1 else None
+        if winner is holder:
+            return None
+        if holder is not None:
+            holder.has_longest_road = False
+            holder.victory_points -= LONGEST_ROAD_VP
+        if winner is not None:
+            winner.has_longest_road = True
+            winner.victory_points += LONGEST_ROAD_VP
+            return winner.id
+        return None
 
     def get_current_player(self) -> Player:
         """
@@ -184,12 +293,54 @@ class GameSetup:
     - Resource distribution
     - Main game loop with building service integration
     """
+
+    # Safety cap so a CPU that keeps trading can't loop forever
+    MAX_CPU_ACTIONS_PER_TURN = 12
     
-    def __init__(self):
-        """Initialise the game setup with empty game state and building service."""
+    def __init__(
+        self,
+        verbose: bool = True,
+        on_event: Optional[Callable[[str, Dict[str, object]], None]] = None,
+        seed: Optional[int] = None,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Initialise the game setup with empty game state and building service.
+        
+        Args:
+            verbose: Print progress to stdout. Turn this off for simulations.
+            on_event: Optional callback receiving (kind, data) for every game event,
+                      so headless runners get structured events instead of text.
+            seed: Seed for this game's random generator, so the game can be replayed
+            rng: An existing generator to use instead (takes precedence over seed)
+        """
+        # One generator per game: board shuffle, dice and robber all draw from it
+        self.rng = rng if rng is not None else random.Random(seed)
         self.game: GameState | None = None
         self.building_service: Optional[BuildingService] = None
         self.turn_engine_adapter: Optional[TurnEngineAdapter] = None
+        self.verbose = verbose
+        self.on_event = on_event
+        self.rules_adapter: Optional[GameRulesAdapter] = None
+        # Per-player CPU tuning (player id -> CPUWeights); players without an entry use defaults
+        self.cpu_weights: Dict[int, CPUWeights] = {}
+        # Players that search instead (player id -> MCTSConfig); see engine/mcts.py
+        self.cpu_search: Dict[int, MCTSConfig] = {}
+
+    def _emit(self, kind: str, message: Optional[str] = None, **data) -> None:
+        """
+        Report something that happened in the game.
+        Structured data goes to `on_event`; the message is only printed when verbose.
+        """
+        if self.on_event is not None:
+            self.on_event(kind, data)
+        if self.verbose and message is not None:
+            print(message)
+
+    def _say(self, message: str = "") -> None:
+        """Print a plain progress message when verbose."""
+        if self.verbose:
+            print(message)
 
     def create_game(
         self,
@@ -242,18 +393,24 @@ class GameSetup:
             ))
         
         # Step 5: Create randomised board
-        board = create_standard_board()
+        board = create_standard_board(self.rng)
 
-        # Step 6: Initialise game state
+        # Step 6: Initialise game state, with the robber starting on the desert
+        desert_hex_id = next(
+            (hex_id for hex_id, hex_tile in board.hexes.items() if hex_tile.number is None),
+            GameState.robber_hex_id,
+        )
         self.game = GameState(
             board=board,
             players=players,
-            current_phase=GamePhase.DETERMINING_ORDER
+            current_phase=GamePhase.DETERMINING_ORDER,
+            robber_hex_id=desert_hex_id
         )
         
         # Step 7: Create building service for main game integration
         self.building_service = BuildingService(self.game)
-        self.turn_engine_adapter = TurnEngineAdapter(self.game)
+        self.rules_adapter = GameRulesAdapter(self.game, self.building_service)
+        self.turn_engine_adapter = TurnEngineAdapter(self.game, self.rng)
         return self.game
     
     def determine_turn_order(self) -> list[tuple[str, int]]:
@@ -297,7 +454,8 @@ class GameSetup:
 
         # Step 4: Resolve ties using recursion (re-roll until one winner)
         while len(highest_rollers) > 1:
-            print(f"Tie between players. They will re-roll: {[p.name for p, _ in highest_rollers]}")
+            if self.verbose:
+                print(f"Tie between players. They will re-roll: {[p.name for p, _ in highest_rollers]}")
             new_rolls = []
 
             # Re-roll for all tied players
@@ -318,6 +476,7 @@ class GameSetup:
         self.game.turn_order = [player.id for player, _ in rolls]
         self.game.current_phase = GamePhase.FIRST_SETTLEMENT_ROUND
         self.game.current_player_idx = 0
+        self._emit("turn_order", order=list(self.game.turn_order))
 
         return [(player.name, roll) for player, roll in rolls]
         
@@ -330,7 +489,7 @@ class GameSetup:
         Returns:
             Tuple of (die1, die2) with values 1-6 each
         """
-        return (random.randint(1, 6), random.randint(1, 6))
+        return (self.rng.randint(1, 6), self.rng.randint(1, 6))
 
     def can_place_initial_settlement(self, player_id: int, vertex_id: str) -> tuple[bool, str]:
         """
@@ -363,11 +522,9 @@ class GameSetup:
         if vertex.owner is not None:
             return False, "The vertex you are trying to access is already occupied"
         
-        # Step 3: Check distance rule - no settlements within 2 edges
-        for neighbour_id in board.neighbors(vertex_id):
-            neighbour = board.vertices[neighbour_id]
-            if neighbour.owner is not None:
-                return False, "The vertex you want to build in is too close to another settlement (distance rule)"
+        # Step 3: Check distance rule - no settlements within 2 edges (one bitboard test)
+        if not board.core.bits.distance_ok(board.core.vertex_index[vertex_id]):
+            return False, "The vertex you want to build in is too close to another settlement (distance rule)"
         
         return True, "Valid placement"
     
@@ -404,17 +561,17 @@ class GameSetup:
         # Step 2: Validate placement
         can_place, reason = self.can_place_initial_settlement(current_player.id, vertex_id)
         if not can_place:
-            print(f"The settlement cannot be placed: {reason}")
+            self._emit("placement_rejected", f"The settlement cannot be placed: {reason}",
+                       player_id=current_player.id, vertex_id=vertex_id, reason=reason)
             return False
         
         # Step 3: Place the settlement
-        vertex = self.game.board.vertices[vertex_id]
-        vertex.owner = current_player.id
-        vertex.is_city = False
+        self.game.board.set_vertex_owner(vertex_id, current_player.id, is_city=False)
         current_player.settlements_remaining -= 1
         current_player.victory_points += 1
 
-        print(f"{current_player.name} placed settlement at {vertex_id}")
+        self._emit("settlement_placed", f"{current_player.name} placed settlement at {vertex_id}",
+                   player_id=current_player.id, vertex_id=vertex_id)
 
         return True
 
@@ -482,15 +639,16 @@ class GameSetup:
         # Step 1: Validate placement
         can_place, reason = self.can_place_initial_road(current_player.id, settlement_vertex_id, edge_id)
         if not can_place:
-            print(f"Cannot place road: {reason}")
+            self._emit("placement_rejected", f"Cannot place road: {reason}",
+                       player_id=current_player.id, edge_id=edge_id, reason=reason)
             return False
 
         # Step 2: Place the road
-        edge = self.game.board.edges[edge_id]
-        edge.owner = current_player.id
+        self.game.board.set_edge_owner(edge_id, current_player.id)
         current_player.roads_remaining -= 1
 
-        print(f"{current_player.name} placed road at edge {edge_id}")
+        self._emit("road_placed", f"{current_player.name} placed road at edge {edge_id}",
+                   player_id=current_player.id, edge_id=edge_id)
         
         # Step 3: Store placement for resource distribution later
         self.game.setup_placements.append((current_player.id, settlement_vertex_id, edge_id))
@@ -523,9 +681,8 @@ class GameSetup:
         # Step 2: Place road
         if not self.place_initial_road(settlement_vertex, road_edge):
             # Step 3: Rollback settlement if road placement fails
-            vertex = self.game.board.vertices[settlement_vertex]
             current_player = self.game.get_current_player()
-            vertex.owner = None
+            self.game.board.set_vertex_owner(settlement_vertex, None)
             current_player.settlements_remaining += 1
             current_player.victory_points -= 1
             return False
@@ -551,7 +708,7 @@ class GameSetup:
             return
         
         if self.game.current_phase != GamePhase.MAIN_GAME:
-            print("Not in the main game phase yet")
+            self._say("Not in the main game phase yet")
             return
 
         # Step 1: Get second settlement placements (last N, where N = number of players)
@@ -570,9 +727,11 @@ class GameSetup:
                 # Only award if hex produces resources (not desert)
                 if hex_tile.resource is not None:
                     player.add_resource(hex_tile.resource, 1)
-                    print(f"{player.name} receives 1 {hex_tile.resource.value} from hex {hex_id}")
+                    self._emit("initial_resource",
+                               f"{player.name} receives 1 {hex_tile.resource.name} from hex {hex_id}",
+                               player_id=player_id, resource=hex_tile.resource, hex_id=hex_id)
 
-        print("The initial resources were distributed")
+        self._say("The initial resources were distributed")
 
     def _print_player_resources(self):
         """
@@ -581,7 +740,7 @@ class GameSetup:
         Displays each player's name followed by their resources in format:
         "ResourceName: amount, ResourceName: amount"
         """
-        if not self.game:
+        if not self.game or not self.verbose:
             return
         
         for player in self.game.players:
@@ -615,24 +774,24 @@ class GameSetup:
             GameState ready to start main game
         """
         # Step 1: Create game
-        print("1. The Game is Being Created")
+        self._say("1. The Game is Being Created")
         self.create_game(player_names, player_colours)
-        print(f"The game was created with {len(player_names)} players\n")
+        self._say(f"The game was created with {len(player_names)} players\n")
 
         # Step 2: Board setup
-        print("2. Board Setup")
-        print("The board was created and randomised")
+        self._say("2. Board Setup")
+        self._say("The board was created and randomised")
 
         # Step 3: Determine turn order
-        print("3. Determining Turn Order")
+        self._say("3. Determining Turn Order")
         order = self.determine_turn_order()
         for name, roll in order:
-            print(f"{name} rolled {roll}")
-        print(f"Turn order: {' -> '.join([p.name for p in self.game.players])}\n")
+            self._say(f"{name} rolled {roll}")
+        self._say(f"Turn order: {' -> '.join([p.name for p in self.game.players])}\n")
 
         # Step 4: Initial placement (snake order)
-        print("4. Initial Placement")
-        print("First round (forward):")
+        self._say("4. Initial Placement")
+        self._say("First round (forward):")
 
         placement_idx = 0
         num_players = len(self.game.players)
@@ -641,26 +800,26 @@ class GameSetup:
         for i in range(num_players):
             player = self.game.get_current_player()
             vertex, edge = placements[placement_idx]
-            print(f"  {player.name}: Settlement at {vertex}, Road at edge {edge}")
+            self._say(f"  {player.name}: Settlement at {vertex}, Road at edge {edge}")
             self.complete_initial_placement(vertex, edge)
             placement_idx += 1
         
         # Second round: reverse order (snake order)
-        print("Second round (reverse):")
+        self._say("Second round (reverse):")
         for i in range(num_players):
             player = self.game.get_current_player()
             vertex, edge = placements[placement_idx]
-            print(f"  {player.name}: Settlement at {vertex}, Road at edge {edge}")
+            self._say(f"  {player.name}: Settlement at {vertex}, Road at edge {edge}")
             self.complete_initial_placement(vertex, edge)
             placement_idx += 1
         
-        print()
+        self._say()
 
         # Step 5: Distribute initial resources
-        print("5. Distributing Initial Resources")
+        self._say("5. Distributing Initial Resources")
         self.distribute_initial_resources()
 
-        print("The setup was finalised")
+        self._say("The setup was finalised")
 
         return self.game
 
@@ -689,7 +848,7 @@ class GameSetup:
         """
         # Step 1: Verify game exists
         if not self.game:
-            print("Game not created")
+            self._say("Game not created")
             return
 
         # Step 2: Ensure building service is initialised
@@ -698,31 +857,17 @@ class GameSetup:
 
         # Step 3: Ensure we're in main game phase
         if self.game.current_phase != GamePhase.MAIN_GAME:
-            print("Warning: main game loop started before MAIN_GAME phase")
+            self._say("Warning: main game loop started before MAIN_GAME phase")
             self.game.current_phase = GamePhase.MAIN_GAME
 
         # Step 4: Main game loop
         turn_counter = 0
         while self.game.current_phase == GamePhase.MAIN_GAME and turn_counter < max_turns:
             player = self.game.get_current_player()
-            print(f"\n--- Turn {turn_counter + 1}: {player.name} ({'CPU' if player.is_cpu else 'Human'}) ---")
-
-            dice_events = self._execute_dice_phase(player)
-            if dice_events:
-                self._summarise_dice_events(player, dice_events)
-
-            self._print_player_resources()
+            self._say(f"\n--- Turn {turn_counter + 1}: {player.name} ({'CPU' if player.is_cpu else 'Human'}) ---")
 
-            # Step 4c: Run appropriate turn handler
-            if player.is_cpu:
-                self._run_cpu_turn(player)
-            else:
-                self._run_human_turn(player)
-
-            # Step 4d: Check victory condition
-            if player.victory_points >= 10:
-                print(f"{player.name} wins the game!")
-                self.game.current_phase = GamePhase.GAME_OVER
+            # Steps 4a-4d: dice, actions and victory check
+            if self.play_turn(player):
                 break
 
             # Step 4e: Advance to next player
@@ -731,13 +876,52 @@ class GameSetup:
 
         # Step 5: End game message
         if self.game.current_phase == GamePhase.MAIN_GAME:
-            print("Main game loop ended (turn limit reached).")
+            self._emit("turn_limit", "Main game loop ended (turn limit reached).", turns=turn_counter)
+
+    def play_turn(self, player: Player) -> bool:
+        """
+        Play one full turn for a player: dice phase, actions, victory check.
+        
+        Steps:
+        1. Roll dice and distribute resources / handle the robber
+        2. Run the human turn (prompts) or CPU turn (automatic)
+        3. Check for victory condition (10 victory points)
+        
+        Shared by the interactive loop and headless simulations; with
+        verbose off and CPU seats only it never touches stdin/stdout.
+        
+        Args:
+            player: The Player object whose turn it is
+            
+        Returns:
+            True if the player won the game this turn
+        """
+        dice_events = self._execute_dice_phase(player)
+        if dice_events:
+            self._emit("dice", player_id=player.id, events=dice_events)
+            self._summarise_dice_events(player, dice_events)
+
+        self._print_player_resources()
+
+        # Step 2: Run appropriate turn handler
+        if player.is_cpu:
+            self._run_cpu_turn(player)
+        else:
+            self._run_human_turn(player)
+
+        # Step 3: Check victory condition
+        if player.victory_points >= 10:
+            self._emit("victory", f"{player.name} wins the game!",
+                       player_id=player.id, victory_points=player.victory_points)
+            self.game.current_phase = GamePhase.GAME_OVER
+            return True
+        return False
 
     def _ensure_turn_engine_adapter(self) -> TurnEngineAdapter:
         if not self.game:
             raise ValueError("Game not created")
         if self.turn_engine_adapter is None:
-            self.turn_engine_adapter = TurnEngineAdapter(self.game)
+            self.turn_engine_adapter = TurnEngineAdapter(self.game, self.rng)
         return self.turn_engine_adapter
 
     def _execute_dice_phase(self, player: Player) -> Optional[Dict[str, object]]:
@@ -749,6 +933,8 @@ class GameSetup:
         return events
 
     def _summarise_dice_events(self, player: Player, events: Dict[str, object]) -> None:
+        if not self.verbose:
+            return
         roll = events["roll"]
         print(f"{player.name} rolled {roll}")
 
@@ -917,35 +1103,81 @@ class GameSetup:
             else:
                 print("Unknown action. Type 'help' for available actions.")
 
+    # Build actions -> "structure" value of the build event
+    _BUILD_STRUCTURES = {
+        ActionType.BUILD_SETTLEMENT: "settlement",
+        ActionType.BUILD_CITY: "city",
+        ActionType.BUILD_ROAD: "road",
+    }
+
     def _run_cpu_turn(self, player: Player):
         """
-        Handle a CPU player's turn using automatic building decisions.
+        Handle a CPU player's turn with the heuristic CPUPlayer (or an MCTS
+        player, in-process or over a worker pool, for players in `cpu_search`).
         
-        Steps:
-        1. Try to build a settlement using CPU building service
-           (uses pathfinding and resource location scoring)
-        2. If settlement building fails, try to build a road
-           (uses shortest path algorithm to target resources)
-        3. Display the result message
+        Steps (repeated until the CPU passes or the action cap is hit):
+        1. CPUPlayer scores every legal action through the GameRulesAdapter
+           in one batch and picks the best in a single linear pass (ties go to
+           the action generated first)
+        2. The adapter executes it through the building service
+        3. Builds and trades are reported as events
         
-        This connects CPU building decisions to the pathfinding and
-        building service logic.
+        Trades can't cycle (the adapter never offers a card back that was just
+        received) and MAX_CPU_ACTIONS_PER_TURN caps the turn regardless.
         
         Args:
             player: The Player object whose turn it is (must be CPU)
         """
-        if not self.building_service:
+        adapter = self._ensure_rules_adapter()
+        if adapter is None:
             return
+        adapter.start_turn()
+        search = self.cpu_search.get(player.id)
+        if search is not None:
+            cpu = search_player(adapter, self.cpu_weights.get(player.id), search)
+        else:
+            cpu = CPUPlayer(adapter, self.cpu_weights.get(player.id))
 
-        # Step 1: Try to build settlement (higher priority)
-        built_settlement, settlement_msg = self.building_service.cpu_build_settlement(player.id)
-        if built_settlement:
-            print(settlement_msg)
-            return
+        for _ in range(self.MAX_CPU_ACTIONS_PER_TURN):
+            # Step 1: Pick the best action
+            action = cpu.choose_action()
+            if action.action_type == ActionType.PASS:
+                break
+
+            # Step 2: Execute it
+            success, message = adapter.execute(action)
+            if not success:
+                break
+
+            # Step 3: Report it
+            if action.action_type == ActionType.BANK_TRADE:
+                self._emit("trade", message, player_id=player.id)
+            else:
+                structure = self._BUILD_STRUCTURES.get(action.action_type)
+                self._emit("build", message, player_id=player.id, structure=structure)
+
+    def _ensure_rules_adapter(self) -> Optional[GameRulesAdapter]:
+        if not self.game or not self.building_service:
+            return None
+        if self.rules_adapter is None or self.rules_adapter.service is not self.building_service:
+            self.rules_adapter = GameRulesAdapter(self.game, self.building_service)
+        return self.rules_adapter
 
-        # Step 2: If settlement fails, try to build road
-        built_road, road_msg = self.building_service.cpu_build_road(player.id)
-        print(road_msg)
+    def place_cpu_initial(self, player: Player) -> bool:
+        """
+        Let a CPU player pick and place its setup settlement and road.
+        
+        Returns:
+            True if both placements succeeded
+        """
+        if not self.building_service:
+            return False
+        choice = self.building_service.cpu_choose_initial_placement(player.id)
+        if choice is None:
+            return False
+        vertex_id, edge_id = choice
+        self._say(f"  CPU places: Settlement at {vertex_id}, Road at {edge_id}")
+        return self.complete_initial_placement(vertex_id, edge_id)
 
     def _prompt_edge_id(self) -> Optional[int]:
         """
@@ -1009,20 +1241,8 @@ class GameSetup:
             print(f"\n{player.name}'s placement:")
             
             if player.is_cpu:
-                # Simple CPU placement - just use first available
-                available_vertices = list(self.game.board.vertices.keys())
-                for vertex_id in available_vertices:
-                    can_place, _ = self.can_place_initial_settlement(player.id, vertex_id)
-                    if can_place:
-                        # Find a valid road
-                        vertex = self.game.board.vertices[vertex_id]
-                        for edge_id in vertex.edge_ids:
-                            edge = self.game.board.edges[edge_id]
-                            if edge.owner is None:
-                                print(f"  CPU places: Settlement at {vertex_id}, Road at {edge_id}")
-                                self.complete_initial_placement(vertex_id, edge_id)
-                                break
-                        break
+                # CPU picks the best-scoring legal spot
+                self.place_cpu_initial(player)
             else:
                 # Human placement with validation
                 while True:
@@ -1068,18 +1288,7 @@ class GameSetup:
             print(f"\n{player.name}'s placement:")
             
             if player.is_cpu:
-                available_vertices = list(self.game.board.vertices.keys())
-                for vertex_id in available_vertices:
-                    can_place, _ = self.can_place_initial_settlement(player.id, vertex_id)
-                    if can_place:
-                        vertex = self.game.board.vertices[vertex_id]
-                        for edge_id in vertex.edge_ids:
-                            edge = self.game.board.edges[edge_id]
-                            if edge.owner is None:
-                                print(f"  CPU places: Settlement at {vertex_id}, Road at {edge_id}")
-                                self.complete_initial_placement(vertex_id, edge_id)
-                                break
-                        break
+                self.place_cpu_initial(player)
             else:
                 while True:
                     vertex_id = input("  Enter settlement vertex ID: ").strip()
@@ -0,0 +1,234 @@
+"""
+Longest-road engine: longest trail through each player's roads.
+
+A trail may revisit vertices but never an edge, and it cannot pass through
+a vertex an opponent has built on (it may end there). For every player the
+engine splits their roads into components - roads joined at vertices that
+are not cut by an opponent - and keeps, per component:
+
+- `length`: the longest trail inside it, including trails that start and
+  end at opponent buildings
+- `best_from[v]`: the longest trail starting at v, for every uncut vertex of it
+
+Both come out of one DFS per start vertex with the used edges as a bitmask.
+Only the components a change touches are recomputed:
+
+- a road joins (at most) the two components at its endpoints
+- a building splits the components of opponents whose roads run through it
+- clearing pieces (rollbacks / undo) recomputes the affected players
+
+`best_from` also answers "what would my longest road be if I built e" for
+a new road hanging off one component: `best_from[end] + 1`, no search. Only
+roads that close a loop or join two components need a DFS of the merged
+component (see `longest_with`).
+
+`BoardCore.set_vertex_owner` / `set_edge_owner` drive the updates. Awarding
+the card is up to the game (`GameState.update_longest_road`).
+
+Algorithms referenced:
+- Depth-first search over edge-visited bitmasks (longest trail).
+- Flood fill over edges to find the components a change touched.
+
+Method time complexities:
+- `road_placed` / `building_placed`: one component search, `O(S * b^d)`
+  worst case for S start vertices, in practice a few thousand steps
+  for a 15-road network (degree ≤3 keeps the branching tiny).
+- `length`: `O(1)`.
+- `copy`: `O(P)` (components are shared).
+- `longest_with`: `O(1)` per candidate that extends one component, one
+  component search per candidate that merges or closes a loop.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .bitboard import Bitboards, iter_bits
+from .topology import BoardTopology
+
+# Rules of the Longest Road card
+LONGEST_ROAD_MIN = 5
+LONGEST_ROAD_VP = 2
+
+
+class RoadComponent:
+    """One connected group of a player's roads and its trail lengths."""
+
+    __slots__ = ("edges", "length", "best_from")
+
+    def __init__(self, edges: int, length: int, best_from: Dict[int, int]):
+        self.edges = edges
+        self.length = length
+        self.best_from = best_from
+
+
+class LongestRoadIndex:
+    """Per-player road components with their longest trails, kept current by `BoardCore`."""
+
+    def __init__(self, topology: BoardTopology, bits: Bitboards):
+        self.topology = topology
+        self.bits = bits
+        self.components: Dict[int, List[RoadComponent]] = {}  # player -> components
+        self.lengths: Dict[int, int] = {}  # player -> longest trail
+
+    def copy(self, bits: Bitboards) -> "LongestRoadIndex":
+        """
+        Independent copy reading from `bits` (the cloned board's bitboards).
+
+        Components are replaced, never changed in place, so the copy shares them.
+        """
+        clone = LongestRoadIndex(self.topology, bits)
+        clone.components = {pid: list(components) for pid, components in self.components.items()}
+        clone.lengths = dict(self.lengths)
+        return clone
+
+    # Queries
+
+    def length(self, player_id: int) -> int:
+        return self.lengths.get(player_id, 0)
+
+    def longest_with(self, player_id: int, edges: Iterable[int]) -> Dict[int, int]:
+        """
+        The player's longest road if they built each of `edges` (one at a time).
+
+        Args:
+            player_id: Player building the road
+            edges: Candidate empty edges, e.g. the legal road frontier
+
+        Returns:
+            Dict edge -> longest road with that edge added
+
+        Time Complexity: O(1) per candidate hanging off one component,
+        one component search per candidate joining or looping components
+        """
+        current = self.length(player_id)
+        topology = self.topology
+        cut = self._cut_mask(player_id)
+        road_vertices = self.bits.road_vertices.get(player_id, 0)
+        components = self.components.get(player_id, [])
+        result: Dict[int, int] = {}
+        for e in edges:
+            # Step 1: Which component does each (uncut) endpoint continue?
+            touching: List[Tuple[int, Optional[RoadComponent]]] = []
+            for end in (topology.edge_v1[e], topology.edge_v2[e]):
+                if (cut >> end) & 1 or not (road_vertices >> end) & 1:
+                    touching.append((end, None))
+                else:
+                    touching.append((end, self._component_at(components, end)))
+            (a, comp_a), (b, comp_b) = touching
+            # Step 2: A road hanging off one component only extends trails ending at it
+            if comp_a is None and comp_b is None:
+                result[e] = max(current, 1)
+            elif comp_b is None:
+                result[e] = max(current, comp_a.best_from.get(a, 0) + 1)
+            elif comp_a is None:
+                result[e] = max(current, comp_b.best_from.get(b, 0) + 1)
+            else:
+                # Step 3: Joining two components (or closing a loop) needs a search
+                merged = comp_a.edges | comp_b.edges | (1 << e)
+                length, _ = self._search(merged, cut)
+                result[e] = max(current, length)
+        return result
+
+    # Updates (called by BoardCore after the bitboards changed)
+
+    def road_placed(self, e: int, player_id: int) -> None:
+        self._recompute(player_id, (e,))
+
+    def building_placed(self, v: int, player_id: int) -> None:
+        """A building on v splits every opponent road component running through it."""
+        bits = self.bits
+        for other_id in list(self.components):
+            if other_id != player_id and bits.touches_own_road(other_id, v):
+                roads = bits.roads.get(other_id, 0)
+                self._recompute(other_id, [f for f in self.topology.vertex_edges[v] if (roads >> f) & 1])
+
+    def building_cleared(self, v: int) -> None:
+        self._recompute_all()
+
+    def road_cleared(self, e: int) -> None:
+        self._recompute_all()
+
+    # Recomputation
+
+    def _cut_mask(self, player_id: int) -> int:
+        """Vertices an opponent has built on."""
+        return self.bits.occupied & ~self.bits.buildings(player_id)
+
+    @staticmethod
+    def _component_at(components: List[RoadComponent], v: int) -> Optional[RoadComponent]:
+        for component in components:
+            if v in component.best_from:
+                return component
+        return None
+
+    def _recompute(self, player_id: int, seeds: Iterable[int]) -> None:
+        """Re-split and re-measure only the components containing the `seeds` edges."""
+        roads = self.bits.roads.get(player_id, 0)
+        cut = self._cut_mask(player_id)
+        # Step 1: Flood fill the touched components as they are now
+        fresh: List[int] = []
+        covered = 0
+        for e in seeds:
+            if (covered >> e) & 1 or not (roads >> e) & 1:
+                continue
+            edges = self._flood(e, roads, cut)
+            covered |= edges
+            fresh.append(edges)
+        # Step 2: Drop old components that overlap them, measure the new ones
+        kept = [c for c in self.components.get(player_id, []) if not c.edges & covered]
+        for edges in fresh:
+            length, best_from = self._search(edges, cut)
+            kept.append(RoadComponent(edges, length, best_from))
+        self.components[player_id] = kept
+        self.lengths[player_id] = max((c.length for c in kept), default=0)
+
+    def _recompute_all(self) -> None:
+        for player_id in set(self.components) | set(self.bits.roads):
+            self.components[player_id] = []
+            self._recompute(player_id, list(iter_bits(self.bits.roads.get(player_id, 0))))
+
+    def _flood(self, start: int, roads: int, cut: int) -> int:
+        """Edge mask of the component containing `start`."""
+        topology = self.topology
+        edges = 1 << start
+        stack = [start]
+        while stack:
+            e = stack.pop()
+            for end in (topology.edge_v1[e], topology.edge_v2[e]):
+                if (cut >> end) & 1:
+                    continue  # an opponent's building breaks the road here
+                for f in topology.vertex_edges[end]:
+                    if (roads >> f) & 1 and not (edges >> f) & 1:
+                        edges |= 1 << f
+                        stack.append(f)
+        return edges
+
+    def _search(self, edges: int, cut: int) -> Tuple[int, Dict[int, int]]:
+        """Longest trail in a component and the longest trail from each of its uncut vertices."""
+        topology = self.topology
+        edge_v1, edge_v2 = topology.edge_v1, topology.edge_v2
+        vertex_edges = topology.vertex_edges
+
+        def trail(v: int, used: int) -> int:
+            best = 0
+            for f in vertex_edges[v]:
+                if not (edges >> f) & 1 or (used >> f) & 1:
+                    continue
+                u = edge_v2[f] if edge_v1[f] == v else edge_v1[f]
+                if (cut >> u) & 1:
+                    step = 1  # the trail ends at an opponent's building
+                else:
+                    step = 1 + trail(u, used | (1 << f))
+                if step > best:
+                    best = step
+            return best
+
+        best_from: Dict[int, int] = {}
+        longest = 0
+        for e in iter_bits(edges):
+            for v in (edge_v1[e], edge_v2[e]):
+                if (cut >> v) & 1:
+                    # A trail may start at an opponent's building (just not pass through it)
+                    longest = max(longest, trail(v, 0))
+                elif v not in best_from:
+                    best_from[v] = trail(v, 0)
+        return max(longest, max(best_from.values(), default=0)), best_from
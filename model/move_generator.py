@@ -0,0 +1,111 @@
+"""
+Incremental legal-move generator.
+
+Keeps, for every player, the current frontier of legal moves as bit masks:
+
+- `roads[p]`: empty edges touching p's network
+- `settlements[p]`: vertices next to p's roads that pass the distance rule
+- `cities[p]`: p's settlements (what can be upgraded)
+
+Instead of recomputing these from the whole network after every move, the
+generator only re-evaluates the small region a change can affect:
+
+- a building on vertex v changes the distance rule on v and its neighbours,
+  and can cut opponents' networks at v -> re-check the ≤4 vertices of v's
+  closed neighbourhood and the ≤3 edges at v
+- a road on edge e only adds/removes e and its two endpoints from networks
+  -> re-check e's endpoints and the ≤5 edges around them
+
+Each re-check is an O(1) test against the bitboards, so keeping the
+frontiers current costs O(P) per placement no matter how large a player's
+network grows, and asking for the legal moves is a mask read.
+
+Algorithms referenced:
+- Dirty-region invalidation over a bitboard state.
+
+Method time complexities:
+- `vertex_changed` / `edge_changed`: `O(P)` (constant-size region per player).
+- `legal_roads` / `legal_settlements` / `upgradeable`: `O(1)` mask reads.
+- `copy`: `O(P)`.
+"""
+
+from typing import Dict, Iterable
+
+from .bitboard import Bitboards, iter_bits
+from .topology import BoardTopology
+
+
+class MoveGenerator:
+    """Per-player legal-move frontiers, kept current by `BoardCore`."""
+
+    def __init__(self, topology: BoardTopology, bits: Bitboards):
+        self.topology = topology
+        self.bits = bits
+        self.roads: Dict[int, int] = {}  # player -> legal edge bits
+        self.settlements: Dict[int, int] = {}  # player -> legal vertex bits
+
+    def copy(self, bits: Bitboards) -> "MoveGenerator":
+        """Independent copy reading from `bits` (the cloned board's bitboards)."""
+        clone = MoveGenerator(self.topology, bits)
+        clone.roads = dict(self.roads)
+        clone.settlements = dict(self.settlements)
+        return clone
+
+    # Queries
+
+    def legal_roads(self, player_id: int) -> int:
+        return self.roads.get(player_id, 0)
+
+    def legal_settlements(self, player_id: int) -> int:
+        return self.settlements.get(player_id, 0)
+
+    def upgradeable(self, player_id: int) -> int:
+        return self.bits.settlements.get(player_id, 0)
+
+    # Updates (called by BoardCore after the bitboards changed)
+
+    def vertex_changed(self, v: int, player_id: int) -> None:
+        """A building appeared, was upgraded or was removed on v (owned by player_id, before or after)."""
+        self._track(player_id)
+        self._refresh(self.topology.closed_neighbourhood[v], self.topology.vertex_edges[v])
+
+    def edge_changed(self, e: int, player_id: int) -> None:
+        """A road appeared or was removed on e (owned by player_id, before or after)."""
+        self._track(player_id)
+        topology = self.topology
+        a, b = topology.edge_v1[e], topology.edge_v2[e]
+        edges = set(topology.vertex_edges[a])
+        edges.update(topology.vertex_edges[b])
+        self._refresh((a, b), edges)
+
+    def _track(self, player_id: int) -> None:
+        if player_id not in self.roads:
+            self.roads[player_id] = 0
+            self.settlements[player_id] = 0
+
+    def _refresh(self, vertices: Iterable[int], edges: Iterable[int]) -> None:
+        """Re-test only the given vertices and edges for every tracked player."""
+        bits = self.bits
+        topology = self.topology
+        edge_v1, edge_v2 = topology.edge_v1, topology.edge_v2
+        vertex_mask = 0
+        for v in vertices:
+            vertex_mask |= 1 << v
+        edge_mask = 0
+        for e in edges:
+            edge_mask |= 1 << e
+        free_edges = edge_mask & ~bits.all_roads
+        open_vertices = vertex_mask & ~bits.blocked
+
+        for player_id in self.roads:
+            # Settlements: on one of the player's roads and not blocked
+            settle = bits.road_vertices.get(player_id, 0) & open_vertices
+            self.settlements[player_id] = (self.settlements[player_id] & ~vertex_mask) | settle
+
+            # Roads: empty and touching the player's network
+            network = bits.network(player_id)
+            roads = 0
+            for e in iter_bits(free_edges):
+                if (network >> edge_v1[e]) & 1 or (network >> edge_v2[e]) & 1:
+                    roads |= 1 << e
+            self.roads[player_id] = (self.roads[player_id] & ~edge_mask) | roads
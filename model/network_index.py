@@ -0,0 +1,179 @@
+"""
+Union-find connectivity index over each player's road network.
+
+A player's network is every vertex they can reach from one of their own
+settlements/cities by walking their own roads. An opponent's building on a
+vertex cuts the network there: the roads on either side stop being
+connected and the vertex itself is no longer a building point.
+
+For every player the index keeps a disjoint-set forest over the 54
+vertices. Each of the player's roads unions its two endpoints (unless an
+opponent has built on one of them). Roots carry the bit mask of their
+members and whether the component holds one of the player's buildings, so
+the union of the anchored components - the network - is kept as one mask:
+
+- a new road is one `union`, merging two member masks
+- a new own building anchors its component (one `find`)
+- an opponent building on a vertex of the network is a cut, which a
+  disjoint-set forest cannot undo, so only the component containing that
+  vertex is rebuilt from the player's roads
+- clearing pieces (rollbacks / undo) rebuilds the affected players
+
+`BoardCore.set_vertex_owner` / `set_edge_owner` drive the updates, so
+`BuildingService.build_*` and the setup phase both keep it current.
+
+Algorithms referenced:
+- Disjoint-set union with path halving and union by size.
+- Bitmask members per root, so listing a component is one mask read.
+
+Method time complexities:
+- `road_placed` / `building_placed`: `O(α(V))` amortised, plus `O(R)` to
+  rebuild a component when the building cuts an opponent's network.
+- `road_cleared` / `building_cleared`: `O(P * R)` full rebuild.
+- `network` / `is_connected`: `O(1)`.
+- `copy`: `O(P * V)` list slices.
+"""
+
+from typing import Dict, List
+
+from .bitboard import Bitboards, iter_bits
+from .topology import BoardTopology
+
+
+class PlayerNetwork:
+    """Disjoint-set forest over one player's roads."""
+
+    def __init__(self, num_vertices: int):
+        self.parent: List[int] = list(range(num_vertices))
+        self.size: List[int] = [1] * num_vertices
+        self.members: List[int] = [1 << v for v in range(num_vertices)]  # valid at roots
+        self.anchored: List[bool] = [False] * num_vertices  # valid at roots
+        self.network = 0  # members of every anchored component
+
+    def copy(self) -> "PlayerNetwork":
+        clone = PlayerNetwork.__new__(PlayerNetwork)
+        clone.parent = self.parent[:]
+        clone.size = self.size[:]
+        clone.members = self.members[:]
+        clone.anchored = self.anchored[:]
+        clone.network = self.network
+        return clone
+
+    def find(self, v: int) -> int:
+        parent = self.parent
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]  # path halving
+            v = parent[v]
+        return v
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        # Step 1: A newly anchored side joins the network
+        if self.anchored[ra] != self.anchored[rb]:
+            self.network |= self.members[rb] if self.anchored[ra] else self.members[ra]
+        # Step 2: Attach the smaller tree under the larger
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+        self.members[ra] |= self.members[rb]
+        self.anchored[ra] = self.anchored[ra] or self.anchored[rb]
+
+    def anchor(self, v: int) -> None:
+        root = self.find(v)
+        if not self.anchored[root]:
+            self.anchored[root] = True
+            self.network |= self.members[root]
+
+    def reset(self, mask: int) -> None:
+        """Split every vertex in `mask` back into its own singleton set."""
+        for v in iter_bits(mask):
+            self.parent[v] = v
+            self.size[v] = 1
+            self.members[v] = 1 << v
+            self.anchored[v] = False
+        self.network &= ~mask
+
+
+class NetworkIndex:
+    """Per-player `PlayerNetwork`s, kept current by `BoardCore`."""
+
+    def __init__(self, topology: BoardTopology, bits: Bitboards):
+        self.topology = topology
+        self.bits = bits
+        self.players: Dict[int, PlayerNetwork] = {}
+
+    def copy(self, bits: Bitboards) -> "NetworkIndex":
+        """Independent copy reading from `bits` (the cloned board's bitboards)."""
+        clone = NetworkIndex(self.topology, bits)
+        clone.players = {pid: player.copy() for pid, player in self.players.items()}
+        return clone
+
+    # Queries
+
+    def network(self, player_id: int) -> int:
+        """Bit mask of every vertex connected to one of the player's buildings."""
+        player = self.players.get(player_id)
+        return player.network if player is not None else 0
+
+    def is_connected(self, player_id: int, v: int) -> bool:
+        return bool((self.network(player_id) >> v) & 1)
+
+    # Updates (called by BoardCore after the bitboards changed)
+
+    def building_placed(self, v: int, player_id: int) -> None:
+        """A settlement/city of player_id now stands on v."""
+        self._player(player_id).anchor(v)
+        # Opponents whose roads run through v are cut there
+        for other_id, other in self.players.items():
+            if other_id != player_id and self.bits.touches_own_road(other_id, v):
+                self._rebuild_component(other_id, other, other.find(v))
+
+    def road_placed(self, e: int, player_id: int) -> None:
+        a, b = self.topology.edge_v1[e], self.topology.edge_v2[e]
+        if not self._cut(player_id, a) and not self._cut(player_id, b):
+            self._player(player_id).union(a, b)
+
+    def building_cleared(self, v: int) -> None:
+        self._rebuild_all()
+
+    def road_cleared(self, e: int) -> None:
+        self._rebuild_all()
+
+    # Rebuilds
+
+    def _player(self, player_id: int) -> PlayerNetwork:
+        player = self.players.get(player_id)
+        if player is None:
+            player = self.players[player_id] = PlayerNetwork(self.topology.num_vertices)
+        return player
+
+    def _cut(self, player_id: int, v: int) -> bool:
+        """True if an opponent has built on v."""
+        return bool(((self.bits.occupied & ~self.bits.buildings(player_id)) >> v) & 1)
+
+    def _rebuild_component(self, player_id: int, player: PlayerNetwork, root: int) -> None:
+        """Re-link one component from scratch, e.g. after an opponent cut it."""
+        mask = player.members[root]
+        player.reset(mask)
+        self._link(player_id, player, mask)
+
+    def _rebuild_all(self) -> None:
+        for player_id, player in self.players.items():
+            player.reset(self.topology.all_vertices_mask)
+            self._link(player_id, player, self.topology.all_vertices_mask)
+
+    def _link(self, player_id: int, player: PlayerNetwork, mask: int) -> None:
+        """Union the player's roads inside `mask` and anchor their buildings there."""
+        bits = self.bits
+        edge_vertex = self.topology.edge_vertex_mask
+        cut = bits.occupied & ~bits.buildings(player_id)
+        open_mask = mask & ~cut
+        edge_v1, edge_v2 = self.topology.edge_v1, self.topology.edge_v2
+        for e in iter_bits(bits.roads.get(player_id, 0)):
+            if edge_vertex[e] & ~open_mask == 0:
+                player.union(edge_v1[e], edge_v2[e])
+        for v in iter_bits(bits.buildings(player_id) & mask):
+            player.anchor(v)
@@ -0,0 +1,161 @@
+"""
+Per-vertex production cache: pips, resource sets and expected income.
+
+Every settlement heuristic asks the same questions about a vertex - how
+often do its hexes roll, which resources do they give, what does that come
+to per turn - and the answers only depend on the hex numbers (fixed once
+the board is built) and on where the robber sits. This cache answers them
+from flat tables indexed like the board core:
+
+- `pips[v]`: dice combinations (out of 36) of the producing hexes around v,
+  robber hex excluded
+- `income[v]`: expected cards per roll by resource (pips / 36), robber excluded
+- `resource_sets[v]` / `resource_counts[v]`: which resources touch v (static)
+
+Only a robber move changes anything, and it only touches the 6 corners of
+the old and new robber hexes, so `move_robber` refreshes those 12 entries.
+`GameState.move_robber` keeps the board's cache in sync.
+
+Algorithms referenced:
+- Precomputed lookup tables with targeted invalidation.
+
+Method time complexities:
+- `PipCache(board)`: `O(V + H)` once per board.
+- `pips_of` / `income_of` / `resources_of` / `settlement_score`: `O(1)`.
+- `move_robber`: `O(1)` (two hexes x 6 corners x ≤3 hexes each).
+- `resource_pips`: `O(H)`.
+- `copy`: `O(V)` list slices.
+"""
+
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from .enums import Resource
+
+if TYPE_CHECKING:
+    from .board import BoardGraph
+
+# Number of dice combinations (out of 36) that roll each chit number
+DICE_PIPS = {2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 8: 5, 9: 4, 10: 3, 11: 2, 12: 1}
+
+# _score_settlement_location weights
+HEX_SCORE = 1
+PREFERRED_HEX_SCORE = 3
+DIVERSITY_SCORE = 2
+
+
+class PipCache:
+    """Production figures for every vertex of one board."""
+
+    def __init__(self, board: "BoardGraph", robber_hex_id: Optional[int] = None):
+        core = board.core
+        self.board = board
+        self.vertex_index = core.vertex_index
+        self.vertex_hexes = core.topology.vertex_hexes
+        self.robber_hex_id = robber_hex_id
+
+        # Step 1: Per-hex figures (static)
+        self.hex_pips: Dict[int, int] = {}
+        self.hex_resource: Dict[int, Optional[Resource]] = {}
+        for hex_id, hex_tile in board.hexes.items():
+            producing = hex_tile.resource is not None and hex_tile.resource != Resource.DESERT
+            self.hex_resource[hex_id] = hex_tile.resource if producing else None
+            self.hex_pips[hex_id] = DICE_PIPS.get(hex_tile.number, 0) if producing else 0
+
+        # Step 2: Per-vertex resource tables (static)
+        resource_counts: List[Tuple[Tuple[Resource, int], ...]] = []
+        for hexes in self.vertex_hexes:
+            counts: Dict[Resource, int] = {}
+            for hex_id in hexes:
+                resource = self.hex_resource.get(hex_id)
+                if resource is not None:
+                    counts[resource] = counts.get(resource, 0) + 1
+            resource_counts.append(tuple(counts.items()))
+        self.resource_counts: Tuple[Tuple[Tuple[Resource, int], ...], ...] = tuple(resource_counts)
+        self.resource_sets: Tuple[FrozenSet[Resource], ...] = tuple(
+            frozenset(res for res, _ in counts) for counts in resource_counts
+        )
+        # Score with no preferred resources: 1 per producing hex + 2 per distinct resource
+        self.base_scores: Tuple[int, ...] = tuple(
+            sum(n for _, n in counts) * HEX_SCORE + len(counts) * DIVERSITY_SCORE
+            for counts in resource_counts
+        )
+
+        # Step 3: Robber-dependent tables
+        self.pips: List[int] = [0] * len(self.vertex_hexes)
+        self.income: List[Dict[Resource, float]] = [{} for _ in self.vertex_hexes]
+        for v in range(len(self.vertex_hexes)):
+            self._refresh(v)
+
+    def copy(self, board: "BoardGraph") -> "PipCache":
+        """
+        Independent copy for a clone of this cache's board.
+
+        The per-hex and per-vertex resource tables are static and shared;
+        only the robber-dependent tables are copied (`_refresh` replaces
+        income dicts rather than editing them, so a shallow copy is enough).
+        """
+        clone = PipCache.__new__(PipCache)
+        clone.__dict__.update(self.__dict__)
+        clone.board = board
+        clone.pips = self.pips[:]
+        clone.income = self.income[:]
+        return clone
+
+    # Lookups by vertex name
+
+    def pips_of(self, vertex_id: str) -> int:
+        return self.pips[self.vertex_index[vertex_id]]
+
+    def income_of(self, vertex_id: str) -> Dict[Resource, float]:
+        return self.income[self.vertex_index[vertex_id]]
+
+    def resources_of(self, vertex_id: str) -> FrozenSet[Resource]:
+        return self.resource_sets[self.vertex_index[vertex_id]]
+
+    def settlement_score(self, vertex_id: str, preferred_resources: Optional[Sequence[Resource]] = None) -> int:
+        """
+        Resource score used by BuildingService: 1 per adjacent producing hex
+        (3 if its resource is preferred) plus 2 per distinct resource.
+        """
+        v = self.vertex_index[vertex_id]
+        score = self.base_scores[v]
+        if preferred_resources:
+            bonus = PREFERRED_HEX_SCORE - HEX_SCORE
+            for resource, count in self.resource_counts[v]:
+                if resource in preferred_resources:
+                    score += bonus * count
+        return score
+
+    def resource_pips(self) -> Dict[Resource, int]:
+        """Total pips on the board per resource, robber hex excluded."""
+        totals: Dict[Resource, int] = {}
+        for hex_id, resource in self.hex_resource.items():
+            if resource is not None and hex_id != self.robber_hex_id:
+                totals[resource] = totals.get(resource, 0) + self.hex_pips[hex_id]
+        return totals
+
+    # Invalidation
+
+    def move_robber(self, hex_id: Optional[int]) -> None:
+        """Refresh only the corners of the old and new robber hexes."""
+        if hex_id == self.robber_hex_id:
+            return
+        old_hex_id, self.robber_hex_id = self.robber_hex_id, hex_id
+        for changed in (old_hex_id, hex_id):
+            if changed is None or changed not in self.board.hexes:
+                continue
+            for vertex_id in self.board.vertices_of_hex(changed):
+                self._refresh(self.vertex_index[vertex_id])
+
+    def _refresh(self, v: int) -> None:
+        pips = 0
+        income: Dict[Resource, float] = {}
+        for hex_id in self.vertex_hexes[v]:
+            resource = self.hex_resource.get(hex_id)
+            if resource is None or hex_id == self.robber_hex_id:
+                continue
+            hex_pips = self.hex_pips[hex_id]
+            pips += hex_pips
+            income[resource] = income.get(resource, 0.0) + hex_pips / 36
+        self.pips[v] = pips
+        self.income[v] = income
@@ -0,0 +1,202 @@
+"""
+Static board topology, computed once and shared by every board.
+
+The shape of a Catan board never changes between games - only the resources,
+chits and ownership do. Everything that can be derived from `catan_graph` and
+`HEX_LAYOUT` alone lives here: the edge list, vertex -> edges, hex -> vertices,
+vertex -> hexes and the distance-rule neighbourhoods. `board.py` builds the
+standard topology once at import (`STANDARD_TOPOLOGY`) and every call site
+reads from it instead of rescanning vertices.
+
+Method time complexities:
+- `topology_from_layout`: `O(V + E + H)`, run once per process.
+- `topology_from_board`: `O(V + E + H)`, only for hand-built boards.
+- All lookups on `BoardTopology`: `O(1)`, they return cached tuples/arrays/masks.
+"""
+
+from array import array
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Mapping, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .board import BoardGraph
+
+NO_INDEX = -1  # padding for unused adjacency slots
+MAX_DEGREE = 3  # a Catan vertex touches at most 3 edges
+HEX_CORNERS = 6
+
+
+@dataclass(frozen=True)
+class BoardTopology:
+    """
+    Immutable lookup tables for one board shape.
+
+    Vertex indices are dense (0..V-1), edge indices are the edge IDs (0..E-1)
+    and hex indices are the hex IDs (0..H-1). The `array` fields are flat,
+    fixed-width tables meant to be read only.
+    """
+    vertex_names: Tuple[str, ...]
+    vertex_index: Mapping[str, int]
+    edge_vertices: Tuple[Tuple[str, str], ...]  # edge id -> (v1, v2) names
+
+    # Flat integer tables
+    edge_v1: array
+    edge_v2: array
+    degree: array
+    adjacent_edges: array  # slot [v * MAX_DEGREE + k] -> k-th edge of v
+    adjacent_vertices: array  # slot [v * MAX_DEGREE + k] -> vertex across that edge
+    hex_vertices: array  # slot [h * HEX_CORNERS + k] -> k-th corner of hex h
+
+    # Per-index tuples so iteration never allocates
+    vertex_edges: Tuple[Tuple[int, ...], ...]
+    vertex_neighbours: Tuple[Tuple[int, ...], ...]
+    vertex_neighbour_names: Tuple[Tuple[str, ...], ...]
+    vertex_hexes: Tuple[Tuple[int, ...], ...]
+    hex_vertex_names: Tuple[Tuple[str, ...], ...]  # hex id -> corner names
+
+    # Distance-rule neighbourhoods
+    closed_neighbourhood: Tuple[Tuple[int, ...], ...]  # v plus its neighbours (what the distance rule checks)
+    two_hop: Tuple[Tuple[int, ...], ...]  # every vertex within 2 edges of v, excluding v
+
+    # Bit masks for the bitboard layer (bit i = vertex i / edge i)
+    all_vertices_mask: int
+    all_edges_mask: int
+    closed_neighbourhood_mask: Tuple[int, ...]  # vertex -> bits of v and its neighbours
+    vertex_edge_mask: Tuple[int, ...]  # vertex -> bits of its edges
+    edge_vertex_mask: Tuple[int, ...]  # edge -> bits of its two endpoints
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.vertex_names)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.edge_vertices)
+
+    @property
+    def num_hexes(self) -> int:
+        return len(self.hex_vertex_names)
+
+
+def _build_topology(
+    vertex_names: Sequence[str],
+    edge_vertices: Sequence[Tuple[str, str]],
+    hex_vertex_names: Sequence[Sequence[str]],
+) -> BoardTopology:
+    vertex_names = tuple(vertex_names)
+    index = {name: i for i, name in enumerate(vertex_names)}
+    num_vertices = len(vertex_names)
+
+    edge_v1 = array("b", (index[a] for a, _ in edge_vertices))
+    edge_v2 = array("b", (index[b] for _, b in edge_vertices))
+
+    degree = array("b", [0] * num_vertices)
+    adjacent_edges = array("b", [NO_INDEX] * (num_vertices * MAX_DEGREE))
+    adjacent_vertices = array("b", [NO_INDEX] * (num_vertices * MAX_DEGREE))
+    for e in range(len(edge_vertices)):
+        a, b = edge_v1[e], edge_v2[e]
+        for v, other in ((a, b), (b, a)):
+            slot = v * MAX_DEGREE + degree[v]
+            adjacent_edges[slot] = e
+            adjacent_vertices[slot] = other
+            degree[v] += 1
+
+    hex_vertices = array("b", [NO_INDEX] * (len(hex_vertex_names) * HEX_CORNERS))
+    hexes_of: List[List[int]] = [[] for _ in range(num_vertices)]
+    for h, corners in enumerate(hex_vertex_names):
+        for k, name in enumerate(corners):
+            hex_vertices[h * HEX_CORNERS + k] = index[name]
+            hexes_of[index[name]].append(h)
+
+    vertex_edges = tuple(
+        tuple(adjacent_edges[v * MAX_DEGREE:v * MAX_DEGREE + degree[v]]) for v in range(num_vertices)
+    )
+    vertex_neighbours = tuple(
+        tuple(adjacent_vertices[v * MAX_DEGREE:v * MAX_DEGREE + degree[v]]) for v in range(num_vertices)
+    )
+
+    two_hop = []
+    for v in range(num_vertices):
+        reach = set(vertex_neighbours[v])
+        for n in vertex_neighbours[v]:
+            reach.update(vertex_neighbours[n])
+        reach.discard(v)
+        two_hop.append(tuple(sorted(reach)))
+
+    closed_neighbourhood = tuple((v,) + vertex_neighbours[v] for v in range(num_vertices))
+
+    return BoardTopology(
+        vertex_names=vertex_names,
+        vertex_index=MappingProxyType(index),
+        edge_vertices=tuple((a, b) for a, b in edge_vertices),
+        edge_v1=edge_v1,
+        edge_v2=edge_v2,
+        degree=degree,
+        adjacent_edges=adjacent_edges,
+        adjacent_vertices=adjacent_vertices,
+        hex_vertices=hex_vertices,
+        vertex_edges=vertex_edges,
+        vertex_neighbours=vertex_neighbours,
+        vertex_neighbour_names=tuple(
+            tuple(vertex_names[n] for n in nbrs) for nbrs in vertex_neighbours
+        ),
+        vertex_hexes=tuple(tuple(hs) for hs in hexes_of),
+        hex_vertex_names=tuple(tuple(corners) for corners in hex_vertex_names),
+        closed_neighbourhood=closed_neighbourhood,
+        two_hop=tuple(two_hop),
+        all_vertices_mask=(1 << num_vertices) - 1,
+        all_edges_mask=(1 << len(edge_vertices)) - 1,
+        closed_neighbourhood_mask=tuple(_mask(vs) for vs in closed_neighbourhood),
+        vertex_edge_mask=tuple(_mask(es) for es in vertex_edges),
+        edge_vertex_mask=tuple(
+            (1 << edge_v1[e]) | (1 << edge_v2[e]) for e in range(len(edge_vertices))
+        ),
+    )
+
+
+def _mask(indices: Sequence[int]) -> int:
+    mask = 0
+    for i in indices:
+        mask |= 1 << i
+    return mask
+
+
+def topology_from_layout(
+    graph: Dict[str, List[str]],
+    hex_layout: Dict[int, Tuple[str, ...]],
+) -> BoardTopology:
+    """
+    Derive the topology from an adjacency list and a hex layout.
+    Edges are numbered in the order they are first seen in `graph`,
+    which is the numbering `build_catan_board` has always used.
+    """
+    edge_vertices: List[Tuple[str, str]] = []
+    seen_edges = set()
+    for v1, neighbours in graph.items():
+        for v2 in neighbours:
+            edge_key = tuple(sorted((v1, v2)))
+            if edge_key not in seen_edges:
+                seen_edges.add(edge_key)
+                edge_vertices.append((v1, v2))
+
+    hex_vertex_names = [hex_layout[h] for h in sorted(hex_layout)]
+    return _build_topology(list(graph.keys()), edge_vertices, hex_vertex_names)
+
+
+def topology_from_board(board: "BoardGraph") -> BoardTopology:
+    """Derive a topology from a hand-built BoardGraph (edge IDs must be 0..E-1)."""
+    edge_ids = sorted(board.edges.keys())
+    if edge_ids != list(range(len(edge_ids))):
+        raise ValueError("BoardTopology expects edge IDs numbered 0..E-1")
+
+    corners: Dict[int, List[str]] = {hid: [] for hid in range(len(board.hexes))}
+    for name, vertex in board.vertices.items():
+        for hid in vertex.hex_ids:
+            corners[hid].append(name)
+
+    return _build_topology(
+        list(board.vertices.keys()),
+        [(board.edges[e].v1, board.edges[e].v2) for e in edge_ids],
+        [corners[hid] for hid in range(len(board.hexes))],
+    )
@@ -0,0 +1,150 @@
+"""
+Zobrist hashing of a game position.
+
+Every piece of state gets a fixed pseudo-random 64-bit key, and a position's
+hash is the XOR of the keys of everything in it:
+
+- (vertex, owner, is_city) for each building
+- (edge, owner) for each road
+- (player, resource, count) for each non-empty hand entry
+- the robber hex and the player to move
+
+Because XOR is its own inverse, a change is "XOR the old key out, XOR the
+new key in" - O(1) no matter how big the position is. `GameState` keeps one
+`ZobristHash` current through the board's ownership listeners and each
+player's `on_resource_change` hook (fired by `Player.set_resource`, which
+`add_resource`, `remove_resource` and the turn engine's `ResourceView` go
+through). The robber hex and player to move are single values, so they are
+folded in when the hash is read.
+
+Keys come from SplitMix64 over the piece's coordinates, not from Python's
+`hash()`, so the same position hashes the same in every process - which is
+what transposition tables and self-play dataset deduplication need.
+
+Algorithms referenced:
+- Zobrist hashing (incremental XOR of per-feature random keys).
+- SplitMix64 as a stateless key generator.
+
+Method time complexities:
+- `vertex_changed` / `edge_changed` / `hand_changed`: `O(1)`.
+- `value`: `O(1)`.
+- `copy`: `O(V + E)` list slices.
+- `recompute`: `O(V + E + P * R)`, for checks and resyncs.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional
+
+from .enums import Resource
+
+if TYPE_CHECKING:
+    from .game import GameState
+
+_MASK64 = (1 << 64) - 1
+
+# Feature tags, so e.g. vertex 3 and edge 3 never share a key
+_VERTEX = 1
+_EDGE = 2
+_HAND = 3
+_ROBBER = 4
+_TO_MOVE = 5
+
+_RESOURCE_INDEX = {resource: i for i, resource in enumerate(Resource)}
+
+
+def _splitmix64(x: int) -> int:
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+@lru_cache(maxsize=None)
+def zobrist_key(tag: int, a: int, b: int = 0, c: int = 0) -> int:
+    """Fixed 64-bit key for one feature, identical in every process."""
+    return _splitmix64(_splitmix64(_splitmix64(_splitmix64(tag) ^ a) ^ b) ^ c)
+
+
+def _building_key(v: int, owner: Optional[int], is_city: bool) -> int:
+    return 0 if owner is None else zobrist_key(_VERTEX, v, owner, int(is_city))
+
+
+def _road_key(e: int, owner: Optional[int]) -> int:
+    return 0 if owner is None else zobrist_key(_EDGE, e, owner)
+
+
+def _hand_key(player_id: int, resource: Resource, count: int) -> int:
+    return 0 if count == 0 else zobrist_key(_HAND, player_id, _RESOURCE_INDEX[resource], count)
+
+
+class ZobristHash:
+    """Incrementally maintained Zobrist hash of one `GameState`."""
+
+    def __init__(self, game: "GameState"):
+        self.game = game
+        core = game.board.core
+        self.vertex_index = core.vertex_index
+        # Current key of each vertex / edge, so a change knows what to XOR out
+        self._vertex_keys: List[int] = [0] * core.num_vertices
+        self._edge_keys: List[int] = [0] * core.num_edges
+        self._pieces = 0  # XOR of buildings, roads and hands
+        self.recompute()
+
+    def copy(self, game: "GameState") -> "ZobristHash":
+        """Same hash for `game`, a clone of this hash's game (no recompute)."""
+        clone = ZobristHash.__new__(ZobristHash)
+        clone.game = game
+        clone.vertex_index = self.vertex_index
+        clone._vertex_keys = self._vertex_keys[:]
+        clone._edge_keys = self._edge_keys[:]
+        clone._pieces = self._pieces
+        return clone
+
+    @property
+    def value(self) -> int:
+        """Hash of the whole position, robber and player to move included."""
+        game = self.game
+        return (
+            self._pieces
+            ^ zobrist_key(_ROBBER, game.robber_hex_id)
+            ^ zobrist_key(_TO_MOVE, game.current_player_idx)
+        )
+
+    # Incremental updates
+
+    def vertex_changed(self, vertex_id: str, owner: Optional[int], is_city: bool) -> None:
+        v = self.vertex_index[vertex_id]
+        key = _building_key(v, owner, is_city)
+        self._pieces ^= self._vertex_keys[v] ^ key
+        self._vertex_keys[v] = key
+
+    def edge_changed(self, e: int, owner: Optional[int]) -> None:
+        key = _road_key(e, owner)
+        self._pieces ^= self._edge_keys[e] ^ key
+        self._edge_keys[e] = key
+
+    def hand_changed(self, player_id: int, resource: Resource, old: int, new: int) -> None:
+        self._pieces ^= _hand_key(player_id, resource, old) ^ _hand_key(player_id, resource, new)
+
+    # Full rebuild
+
+    def recompute(self) -> int:
+        """Rebuild from scratch (e.g. after writing a hand without `set_resource`)."""
+        game = self.game
+        core = game.board.core
+        pieces = 0
+        for v in range(core.num_vertices):
+            owner = core.vertex_owner[v]
+            key = _building_key(v, None if owner < 0 else owner, bool(core.vertex_is_city[v]))
+            self._vertex_keys[v] = key
+            pieces ^= key
+        for e in range(core.num_edges):
+            owner = core.edge_owner[e]
+            key = _road_key(e, None if owner < 0 else owner)
+            self._edge_keys[e] = key
+            pieces ^= key
+        for player in game.players:
+            for resource, count in player.resources.items():
+                pieces ^= _hand_key(player.id, resource, count)
+        self._pieces = pieces
+        return self.value
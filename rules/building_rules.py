@@ -3,19 +3,22 @@ Building rules for roads and settlements during the main game.
 
 Algorithms referenced:
 - Constant-time resource checks via dict lookups.
-- Local adjacency scans (`O(deg(v))`) for connectivity and distance rule
-  enforcement.
+- Bitboard ownership (`model/bitboard.py`) so connectivity and the distance
+  rule are a couple of AND/OR operations.
 
 Method time complexities:
-- `can_build_road`: `O(deg(v1) + deg(v2))` to inspect adjacent edges.
-- `can_build_settlement`: `O(deg(vertex))` dominated by distance/road checks.
+- `can_build_road`: `O(1)` bitboard checks on both endpoints.
+- `can_build_settlement`: `O(1)` distance/road checks.
 - `can_upgrade_to_city`: `O(1)` because it only inspects the target vertex.
-- `_is_vertex_connected_to_player`: `O(deg(vertex))`.
-- `_is_vertex_connected_by_road`: `O(deg(vertex))`.
-- `_check_distance_rule`: `O(deg(vertex))` since it visits neighbors once.
+- `legal_settlement_vertices`: `O(1)` plus `O(B)` to list results.
+- `legal_road_edges`: `O(N)` over network vertices plus `O(R)` to list results.
+- `_is_vertex_connected_to_player`: `O(1)`.
+- `_is_vertex_connected_by_road`: `O(1)`.
+- `_check_distance_rule`: `O(1)`.
 
 Rule recap:
-- Roads must connect to existing infrastructure, be unoccupied, and require
+- Roads must connect to the player's settlement/city or to one of their roads
+  (not through an opponent's settlement), be unoccupied, and require
   1 Lumber + 1 Brick.
 - Settlements must obey the distance rule, be road-connected, and cost 1 each of
   Lumber, Brick, Grain, and Wool.
@@ -23,12 +26,23 @@ Rule recap:
   supply.
 """
 
-from typing import Tuple, Optional, TYPE_CHECKING
-from ..model.board import BoardGraph, Vertex, Edge
-from ..model.enums import Resource
+from typing import List, Tuple, Optional, TYPE_CHECKING
+from model.board import BoardGraph, Vertex, Edge
+from model.bitboard import iter_bits
+from model.enums import Resource
 
 if TYPE_CHECKING:
-    from ..model.game import GameState, Player
+    from model.game import GameState, Player
+
+# Build costs, shared by the rules and the building service
+ROAD_COST = {Resource.LUMBER: 1, Resource.BRICK: 1}
+SETTLEMENT_COST = {
+    Resource.LUMBER: 1,
+    Resource.BRICK: 1,
+    Resource.GRAIN: 1,
+    Resource.WOOL: 1
+}
+CITY_COST = {Resource.GRAIN: 2, Resource.ORE: 3}
 
 
 class BuildingRules:
@@ -60,8 +74,7 @@ class BuildingRules:
         
         # Check if player has enough resources
         player = self.game.players[player_id]
-        road_cost = {Resource.LUMBER: 1, Resource.BRICK: 1}
-        if not player.has_resources(road_cost):
+        if not player.has_resources(ROAD_COST):
             return False, "Insufficient resources (need 1 Lumber + 1 Brick)"
         
         # Check if player has roads remaining
@@ -103,13 +116,7 @@ class BuildingRules:
         
         # Check if player has enough resources
         player = self.game.players[player_id]
-        settlement_cost = {
-            Resource.LUMBER: 1,
-            Resource.BRICK: 1,
-            Resource.GRAIN: 1,
-            Resource.WOOL: 1
-        }
-        if not player.has_resources(settlement_cost):
+        if not player.has_resources(SETTLEMENT_COST):
             return False, "Insufficient resources (need 1 Lumber + 1 Brick + 1 Grain + 1 Wool)"
         
         # Check if player has settlements remaining
@@ -148,8 +155,7 @@ class BuildingRules:
         
         # Check if player has enough resources
         player = self.game.players[player_id]
-        city_cost = {Resource.GRAIN: 2, Resource.ORE: 3}
-        if not player.has_resources(city_cost):
+        if not player.has_resources(CITY_COST):
             return False, "Insufficient resources (need 2 Grain + 3 Ore)"
         
         # Check if player has cities remaining
@@ -158,75 +164,62 @@ class BuildingRules:
         
         return True, "Valid city upgrade"
     
+    def legal_settlement_vertices(self, player_id: int) -> List[str]:
+        """
+        Every vertex where the player could place a settlement right now,
+        ignoring resources and piece supply.
+        
+        Time Complexity: O(1) frontier read + O(B) to list the B results
+        """
+        names = self.board.core.vertex_names
+        return [names[v] for v in iter_bits(self.board.core.moves.legal_settlements(player_id))]
+    
+    def legal_road_edges(self, player_id: int) -> List[int]:
+        """
+        Every empty edge touching the player's network, ignoring resources
+        and piece supply.
+        
+        Time Complexity: O(1) frontier read + O(R) to list the results
+        """
+        return list(iter_bits(self.board.core.moves.legal_roads(player_id)))
+    
     def _is_vertex_connected_to_player(self, player_id: int, vertex_id: str) -> bool:
         """
         Check if a vertex is connected to the player's network.
         A vertex is connected if:
         - It has a settlement/city owned by the player, OR
-        - It's connected by a road owned by the player to such a vertex
+        - One of the player's roads ends there and no opponent has built on it
         
-        Time Complexity: O(deg(v)) where deg(v) = vertex degree (typically 2-3 in Catan)
-        - Graph traversal through adjacent edges
+        Time Complexity: O(1) - one bitboard AND (see model/bitboard.py)
         - Space: O(1)
         """
-        vertex = self.board.vertices.get(vertex_id)
-        if not vertex:
+        v = self.board.core.vertex_index.get(vertex_id)
+        if v is None:
             return False
-        
-        # Check if player owns settlement/city at this vertex
-        if vertex.owner == player_id:
-            return True
-        
-        # Check if any adjacent edge is owned by the player
-        for edge_id in vertex.edge_ids:
-            edge = self.board.edges.get(edge_id)
-            if edge and edge.owner == player_id:
-                # Check if the other end has a settlement/city
-                other_vertex_id = self.board.other_end(edge_id, vertex_id)
-                other_vertex = self.board.vertices.get(other_vertex_id)
-                if other_vertex and other_vertex.owner == player_id:
-                    return True
-        
-        return False
+        return self.board.core.bits.is_on_network(player_id, v)
     
     def _is_vertex_connected_by_road(self, player_id: int, vertex_id: str) -> bool:
         """
         Check if a vertex is connected by at least one road owned by the player.
         
-        Time Complexity: O(deg(v)) - checks adjacent edges
-        - Graph traversal through vertex edge list
+        Time Complexity: O(1) - one bit test on the player's road-vertex mask
         - Space: O(1)
         """
-        vertex = self.board.vertices.get(vertex_id)
-        if not vertex:
+        v = self.board.core.vertex_index.get(vertex_id)
+        if v is None:
             return False
-        
-        # Check if any adjacent edge is owned by the player
-        for edge_id in vertex.edge_ids:
-            edge = self.board.edges.get(edge_id)
-            if edge and edge.owner == player_id:
-                return True
-        
-        return False
+        return self.board.core.bits.touches_own_road(player_id, v)
     
     def _check_distance_rule(self, vertex_id: str) -> bool:
         """
         Check the distance rule: no settlement/city within 2 edges.
         This means no adjacent vertex can have a settlement/city.
         
-        Time Complexity: O(deg(v)) - visits all neighbor vertices once
-        - Graph traversal through neighbors
+        Time Complexity: O(1) - the bitboards keep a mask of every vertex
+        blocked by an existing settlement/city and its neighbours
         - Space: O(1)
         """
-        vertex = self.board.vertices.get(vertex_id)
-        if not vertex:
+        v = self.board.core.vertex_index.get(vertex_id)
+        if v is None:
             return False
-        
-        # Check all adjacent vertices (1 edge away)
-        for neighbor_id in self.board.neighbors(vertex_id):
-            neighbor = self.board.vertices.get(neighbor_id)
-            if neighbor and neighbor.owner is not None:
-                return False
-        
-        return True
-
+        return self.board.core.bits.distance_ok(v)
@@ -1,2 +1,2 @@
-# Search package - Pathfinding algorithms (BFS, DFS, shortest path)
+# Search package - Pathfinding algorithms (shortest path, network connectivity)
 
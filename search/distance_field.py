@@ -0,0 +1,155 @@
+"""
+Cached road-distance fields: how many roads each player needs to reach every vertex.
+
+CPU road planning keeps asking "how many roads to get to X" for many X.
+Instead of one shortest-path search per question, a single multi-source
+0-1 BFS from the player's whole network (see `model/network_index.py`)
+labels every vertex at once:
+
+- `distance[v]`: roads still to build to reach v (0 on the network,
+  `UNREACHABLE` if opponents' roads and buildings wall it off)
+- `parent_edge[v]`: the edge v was reached by, so the path to any vertex
+  can be rebuilt without searching again
+
+Own roads cost 0, empty edges 1, opponents' roads are impassable, and a
+path may end on an opponent's building but not pass through it. The
+sources are the anchored network (`NetworkIndex`, the same vertices
+`Pathfinding.get_player_connected_vertices` lists), so this field and the
+one-off Dijkstra / 0-1 BFS searches give the same distances. A road
+fragment an opponent's building has cut off from every own building is
+still legal to extend (`Bitboards.network`) but is not a source here.
+
+Each field is cached per player and tagged with the board's ownership
+version (`BoardGraph.version`, bumped by every `set_vertex_owner` /
+`set_edge_owner`). A placement invalidates the fields; rolls, trades and
+robber moves do not.
+
+Algorithms referenced:
+- Multi-source 0-1 BFS (deque, parent pointers).
+- Memoisation keyed on a monotonically increasing state version.
+
+Method time complexities:
+- `distances`: `O(V + E)` on a cache miss, `O(1)` otherwise.
+- `distance_to` / `site_distances`: `O(k)` for k vertices after the field is built.
+- `nearest`: `O(k)` over the candidate vertices.
+- `path_to`: `O(path length)`.
+"""
+
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from model.bitboard import iter_bits
+from model.board_core import NO_OWNER
+
+if TYPE_CHECKING:
+    from model.board import BoardGraph
+
+UNREACHABLE = 255  # fits the bytearray; no Catan path is that long
+NO_PARENT = -1
+
+
+class RoadDistanceField:
+    """Per-player road-distance fields over one board, rebuilt lazily after ownership changes."""
+
+    def __init__(self, board: "BoardGraph"):
+        self.board = board
+        self._fields: Dict[int, Tuple[int, bytearray, array]] = {}  # player -> (version, distance, parent_edge)
+
+    # Vectorised queries
+
+    def distances(self, player_id: int) -> bytearray:
+        """Roads needed to reach every vertex (indexed by board-core vertex index)."""
+        return self._field(player_id)[0]
+
+    def distance_to(self, player_id: int, vertices: Iterable[int]) -> List[int]:
+        """Roads needed for each of `vertices`, in order."""
+        distance = self.distances(player_id)
+        return [distance[v] for v in vertices]
+
+    def site_distances(self, player_id: int) -> Dict[int, int]:
+        """
+        Roads needed to reach every vertex that passes the distance rule.
+        0 means the player can settle there now (if they can pay).
+        """
+        distance = self.distances(player_id)
+        sites = self.board.core.bits.legal_initial_settlements()
+        return {v: distance[v] for v in iter_bits(sites) if distance[v] != UNREACHABLE}
+
+    def nearest(self, player_id: int, vertices: Iterable[int]) -> Optional[int]:
+        """The closest of `vertices` (first one on ties), or None if none is reachable."""
+        distance = self.distances(player_id)
+        best, best_distance = None, UNREACHABLE
+        for v in vertices:
+            if distance[v] < best_distance:
+                best, best_distance = v, distance[v]
+        return best
+
+    def path_to(self, player_id: int, v: int) -> Optional[List[int]]:
+        """Edges to build, nearest the network first, to reach v (None if unreachable)."""
+        distance, parent_edge = self._field(player_id)
+        if distance[v] == UNREACHABLE:
+            return None
+        core = self.board.core
+        path_edges: List[int] = []
+        while parent_edge[v] != NO_PARENT:
+            edge_id = parent_edge[v]
+            if core.edge_owner[edge_id] != player_id:
+                path_edges.append(edge_id)
+            v = core.other_end(edge_id, v)
+        path_edges.reverse()
+        return path_edges
+
+    # Cache
+
+    def _field(self, player_id: int) -> Tuple[bytearray, array]:
+        cached = self._fields.get(player_id)
+        if cached is None or cached[0] != self.board.version:
+            distance, parent_edge = self._search(player_id)
+            cached = self._fields[player_id] = (self.board.version, distance, parent_edge)
+        return cached[1], cached[2]
+
+    def _search(self, player_id: int) -> Tuple[bytearray, array]:
+        """
+        Multi-source 0-1 BFS from every vertex of the player's anchored network.
+
+        Time Complexity: O(V + E)
+        """
+        core = self.board.core
+        topology = core.topology
+        vertex_edges, vertex_neighbours = topology.vertex_edges, topology.vertex_neighbours
+        edge_owner = core.edge_owner
+        cut = core.bits.occupied & ~core.bits.buildings(player_id)
+
+        distance = bytearray([UNREACHABLE]) * core.num_vertices
+        parent_edge = array("h", [NO_PARENT]) * core.num_vertices
+        settled = bytearray(core.num_vertices)
+
+        # Step 1: The whole network is at distance 0
+        queue = deque()
+        for v in iter_bits(core.networks.network(player_id)):
+            distance[v] = 0
+            queue.append(v)
+
+        # Step 2: Settle vertices in distance order
+        while queue:
+            current = queue.popleft()
+            if settled[current]:
+                continue
+            settled[current] = 1
+            if (cut >> current) & 1:
+                continue  # reachable, but roads can't continue past an opponent's building
+            current_distance = distance[current]
+            for edge_id, other in zip(vertex_edges[current], vertex_neighbours[current]):
+                owner = edge_owner[edge_id]
+                if owner == player_id:
+                    if current_distance < distance[other]:
+                        distance[other] = current_distance
+                        parent_edge[other] = edge_id
+                        queue.appendleft(other)
+                elif owner == NO_OWNER:
+                    if current_distance + 1 < distance[other]:
+                        distance[other] = current_distance + 1
+                        parent_edge[other] = edge_id
+                        queue.append(other)
+        return distance, parent_edge
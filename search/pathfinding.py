@@ -3,27 +3,52 @@ Pathfinding algorithms for CPU players.
 
 Algorithms referenced:
 - Dijkstra's algorithm with a binary heap priority queue (`O(E log V)`)
-- Breadth-first search for connectivity queries (`O(V + E)`)
+- 0-1 BFS with a deque and parent pointers (`O(V + E)`), since road costs
+  are only 0 (own road) or 1 (empty edge)
+- Union-find network index for connectivity queries (`model/network_index.py`)
 
 Method time complexities:
-- `shortest_path_to_resource`: `O(H * V + E log V)` combines resource scanning
-  with Dijkstra.
-- `shortest_path_to_vertex`: `O(E log V)` pure Dijkstra run.
+- `shortest_path_to_resource`: `O(H + E log V)` combines resource lookup
+  with Dijkstra (`O(H + V + E)` with 0-1 BFS).
+- `shortest_path_to_vertex`: `O(E log V)` pure Dijkstra run (`O(V + E)` with 0-1 BFS).
 - `_dijkstra_shortest_path`: `O(E log V)` explores each edge at most once.
-- `_find_vertices_with_resource`: `O(H * V)` since it scans every vertex per
-  resource hex (small constant in practice).
-- `get_player_connected_vertices`: `O(V + E)` BFS on owned roads.
-- `find_best_road_placement`: `O(E log V + H * V)` delegates to resource lookup
-  plus shortest path logic.
+- `_zero_one_bfs_shortest_path`: `O(V + E)`, one path reconstruction at the end.
+- `_find_vertices_with_resource`: `O(H)` reading hex corners from the shared
+  board topology.
+- `get_player_connected_vertices`: `O(N)` listing the N vertices of the
+  player's network from the union-find index.
+- `find_best_road_placement`: `O(H)` plus a cached distance-field read with
+  0-1 BFS (default; `O(V + E)` once per ownership change, see
+  `distance_field.py`), or `O(E log V + H)` with Dijkstra.
+- `best_expansion_sites`: `O(S log k)` over S sites from one cached
+  distance field, plus `O(k * path length)` for the winners' paths.
 - `_find_any_valid_road`: `O(E)` bounded by traversing adjacent edges from the
   player's frontier.
 """
 
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, List, NamedTuple, Tuple, Optional, Set
+from array import array
 from collections import deque
 import heapq
-from ..model.board import BoardGraph, Vertex, Edge
-from ..model.enums import Resource
+from model.bitboard import iter_bits
+from model.board import BoardGraph, Vertex, Edge
+from model.board_core import NO_OWNER
+from model.enums import Resource
+from .distance_field import RoadDistanceField
+
+# Shortest-path algorithms `find_best_road_placement` can use
+DIJKSTRA = "dijkstra"
+ZERO_ONE_BFS = "0-1 bfs"
+NO_PARENT = -1
+
+
+class SitePlan(NamedTuple):
+    """One expansion option: a settlement site and the roads that reach it."""
+    vertex_id: str
+    path_edges: List[int]  # roads to build, nearest the network first
+    cost: int  # number of roads in path_edges
+    value: float
+    ratio: float  # value / (cost + 1): the +1 is the settlement itself
 
 
 class Pathfinding:
@@ -31,27 +56,33 @@ class Pathfinding:
     
     def __init__(self, board: BoardGraph):
         self.board = board
+        # Per-player road distances from the whole network, cached per board version
+        self.distances = RoadDistanceField(board)
     
     def shortest_path_to_resource(
         self, 
         start_vertices: List[str], 
         target_resource: Resource,
-        player_id: int
+        player_id: int,
+        algorithm: str = ZERO_ONE_BFS
     ) -> Optional[Tuple[List[int], int]]:
         """
         Find the shortest path from any starting vertex to the nearest vertex
         adjacent to a hex that produces the target resource.
         
-        Uses Dijkstra's algorithm with edge weights of 1.
+        Edges cost 1 to build and 0 if the player already owns them. Paths
+        never cross an opponent's road and may end at, but not pass through,
+        an opponent's building - the same rules as `RoadDistanceField`.
         
-        Time Complexity: O(H * V + E log V)
-        - Resource scanning: O(H * V)
-        - Dijkstra: O(E log V)
+        Time Complexity: O(H + V + E) with 0-1 BFS, O(H + E log V) with Dijkstra
+        - Resource lookup: O(H)
+        - Shortest path: O(V + E) / O(E log V)
         
         Args:
             start_vertices: List of vertex IDs where the player can start building
             target_resource: The resource type to find
             player_id: ID of the player (to check existing roads)
+            algorithm: ZERO_ONE_BFS or DIJKSTRA
             
         Returns:
             Tuple of (path_edges: List[int], distance: int) or None if no path exists
@@ -63,29 +94,44 @@ class Pathfinding:
         if not target_vertices:
             return None
         
-        # Use Dijkstra's algorithm to find shortest path
-        return self._dijkstra_shortest_path(start_vertices, target_vertices, player_id)
+        return self._shortest_path(start_vertices, target_vertices, player_id, algorithm)
     
     def shortest_path_to_vertex(
         self,
         start_vertices: List[str],
         target_vertex: str,
-        player_id: int
+        player_id: int,
+        algorithm: str = ZERO_ONE_BFS
     ) -> Optional[Tuple[List[int], int]]:
         """
         Find the shortest path from any starting vertex to a target vertex.
         
-        Time Complexity: O(E log V) - pure Dijkstra run
+        Time Complexity: O(V + E) with 0-1 BFS, O(E log V) with Dijkstra
         
         Args:
             start_vertices: List of vertex IDs where the player can start building
             target_vertex: The target vertex ID
             player_id: ID of the player (to check existing roads)
+            algorithm: ZERO_ONE_BFS or DIJKSTRA
             
         Returns:
             Tuple of (path_edges: List[int], distance: int) or None if no path exists
         """
-        return self._dijkstra_shortest_path(start_vertices, [target_vertex], player_id)
+        return self._shortest_path(start_vertices, [target_vertex], player_id, algorithm)
+    
+    def _shortest_path(
+        self,
+        start_vertices: List[str],
+        target_vertices: List[str],
+        player_id: int,
+        algorithm: str
+    ) -> Optional[Tuple[List[int], int]]:
+        """Dispatch to the selected shortest-path algorithm."""
+        if algorithm == ZERO_ONE_BFS:
+            return self._zero_one_bfs_shortest_path(start_vertices, target_vertices, player_id)
+        if algorithm == DIJKSTRA:
+            return self._dijkstra_shortest_path(start_vertices, target_vertices, player_id)
+        raise ValueError(f"Unknown shortest-path algorithm: {algorithm!r}")
     
     def _dijkstra_shortest_path(
         self,
@@ -105,128 +151,200 @@ class Pathfinding:
         Returns:
             Tuple of (path_edges: List[int], distance: int) or None
         """
-        # Priority queue: (distance, current_vertex, path_edges)
+        core = self.board.core
+        vertex_index = core.vertex_index
+        edge_owner = core.edge_owner
+        cut = core.bits.occupied & ~core.bits.buildings(player_id)
+
+        # Priority queue: (distance, current_vertex_idx, path_edges)
         pq = []
-        visited = set()
-        target_set = set(target_vertices)
+        visited = bytearray(core.num_vertices)
+        is_target = bytearray(core.num_vertices)
+        for target_vertex in target_vertices:
+            if target_vertex in vertex_index:
+                is_target[vertex_index[target_vertex]] = 1
         
         # Initialize with all start vertices
         for start_vertex in start_vertices:
-            heapq.heappush(pq, (0, start_vertex, []))
+            heapq.heappush(pq, (0, vertex_index[start_vertex], []))
         
         while pq:
-            distance, current_vertex, path_edges = heapq.heappop(pq)
+            distance, current, path_edges = heapq.heappop(pq)
             
-            if current_vertex in visited:
+            if visited[current]:
                 continue
             
-            visited.add(current_vertex)
+            visited[current] = 1
             
             # Check if we reached a target
-            if current_vertex in target_set:
+            if is_target[current]:
                 return (path_edges, distance)
             
+            if (cut >> current) & 1:
+                continue  # can end at an opponent's building, not build past it
+            
             # Explore neighbors
-            for edge_id in self.board.vertices[current_vertex].edge_ids:
-                edge = self.board.edges[edge_id]
-                other_vertex = self.board.other_end(edge_id, current_vertex)
-                
-                if other_vertex in visited:
+            for edge_id, other in zip(core.edges_at(current), core.neighbours(current)):
+                if visited[other]:
                     continue
                 
                 # If edge is already owned by player, no cost
                 # Otherwise, we need to build it (cost = 1)
-                if edge.owner == player_id:
+                owner = edge_owner[edge_id]
+                if owner == player_id:
                     new_distance = distance
                     new_path = path_edges.copy()
                 else:
                     # Check if edge is available (not owned by anyone)
-                    if edge.owner is not None:
+                    if owner != NO_OWNER:
                         continue  # Can't build through opponent's road
                     new_distance = distance + 1
                     new_path = path_edges + [edge_id]
                 
-                heapq.heappush(pq, (new_distance, other_vertex, new_path))
+                heapq.heappush(pq, (new_distance, other, new_path))
+        
+        return None  # No path found
+    
+    def _zero_one_bfs_shortest_path(
+        self,
+        start_vertices: List[str],
+        target_vertices: List[str],
+        player_id: int
+    ) -> Optional[Tuple[List[int], int]]:
+        """
+        0-1 BFS from any start to any target.
+        
+        Own roads cost 0 and go to the front of the deque, empty edges cost 1
+        and go to the back, so vertices leave the deque in distance order
+        without a heap. Each vertex only stores the edge it was reached by;
+        the path is rebuilt once, from the target, at the end.
+        
+        Time Complexity: O(V + E) average and worst case
+        - Each vertex is settled once, each edge relaxed at most twice
+        - Path reconstruction: O(path length), once
+        - Space: O(V) for the distance and parent arrays
+        
+        Returns:
+            Tuple of (path_edges: List[int], distance: int) or None
+        """
+        core = self.board.core
+        vertex_index = core.vertex_index
+        edge_owner = core.edge_owner
+        num_vertices = core.num_vertices
+        vertex_edges = core.topology.vertex_edges  # plain tuple lookups, no method calls
+        vertex_neighbours = core.topology.vertex_neighbours
+        cut = core.bits.occupied & ~core.bits.buildings(player_id)
+
+        # Flat byte arrays: distances and edge IDs both fit in a byte on a Catan board
+        distance = bytearray(b"\xff") * num_vertices  # 255 = not reached yet
+        parent_edge = array("h", [NO_PARENT]) * num_vertices
+        settled = bytearray(num_vertices)
+        is_target = bytearray(num_vertices)
+        for target_vertex in target_vertices:
+            if target_vertex in vertex_index:
+                is_target[vertex_index[target_vertex]] = 1
+        
+        # Step 1: Every start vertex is at distance 0
+        queue = deque()
+        for start_vertex in start_vertices:
+            v = vertex_index[start_vertex]
+            distance[v] = 0
+            queue.append(v)
+        
+        # Step 2: Settle vertices in distance order
+        while queue:
+            current = queue.popleft()
+            if settled[current]:
+                continue
+            settled[current] = 1
+            
+            if is_target[current]:
+                return (self._reconstruct_path(current, parent_edge, player_id), distance[current])
+            
+            if (cut >> current) & 1:
+                continue  # can end at an opponent's building, not build past it
+            
+            current_distance = distance[current]
+            for edge_id, other in zip(vertex_edges[current], vertex_neighbours[current]):
+                owner = edge_owner[edge_id]
+                if owner == player_id:
+                    # Own road: same distance, front of the deque
+                    if current_distance < distance[other]:
+                        distance[other] = current_distance
+                        parent_edge[other] = edge_id
+                        queue.appendleft(other)
+                elif owner == NO_OWNER:
+                    # Empty edge: one more road to build, back of the deque
+                    if current_distance + 1 < distance[other]:
+                        distance[other] = current_distance + 1
+                        parent_edge[other] = edge_id
+                        queue.append(other)
+                # Can't build through opponent's road
         
         return None  # No path found
     
+    def _reconstruct_path(self, target: int, parent_edge: array, player_id: int) -> List[int]:
+        """
+        Walk parent pointers back from the target, keeping the edges that still need building.
+        
+        Time Complexity: O(path length)
+        """
+        core = self.board.core
+        path_edges: List[int] = []
+        v = target
+        while parent_edge[v] != NO_PARENT:
+            edge_id = parent_edge[v]
+            if core.edge_owner[edge_id] != player_id:
+                path_edges.append(edge_id)
+            v = core.other_end(edge_id, v)
+        path_edges.reverse()
+        return path_edges
+    
     def _find_vertices_with_resource(self, resource: Resource) -> List[str]:
         """
         Find all vertices that are adjacent to at least one hex producing the given resource.
         
-        Time Complexity: O(H * V) average and worst case
+        Time Complexity: O(H) average and worst case
         - H = number of hexes (19 in Catan)
-        - V = number of vertices (54 in Catan)
-        - Scans all vertices for each resource hex
+        - Hex corners come from the shared board topology, so no vertex scan
         
         Returns:
             List of vertex IDs
         """
-        target_vertices = []
-        
-        # Find all hexes with the target resource
-        resource_hexes = [
-            hex_id for hex_id, hex_tile in self.board.hexes.items()
-            if hex_tile.resource == resource
-        ]
-        
-        # Find all vertices adjacent to these hexes
-        for hex_id in resource_hexes:
-            # Get vertices from HEX_LAYOUT (we need to import it or reconstruct)
-            # For now, check all vertices
-            for vertex_id, vertex in self.board.vertices.items():
-                if hex_id in vertex.hex_ids:
-                    if vertex_id not in target_vertices:
-                        target_vertices.append(vertex_id)
+        target_vertices: List[str] = []
+        seen = set()
+        
+        for hex_id, hex_tile in self.board.hexes.items():
+            if hex_tile.resource != resource:
+                continue
+            for vertex_id in self.board.vertices_of_hex(hex_id):
+                if vertex_id not in seen:
+                    seen.add(vertex_id)
+                    target_vertices.append(vertex_id)
         
         return target_vertices
     
     def get_player_connected_vertices(self, player_id: int) -> List[str]:
         """
         Get all vertices that are connected to the player's road network.
-        This includes vertices with settlements/cities and vertices reachable by roads.
+        This includes vertices with settlements/cities and vertices reachable by roads,
+        stopping at vertices an opponent has built on.
         
-        Algorithm: Breadth-First Search (BFS)
-        Time Complexity: O(V + E) average and worst case
-        - V = vertices, E = edges
-        - Uses deque for queue operations
-        - Space: O(V) for visited set and queue
+        Algorithm: Union-find index kept by the board core (see `model/network_index.py`)
+        Time Complexity: O(1) to read the network mask, O(N) to list its N vertices
         
         Returns:
             List of vertex IDs
         """
-        connected = set()
-        queue = deque()
-        
-        # Start with vertices that have settlements/cities
-        for vertex_id, vertex in self.board.vertices.items():
-            if vertex.owner == player_id:
-                connected.add(vertex_id)
-                queue.append(vertex_id)
-        
-        # BFS to find all reachable vertices via roads
-        while queue:
-            current_vertex = queue.popleft()
-            
-            for edge_id in self.board.vertices[current_vertex].edge_ids:
-                edge = self.board.edges[edge_id]
-                
-                # Only traverse edges owned by the player
-                if edge.owner != player_id:
-                    continue
-                
-                other_vertex = self.board.other_end(edge_id, current_vertex)
-                if other_vertex not in connected:
-                    connected.add(other_vertex)
-                    queue.append(other_vertex)
-        
-        return list(connected)
+        core = self.board.core
+        return [core.vertex_names[v] for v in iter_bits(core.networks.network(player_id))]
     
     def find_best_road_placement(
         self,
         player_id: int,
         target_resource: Optional[Resource] = None,
-        target_vertex: Optional[str] = None
+        target_vertex: Optional[str] = None,
+        algorithm: str = ZERO_ONE_BFS
     ) -> Optional[int]:
         """
         Find the best edge to build a road on for the CPU player.
@@ -235,6 +353,8 @@ class Pathfinding:
             player_id: ID of the CPU player
             target_resource: Optional resource to target
             target_vertex: Optional specific vertex to target
+            algorithm: ZERO_ONE_BFS (default, read from the cached distance field)
+                or DIJKSTRA for a fresh search
             
         Returns:
             Edge ID to build on, or None if no good placement found
@@ -245,11 +365,14 @@ class Pathfinding:
         if not start_vertices:
             return None
         
+        if algorithm == ZERO_ONE_BFS and (target_resource or target_vertex):
+            return self._first_edge_from_field(player_id, target_resource, target_vertex)
+        
         # Find shortest path
         if target_resource:
-            result = self.shortest_path_to_resource(start_vertices, target_resource, player_id)
+            result = self.shortest_path_to_resource(start_vertices, target_resource, player_id, algorithm)
         elif target_vertex:
-            result = self.shortest_path_to_vertex(start_vertices, target_vertex, player_id)
+            result = self.shortest_path_to_vertex(start_vertices, target_vertex, player_id, algorithm)
         else:
             # No specific target, find any valid road placement
             return self._find_any_valid_road(player_id, start_vertices)
@@ -262,20 +385,90 @@ class Pathfinding:
         
         return None
     
+    def _first_edge_from_field(
+        self,
+        player_id: int,
+        target_resource: Optional[Resource],
+        target_vertex: Optional[str]
+    ) -> Optional[int]:
+        """
+        First road towards the target, read from the player's cached distance field.
+        
+        Time Complexity: O(1) field lookup (O(V + E) after an ownership change)
+        plus O(T) over T target vertices and O(path length) to rebuild the path
+        """
+        vertex_index = self.board.core.vertex_index
+        if target_resource:
+            targets = [vertex_index[v] for v in self._find_vertices_with_resource(target_resource)]
+            target = self.distances.nearest(player_id, targets)
+        else:
+            target = vertex_index.get(target_vertex)
+        if target is None:
+            return None
+        path_edges = self.distances.path_to(player_id, target)
+        return path_edges[0] if path_edges else None
+    
+    def best_expansion_sites(
+        self,
+        player_id: int,
+        k: int = 3,
+        site_values: Optional[Dict[str, float]] = None,
+        min_roads: int = 0
+    ) -> List[SitePlan]:
+        """
+        Rank settlement sites by value per cost and return the top k with their paths.
+        
+        One multi-source, multi-target search (the player's cached distance
+        field) prices every site on the board at once; only the k winners
+        have their paths rebuilt.
+        
+        Time Complexity: O(V + E) for the field after an ownership change
+        (O(1) when cached) + O(S log k) to rank S sites + O(k * path length)
+        
+        Args:
+            player_id: ID of the player expanding
+            k: How many options to return
+            site_values: Value per vertex ID; defaults to pips for every
+                vertex that passes the distance rule
+            min_roads: Skip sites that need fewer roads (1 = only sites a road helps reach)
+            
+        Returns:
+            Up to k SitePlans, best ratio first (ties: higher value, then vertex order)
+        """
+        core = self.board.core
+        site_distances = self.distances.site_distances(player_id)
+        
+        # Step 1: Score every reachable site from the one field
+        if site_values is None:
+            pips = self.board.pip_cache.pips
+            scored = [(pips[v], v, d) for v, d in site_distances.items() if pips[v] > 0]
+        else:
+            vertex_index = core.vertex_index
+            scored = []
+            for vertex_id, value in site_values.items():
+                v = vertex_index[vertex_id]
+                if v in site_distances:
+                    scored.append((value, v, site_distances[v]))
+        candidates = [(value / (d + 1), value, -v, d) for value, v, d in scored if d >= min_roads]
+        
+        # Step 2: Keep the k best, then rebuild only their paths
+        plans = []
+        for ratio, value, neg_v, d in heapq.nlargest(k, candidates):
+            path_edges = self.distances.path_to(player_id, -neg_v)
+            plans.append(SitePlan(core.vertex_names[-neg_v], path_edges, d, value, ratio))
+        return plans
+    
     def _find_any_valid_road(self, player_id: int, start_vertices: List[str]) -> Optional[int]:
         """
         Find any valid edge to build a road on, starting from connected vertices.
         """
+        core = self.board.core
         for vertex_id in start_vertices:
-            for edge_id in self.board.vertices[vertex_id].edge_ids:
-                edge = self.board.edges[edge_id]
+            v = core.vertex_index[vertex_id]
+            for edge_id, other in zip(core.edges_at(v), core.neighbours(v)):
                 # Check if edge is available and connects to unvisited area
-                if edge.owner is None:
-                    other_vertex = self.board.other_end(edge_id, vertex_id)
-                    # Prefer edges that lead to unoccupied vertices
-                    other_vertex_obj = self.board.vertices[other_vertex]
-                    if other_vertex_obj.owner is None:
-                        return edge_id
+                # Prefer edges that lead to unoccupied vertices
+                if core.edge_owner[edge_id] == NO_OWNER and core.vertex_owner[other] == NO_OWNER:
+                    return edge_id
         
         return None
-
@@ -3,31 +3,86 @@ Building service for roads and settlements.
 
 Algorithms referenced:
 - Rule validation delegates to local adjacency scans (`O(deg(v))`).
-- CPU road planning uses Dijkstra (`O(E log V)`) via the `Pathfinding` helper.
+- CPU road planning uses 0-1 BFS (`O(V + E)`, Dijkstra selectable) via the `Pathfinding` helper.
 - Settlement scoring leverages heuristic evaluation plus cached resource maps
   for near-constant lookups.
 
 Method time complexities:
-- `build_road`: `O(1)` beyond delegated rule checks.
-- `build_settlement`: `O(1)` beyond delegated rule checks.
+- `build_road`: `O(1)` beyond delegated rule checks and the longest-road update.
+- `build_settlement`: `O(1)` beyond delegated rule checks and the longest-road update.
 - `upgrade_to_city`: `O(1)`.
-- `cpu_build_road`: `O(E log V + H * V)` through pathfinding.
-- `cpu_build_settlement`: `O(B log B)` for scoring `B` buildable vertices.
-- `_find_buildable_vertices`: `O(B * deg)` bounded by connected frontier size.
-- `_score_settlement_location`: `O(k)` where `k` is adjacent hex count (≤3).
-- `_build_resource_map`: `O(H * V)` preprocessing.
+- `bank_trade`: `O(1)`.
+- `move_robber`: `O(1)`.
+- `distribute_resources`: `O(A)` over the buildings on the rolled hexes.
+- `undo`: `O(P)` for hands and points, plus the board core's clear path
+  (index rebuilds) when a building or road is taken back.
+- `cpu_choose_initial_placement`: `O(V)` scoring every legal setup vertex.
+- `_find_buildable_vertices`: `O(B)` from the bitboard legal-settlement mask.
+- `_vertex_pips` / `_score_settlement_location`: `O(1)` lookups in the board's `PipCache`.
+- `_build_resource_map`: `O(H)` preprocessing from the shared topology.
 - `get_vertices_with_resource`: `O(T)` where `T` is count cached for resource.
 - `find_best_settlement_for_resource`: `O(B log B)` sorting buildable targets.
 """
 
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
-from ..model.board import BoardGraph
-from ..model.enums import Resource
-from ..rules.building_rules import BuildingRules
-from ..search.pathfinding import Pathfinding
+from model.board import BoardGraph
+from model.bitboard import iter_bits
+from model.board_core import NO_OWNER
+from model.enums import Resource
+from rules.building_rules import BuildingRules, CITY_COST, ROAD_COST, SETTLEMENT_COST
+from search.pathfinding import Pathfinding
 
 if TYPE_CHECKING:
-    from ..model.game import GameState, Player
+    from model.game import GameState, Player
+
+BANK_TRADE_RATE = 4
+TRADEABLE_RESOURCES = (Resource.LUMBER, Resource.BRICK, Resource.GRAIN, Resource.WOOL, Resource.ORE)
+
+# MoveRecord kinds
+ROAD = "road"
+SETTLEMENT = "settlement"
+CITY = "city"
+TRADE = "trade"
+ROBBER = "robber"
+PRODUCTION = "production"
+
+
+class MoveRecord:
+    """
+    Everything needed to take one move back, and nothing else.
+
+    `hand` holds (player_id, resource, delta) for every hand change and
+    `points` the (victory_points, has_longest_road) of every player before
+    the move, since a road or settlement can move the Longest Road card.
+    """
+
+    __slots__ = ("kind", "player_id", "target", "previous_owner", "previous_is_city",
+                 "hand", "pieces", "points", "robber_hex_id")
+
+    def __init__(
+        self,
+        kind: str,
+        player_id: Optional[int] = None,
+        target: Optional[object] = None,
+        previous_owner: Optional[int] = None,
+        previous_is_city: bool = False,
+        hand: Tuple[Tuple[int, Resource, int], ...] = (),
+        pieces: Optional[Tuple[int, int, int]] = None,
+        points: Optional[Tuple[Tuple[int, bool], ...]] = None,
+        robber_hex_id: Optional[int] = None,
+    ):
+        self.kind = kind
+        self.player_id = player_id
+        self.target = target  # vertex ID, edge ID or hex ID
+        self.previous_owner = previous_owner
+        self.previous_is_city = previous_is_city
+        self.hand = hand
+        self.pieces = pieces  # (settlements, cities, roads) remaining before
+        self.points = points
+        self.robber_hex_id = robber_hex_id  # robber before a ROBBER move
+
+    def __repr__(self) -> str:
+        return f"MoveRecord({self.kind}, player={self.player_id}, target={self.target})"
 
 
 class BuildingService:
@@ -46,6 +101,9 @@ class BuildingService:
         # Structure: resource -> hex_id -> list of vertex_ids
         self._resource_location_map: Dict[Resource, Dict[int, List[str]]] = {}
         self._build_resource_map()
+
+        # One MoveRecord per successful move made through this service, newest last
+        self.undo_stack: List[MoveRecord] = []
     
     def build_road(self, player_id: int, edge_id: int) -> Tuple[bool, str]:
         """
@@ -63,18 +121,18 @@ class BuildingService:
         if not can_build:
             return False, reason
         
-        # Get player and edge
+        # Get player
         player = self.game.players[player_id]
-        edge = self.board.edges[edge_id]
+        self.undo_stack.append(self._build_record(ROAD, player, edge_id, ROAD_COST))
         
         # Deduct resources
-        road_cost = {Resource.LUMBER: 1, Resource.BRICK: 1}
-        for resource, amount in road_cost.items():
+        for resource, amount in ROAD_COST.items():
             player.remove_resource(resource, amount)
         
         # Build the road
-        edge.owner = player_id
+        self.board.set_edge_owner(edge_id, player_id)
         player.roads_remaining -= 1
+        self.game.update_longest_road()
         
         return True, f"Road built successfully on edge {edge_id}"
     
@@ -94,25 +152,19 @@ class BuildingService:
         if not can_build:
             return False, reason
         
-        # Get player and vertex
+        # Get player
         player = self.game.players[player_id]
-        vertex = self.board.vertices[vertex_id]
+        self.undo_stack.append(self._build_record(SETTLEMENT, player, vertex_id, SETTLEMENT_COST))
         
         # Deduct resources
-        settlement_cost = {
-            Resource.LUMBER: 1,
-            Resource.BRICK: 1,
-            Resource.GRAIN: 1,
-            Resource.WOOL: 1
-        }
-        for resource, amount in settlement_cost.items():
+        for resource, amount in SETTLEMENT_COST.items():
             player.remove_resource(resource, amount)
         
         # Build the settlement
-        vertex.owner = player_id
-        vertex.is_city = False
+        self.board.set_vertex_owner(vertex_id, player_id, is_city=False)
         player.settlements_remaining -= 1
         player.victory_points += 1
+        self.game.update_longest_road()  # the settlement may break an opponent's road
         
         return True, f"Settlement built successfully at vertex {vertex_id}"
     
@@ -132,136 +184,217 @@ class BuildingService:
         if not can_upgrade:
             return False, reason
         
-        # Get player and vertex
+        # Get player
         player = self.game.players[player_id]
-        vertex = self.board.vertices[vertex_id]
+        self.undo_stack.append(self._build_record(CITY, player, vertex_id, CITY_COST))
         
         # Deduct resources
-        city_cost = {Resource.GRAIN: 2, Resource.ORE: 3}
-        for resource, amount in city_cost.items():
+        for resource, amount in CITY_COST.items():
             player.remove_resource(resource, amount)
         
         # Upgrade to city
-        vertex.is_city = True
+        self.board.set_vertex_owner(vertex_id, player_id, is_city=True)
         player.settlements_remaining += 1  # Get settlement back
         player.cities_remaining -= 1
         player.victory_points += 1  # City is worth 2 VP, settlement was 1, so +1 more
         
         return True, f"Settlement upgraded to city at vertex {vertex_id}"
     
-    # CPU BUILDING METHODS (using shortest path algorithms)
-    
-    def cpu_build_road(self, player_id: int, target_resource: Optional[Resource] = None) -> Tuple[bool, str]:
+    def bank_trade(self, player_id: int, give: Resource, get: Resource, rate: int = BANK_TRADE_RATE) -> Tuple[bool, str]:
         """
-        CPU builds a road using shortest path algorithm.
+        Trade `rate` cards of one resource with the bank for one card of another.
         
         Args:
-            player_id: ID of the CPU player
-            target_resource: Optional resource to target (if None, builds toward any good location)
+            player_id: ID of the player trading
+            give: Resource handed to the bank
+            get: Resource received from the bank
+            rate: How many `give` cards one `get` card costs (4 without ports)
             
         Returns:
             Tuple of (success: bool, message: str)
         """
-        # Find best road placement using pathfinding
-        best_edge = self.pathfinding.find_best_road_placement(player_id, target_resource)
+        if give == get:
+            return False, "Cannot trade a resource for itself"
         
-        if best_edge is None:
-            return False, "No valid road placement found"
+        player = self.game.players[player_id]
+        if not player.remove_resource(give, rate):
+            return False, f"Insufficient resources (need {rate} {give.name})"
+        player.add_resource(get, 1)
+        self.undo_stack.append(MoveRecord(TRADE, player_id, hand=((player_id, give, -rate), (player_id, get, 1))))
         
-        return self.build_road(player_id, best_edge)
-    
-    def cpu_build_settlement(self, player_id: int, preferred_resources: Optional[List[Resource]] = None) -> Tuple[bool, str]:
+        return True, f"Traded {rate} {give.name} for 1 {get.name}"
+
+    def move_robber(self, hex_id: int) -> MoveRecord:
         """
-        CPU builds a settlement at a strategic location.
-        Uses multidimensional array to quickly find vertices with desired resources.
-        
-        Time Complexity: O(B log B) where B = buildable vertices
-        - Finding buildable vertices: O(B * deg(v))
-        - Scoring: O(B * k) where k = adjacent hexes (≤3)
-        - Sorting: O(B log B) using Timsort
-        
-        Args:
-            player_id: ID of the CPU player
-            preferred_resources: List of resources to prioritize (if None, finds any valid location)
-            
+        Move the robber (no stealing), recording where it was.
+
         Returns:
-            Tuple of (success: bool, message: str)
+            The move's undo record (also pushed on `undo_stack`)
+        """
+        record = MoveRecord(ROBBER, target=hex_id, robber_hex_id=self.game.robber_hex_id)
+        self.game.move_robber(hex_id)
+        self.undo_stack.append(record)
+        return record
+
+    def distribute_resources(self, roll: int) -> MoveRecord:
+        """
+        Pay out a dice roll straight from the board: 1 per settlement and 2
+        per city on each hex with that number, robber hex excluded.
+
+        The turn engine does the same from its own production table during
+        real turns; this is the variant search can take back.
+
+        Returns:
+            The move's undo record (also pushed on `undo_stack`)
+        """
+        game = self.game
+        core = self.board.core
+        totals: Dict[Tuple[int, Resource], int] = {}
+        for hex_id in self.board.num_to_hexes.get(roll, ()):
+            resource = self.board.hexes[hex_id].resource
+            if hex_id == game.robber_hex_id or resource is None or resource == Resource.DESERT:
+                continue
+            for v in core.hex_corners(hex_id):
+                owner = core.vertex_owner[v]
+                if owner != NO_OWNER:
+                    key = (owner, resource)
+                    totals[key] = totals.get(key, 0) + (2 if core.vertex_is_city[v] else 1)
+        for (owner, resource), amount in totals.items():
+            game.players[owner].add_resource(resource, amount)
+        record = MoveRecord(
+            PRODUCTION, target=roll,
+            hand=tuple((owner, resource, amount) for (owner, resource), amount in totals.items()),
+        )
+        self.undo_stack.append(record)
+        return record
+
+    # UNDO
+
+    def _build_record(self, kind: str, player: 'Player', target: object, cost: Dict[Resource, int]) -> MoveRecord:
+        """Capture what a build is about to change (called after validation)."""
+        if kind == ROAD:
+            previous_owner, previous_is_city = self.board.edges[target].owner, False
+        else:
+            vertex = self.board.vertices[target]
+            previous_owner, previous_is_city = vertex.owner, vertex.is_city
+        return MoveRecord(
+            kind, player.id, target, previous_owner, previous_is_city,
+            hand=tuple((player.id, resource, -amount) for resource, amount in cost.items()),
+            pieces=(player.settlements_remaining, player.cities_remaining, player.roads_remaining),
+            points=tuple((p.victory_points, p.has_longest_road) for p in self.game.players),
+        )
+
+    def undo(self) -> Optional[MoveRecord]:
         """
-        # Get all buildable vertices (connected by road, valid distance rule)
-        buildable_vertices = self._find_buildable_vertices(player_id)
+        Take back the newest move made through this service.
+
+        Board pieces, hands, piece counts, victory points, the Longest Road
+        card and the robber all return to exactly what they were, and the
+        game's Zobrist hash with them.
+
+        Returns:
+            The record that was undone, or None if there was nothing to undo
+        """
+        if not self.undo_stack:
+            return None
+        record = self.undo_stack.pop()
+        game = self.game
+
+        # Step 1: Board
+        if record.kind == ROAD:
+            self.board.set_edge_owner(record.target, record.previous_owner)
+        elif record.kind in (SETTLEMENT, CITY):
+            self.board.set_vertex_owner(record.target, record.previous_owner, record.previous_is_city)
+        elif record.kind == ROBBER:
+            game.move_robber(record.robber_hex_id)
+
+        # Step 2: Hands
+        for player_id, resource, delta in record.hand:
+            player = game.players[player_id]
+            player.set_resource(resource, player.resources.get(resource, 0) - delta)
+
+        # Step 3: Pieces and points
+        if record.pieces is not None:
+            player = game.players[record.player_id]
+            player.settlements_remaining, player.cities_remaining, player.roads_remaining = record.pieces
+        if record.points is not None:
+            for player, (victory_points, has_longest_road) in zip(game.players, record.points):
+                player.victory_points = victory_points
+                player.has_longest_road = has_longest_road
+        return record
+
+    def undo_to(self, depth: int) -> None:
+        """Undo moves until `undo_stack` is `depth` long (e.g. a length saved before a search)."""
+        while len(self.undo_stack) > depth:
+            self.undo()
+    
+    # CPU BUILDING METHODS (using shortest path algorithms)
+    
+    def cpu_choose_initial_placement(self, player_id: int) -> Optional[Tuple[str, int]]:
+        """
+        Pick a setup-phase settlement and road for a CPU player.
         
-        if not buildable_vertices:
-            return False, "No valid settlement locations found"
+        Scores every vertex that passes the distance rule by pips plus resource
+        diversity, then picks a free edge leading to an empty vertex.
         
-        # Score vertices based on resources
-        scored_vertices = []
-        for vertex_id in buildable_vertices:
-            score = self._score_settlement_location(vertex_id, preferred_resources)
-            scored_vertices.append((score, vertex_id))
+        Time Complexity: O(V) over legal setup vertices
         
-        # Sort by score (highest first) - O(B log B) using Timsort
-        scored_vertices.sort(reverse=True, key=lambda x: x[0])
+        Returns:
+            (vertex_id, edge_id) or None if nothing is legal
+        """
+        core = self.board.core
+        best = None
+        best_score = -1.0
+        for v in iter_bits(core.bits.legal_initial_settlements()):
+            vertex_id = core.vertex_names[v]
+            score = self._vertex_pips(vertex_id) + self._score_settlement_location(vertex_id)
+            if score > best_score:
+                best, best_score = v, score
         
-        # Try to build at the best location
-        for score, vertex_id in scored_vertices:
-            success, message = self.build_settlement(player_id, vertex_id)
-            if success:
-                return True, f"CPU built settlement at {vertex_id} (score: {score})"
+        if best is None:
+            return None
         
-        return False, "Could not build settlement at any location"
+        fallback_edge = None
+        for edge_id, other in zip(core.edges_at(best), core.neighbours(best)):
+            if core.edge_owner[edge_id] != NO_OWNER:
+                continue
+            if core.vertex_owner[other] == NO_OWNER:
+                return core.vertex_names[best], edge_id
+            if fallback_edge is None:
+                fallback_edge = edge_id
+        if fallback_edge is None:
+            return None
+        return core.vertex_names[best], fallback_edge
     
     def _find_buildable_vertices(self, player_id: int) -> List[str]:
         """
         Find all vertices where the player can build a settlement.
         Must be connected by road and satisfy distance rule.
-        """
-        buildable = []
-        
-        # Get all vertices connected by roads
-        connected_vertices = self.pathfinding.get_player_connected_vertices(player_id)
         
-        # Check each connected vertex
-        for vertex_id in connected_vertices:
-            vertex = self.board.vertices[vertex_id]
-            
-            # Skip if already occupied
-            if vertex.owner is not None:
-                continue
-            
-            # Check distance rule
-            if self.rules._check_distance_rule(vertex_id):
-                buildable.append(vertex_id)
+        Time Complexity: O(1) bitboard ops + O(B) to list the results
+        """
+        return self.rules.legal_settlement_vertices(player_id)
+    
+    def _vertex_pips(self, vertex_id: str) -> int:
+        """
+        Total pips (dice combinations out of 36) of the numbered hexes around a vertex,
+        not counting the robber's hex. Higher = produces more often.
         
-        return buildable
+        Time Complexity: O(1) lookup in the board's pip cache
+        """
+        return self.board.pip_cache.pips_of(vertex_id)
     
     def _score_settlement_location(self, vertex_id: str, preferred_resources: Optional[List[Resource]] = None) -> int:
         """
         Score a settlement location based on adjacent resources.
         Higher score = better location.
         
-        Uses the resource location map for fast lookup.
-        """
-        vertex = self.board.vertices[vertex_id]
-        score = 0
-        
-        # Count resources adjacent to this vertex
-        resource_counts: Dict[Resource, int] = {}
-        for hex_id in vertex.hex_ids:
-            hex_tile = self.board.hexes.get(hex_id)
-            if hex_tile and hex_tile.resource and hex_tile.resource != Resource.DESERT:
-                resource = hex_tile.resource
-                resource_counts[resource] = resource_counts.get(resource, 0) + 1
-                
-                # Bonus points for preferred resources
-                if preferred_resources and resource in preferred_resources:
-                    score += 3
-                else:
-                    score += 1
-        
-        # Bonus for diversity (having multiple different resources)
-        score += len(resource_counts) * 2
+        1 point per adjacent producing hex (3 if it is a preferred resource)
+        plus 2 per distinct resource, read from the board's pip cache.
         
-        return score
+        Time Complexity: O(1) without preferences, O(k) with them (k ≤ 3 resources)
+        """
+        return self.board.pip_cache.settlement_score(vertex_id, preferred_resources)
     
     def _build_resource_map(self):
         """
@@ -270,9 +403,9 @@ class BuildingService:
         
         This allows O(1) lookup of which vertices are adjacent to hexes with a specific resource.
         
-        Time Complexity: O(H * V) where H = hexes (19), V = vertices (54)
-        - Preprocessing step done once during initialization
-        - Space: O(H * V) in worst case, typically much less
+        Time Complexity: O(H) where H = hexes (19)
+        - Hex corners are read from the shared board topology
+        - Space: O(H * 6)
         """
         self._resource_location_map = {}
         
@@ -283,13 +416,7 @@ class BuildingService:
                 if resource not in self._resource_location_map:
                     self._resource_location_map[resource] = {}
                 
-                # Find all vertices adjacent to this hex
-                for vertex_id, vertex in self.board.vertices.items():
-                    if hex_id in vertex.hex_ids:
-                        if hex_id not in self._resource_location_map[resource]:
-                            self._resource_location_map[resource][hex_id] = []
-                        if vertex_id not in self._resource_location_map[resource][hex_id]:
-                            self._resource_location_map[resource][hex_id].append(vertex_id)
+                self._resource_location_map[resource][hex_id] = list(self.board.vertices_of_hex(hex_id))
     
     def get_vertices_with_resource(self, resource: Resource) -> List[str]:
         """
@@ -305,7 +432,7 @@ class BuildingService:
         if resource in self._resource_location_map:
             for hex_id, vertex_list in self._resource_location_map[resource].items():
                 vertices.extend(vertex_list)
-        return list(set(vertices))  # Remove duplicates
+        return list(dict.fromkeys(vertices))  # Remove duplicates, keep a stable order
     
     def find_best_settlement_for_resource(self, player_id: int, resource: Resource) -> Optional[str]:
         """
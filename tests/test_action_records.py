@@ -0,0 +1,68 @@
+import unittest
+
+from engine.cpu_player import ActionType, CPUAction, CPUPlayer
+from engine.headless import HeadlessGame
+from engine.mcts import action_from_key, action_key
+from model.enums import Resource
+
+
+class TestActionRecords(unittest.TestCase):
+    def test_records_are_compact(self):
+        action = CPUAction.of(ActionType.BUILD_ROAD, 7)
+        self.assertFalse(hasattr(action, "__dict__"))
+        self.assertEqual(action.args, (7,))
+        self.assertEqual((action.score, action.sort_index), (0.0, -0.0))
+
+    def test_params_and_explanation_are_built_on_demand(self):
+        action = CPUAction.of(ActionType.BANK_TRADE, Resource.ORE, Resource.WOOL, 4)
+        self.assertIsNone(action._params)
+        self.assertIsNone(action._explanation)
+        self.assertEqual(action.params, {"give": Resource.ORE, "get": Resource.WOOL, "rate": 4})
+        self.assertEqual(action.explanation, "Bank trade 4:1 ORE->WOOL")
+        action.explanation = "Dump ore"
+        self.assertEqual(action.explanation, "Dump ore")
+
+    def test_keyword_construction_still_works(self):
+        action = CPUAction(score=2.0, action_type=ActionType.MOVE_ROBBER, params={"hex_id": 4})
+        self.assertEqual(action.args, (4, None))
+        self.assertEqual(action.params, {"hex_id": 4})
+        self.assertEqual(action.sort_index, -2.0)
+        self.assertEqual(action.explanation, "Move robber")
+        self.assertEqual(CPUAction(score=0.0, action_type=ActionType.PASS, explanation="No actions").explanation,
+                         "No actions")
+
+    def test_missing_params_fall_back_to_the_action_name(self):
+        action = CPUAction(1.0, ActionType.BANK_TRADE)
+        self.assertEqual(action.explanation, "BANK_TRADE")
+        self.assertIn("BANK_TRADE", repr(action))
+        self.assertEqual(CPUAction.of(ActionType.BANK_TRADE, None, None, 4).explanation, "BANK_TRADE")
+
+    def test_ordering_and_equality_follow_the_score(self):
+        low = CPUAction(score=1.0, action_type=ActionType.PASS)
+        high = CPUAction(score=3.0, action_type=ActionType.BUILD_CITY, params={"vertex_id": 2})
+        self.assertLess(high, low)  # best first, as with heapq
+        self.assertEqual(sorted([low, high]), [high, low])
+        self.assertEqual(low, CPUAction(score=1.0, action_type=ActionType.BUY_DEV_CARD))
+
+    def test_search_keys_round_trip(self):
+        action = CPUAction.of(ActionType.MOVE_ROBBER, 3, 1)
+        rebuilt = action_from_key(action_key(action))
+        self.assertEqual((rebuilt.action_type, rebuilt.args), (ActionType.MOVE_ROBBER, (3, 1)))
+
+    def test_deciding_formats_no_explanations(self):
+        runner = HeadlessGame(num_players=4, max_turns=20, seed=8)
+        runner.play()
+        for player in runner.game.players:
+            for resource in list(player.resources):
+                player.add_resource(resource, 2)
+        adapter = runner.setup.rules_adapter
+        adapter.start_turn()
+        cpu = CPUPlayer(adapter)
+        actions = cpu.generate_candidate_actions()
+        cpu.score_actions(actions)
+        self.assertTrue(all(a._params is None and a._explanation is None for a in actions))
+        self.assertTrue(cpu.choose_action().explanation)
+
+
+if __name__ == '__main__':
+    unittest.main()
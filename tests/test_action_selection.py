@@ -0,0 +1,48 @@
+import random
+import unittest
+
+from engine.cpu_player import ActionType, CPUAction, CPUPlayer, select_best, select_top
+from engine.headless import HeadlessGame
+
+
+def _actions(scores):
+    return [CPUAction(score=s, action_type=ActionType.BUILD_ROAD, params={"edge_id": i})
+            for i, s in enumerate(scores)]
+
+
+class TestActionSelection(unittest.TestCase):
+    def test_best_breaks_ties_by_candidate_order(self):
+        actions = _actions([1.0, 3.0, 2.0, 3.0, 3.0])
+        self.assertIs(select_best(actions), actions[1])
+        self.assertIsNone(select_best([]))
+
+    def test_top_k_matches_a_stable_sort(self):
+        rng = random.Random(6)
+        for _ in range(50):
+            actions = _actions([rng.choice([0.0, 0.5, 1.0, 2.5]) for _ in range(rng.randrange(1, 30))])
+            ranked = sorted(actions, key=lambda a: -a.score)
+            for k in (1, 3, 10, 40, None):
+                self.assertEqual(select_top(actions, k), ranked[:k])
+            self.assertIs(select_top(actions, 1)[0], select_best(actions))
+
+    def test_rank_actions_agrees_with_choose_action(self):
+        runner = HeadlessGame(num_players=4, max_turns=20, seed=8)
+        runner.play()
+        for player in runner.game.players:
+            for resource in list(player.resources):
+                player.add_resource(resource, 2)
+        adapter = runner.setup.rules_adapter
+        adapter.start_turn()
+        cpu = CPUPlayer(adapter)
+
+        ranked = cpu.rank_actions(5)
+        self.assertEqual(len(ranked), 5)
+        self.assertEqual([a.score for a in ranked], sorted((a.score for a in ranked), reverse=True))
+        chosen = cpu.choose_action()
+        self.assertEqual((chosen.action_type, chosen.params, chosen.score),
+                         (ranked[0].action_type, ranked[0].params, ranked[0].score))
+        self.assertEqual(len(cpu.rank_actions()), len(cpu.generate_candidate_actions()))
+
+
+if __name__ == '__main__':
+    unittest.main()
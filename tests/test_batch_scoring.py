@@ -0,0 +1,55 @@
+import unittest
+
+from engine import cpu_player
+from engine.cpu_player import ActionType, CPUPlayer
+from engine.headless import HeadlessGame
+
+
+class TestBatchScoring(unittest.TestCase):
+    def setUp(self):
+        self.backend = (cpu_player.np, cpu_player.NUMPY_MIN_COLUMN)
+
+    def tearDown(self):
+        cpu_player.np, cpu_player.NUMPY_MIN_COLUMN = self.backend
+
+    def _positions(self):
+        for seed, turns in ((1, 4), (2, 15), (3, 30), (4, 60)):
+            runner = HeadlessGame(num_players=4, max_turns=turns, seed=seed, record_events=False)
+            runner.play()
+            for player in runner.game.players:
+                for resource in list(player.resources):
+                    player.add_resource(resource, seed)
+            adapter = runner.setup.rules_adapter
+            adapter.start_turn()
+            cpu = CPUPlayer(adapter)
+            yield cpu, cpu.generate_candidate_actions()
+
+    def test_scores_match_score_action_exactly(self):
+        backends = [(None, cpu_player.NUMPY_MIN_COLUMN)]
+        if cpu_player.np is not None:
+            backends.append((cpu_player.np, 0))
+        seen = set()
+        for cpu, actions in self._positions():
+            expected = [cpu.score_action(a) for a in actions]
+            seen.update(a.action_type for a in actions)
+            for cpu_player.np, cpu_player.NUMPY_MIN_COLUMN in backends:
+                self.assertEqual(cpu.score_actions(actions), expected)
+        self.assertTrue({ActionType.BUILD_ROAD, ActionType.BANK_TRADE, ActionType.PASS} <= seen)
+
+    def test_dangerous_trades_keep_the_penalty(self):
+        cpu, actions = list(self._positions())[-1]
+        trades = [a for a in actions if a.action_type == ActionType.BANK_TRADE]
+        self.assertTrue(trades)
+        cpu.rules.would_trade_enable_opponent_win = lambda *args: True
+        scores = cpu.score_actions(trades)
+        self.assertEqual(scores, [-cpu.weights.trade_enable_opponent_win_penalty] * len(trades))
+        self.assertEqual(scores, [cpu.score_action(a) for a in trades])
+
+    def test_choose_action_uses_the_batch(self):
+        cpu, actions = next(self._positions())
+        best = max(cpu.score_actions(actions))
+        self.assertEqual(cpu.choose_action().score, best)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from engine.batch_sim import np, simulate_income
+from engine.headless import HeadlessGame
+from engine.production import ROLL_WAYS
+
+
+@unittest.skipUnless(np is not None, "NumPy not installed")
+class TestBatchSimulator(unittest.TestCase):
+    def setUp(self):
+        runner = HeadlessGame(num_players=4, max_turns=0, seed=5)
+        runner.play()
+        self.engine = runner.setup.turn_engine_adapter.engine
+
+    def test_matrix_matches_production_table(self):
+        batch = simulate_income(self.engine.board, num_rolls=10, seed=1, production=self.engine.production)
+        for roll in ROLL_WAYS:
+            for owner, resource, amount in self.engine.production.payouts(roll):
+                p = batch.player_ids.index(owner)
+                r = batch.resources.index(resource)
+                self.assertEqual(batch.payouts[roll, p, r], amount)
+        self.assertEqual(batch.payouts[7].sum(), 0)
+
+    def test_seeded_batches_repeat(self):
+        first = simulate_income(self.engine.board, num_rolls=1000, seed=3)
+        second = simulate_income(self.engine.board, num_rolls=1000, seed=3)
+        self.assertTrue(np.array_equal(first.rolls, second.rolls))
+
+    def test_totals_agree_with_per_roll_income(self):
+        batch = simulate_income(self.engine.board, num_rolls=5000, seed=2, per_roll=True)
+        self.assertEqual(batch.income.shape, (5000, len(batch.player_ids), len(batch.resources)))
+        self.assertTrue(np.array_equal(batch.income.sum(axis=0), batch.totals()))
+        self.assertTrue(np.array_equal(batch.cards_per_player(), batch.income.sum(axis=2)))
+        self.assertTrue(((batch.rolls >= 2) & (batch.rolls <= 12)).all())
+
+    def test_mean_converges_to_expected_income(self):
+        batch = simulate_income(self.engine.board, num_rolls=200_000, seed=4)
+        mean = batch.mean()
+        for p, pid in enumerate(batch.player_ids):
+            expected = self.engine.production.expected_income(pid)
+            for r, res in enumerate(batch.resources):
+                self.assertAlmostEqual(mean[p, r], expected.get(res, 0.0), delta=0.02)
+
+
+if __name__ == '__main__':
+    unittest.main()
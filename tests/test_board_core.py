@@ -0,0 +1,244 @@
+import random
+import unittest
+
+from model.bitboard import iter_bits
+from model.board import HEX_LAYOUT, STANDARD_TOPOLOGY, catan_graph, create_standard_board
+from model.board_core import NO_OWNER
+
+
+class TestBoardCore(unittest.TestCase):
+    def setUp(self):
+        self.board = create_standard_board()
+        self.core = self.board.core
+
+    def test_sizes(self):
+        self.assertEqual(self.core.num_vertices, 54)
+        self.assertEqual(self.core.num_edges, 72)
+        self.assertEqual(self.core.num_hexes, 19)
+
+    def test_adjacency_matches_graph(self):
+        for vertex_id, vertex in self.board.vertices.items():
+            v = self.core.vertex_idx(vertex_id)
+            self.assertEqual(sorted(self.board.edges_of(vertex_id)), sorted(vertex.edge_ids))
+            expected = sorted(self.board.other_end(e, vertex_id) for e in vertex.edge_ids)
+            self.assertEqual(sorted(self.board.neighbors(vertex_id)), expected)
+            for e in self.core.edges_at(v):
+                other = self.core.other_end(e, v)
+                self.assertEqual(self.core.vertex_name(other), self.board.other_end(e, vertex_id))
+
+    def test_facade_returns_cached_tuples(self):
+        self.assertIs(self.board.neighbors("E"), self.board.neighbors("E"))
+        self.assertIs(self.board.edges_of("E"), self.board.edges_of("E"))
+
+    def test_ownership_stays_in_sync(self):
+        self.board.set_vertex_owner("E", 2)
+        self.board.set_edge_owner(3, 1)
+        v = self.core.vertex_idx("E")
+        self.assertEqual(self.board.vertices["E"].owner, 2)
+        self.assertEqual(self.core.vertex_owner[v], 2)
+        self.assertEqual(self.core.edge_owner[3], 1)
+
+        self.board.set_vertex_owner("E", 2, is_city=True)
+        self.assertTrue(self.board.vertices["E"].is_city)
+        self.assertEqual(self.core.vertex_is_city[v], 1)
+
+        self.board.set_vertex_owner("E", None)
+        self.assertIsNone(self.board.vertices["E"].owner)
+        self.assertFalse(self.board.vertices["E"].is_city)
+        self.assertEqual(self.core.vertex_owner[v], NO_OWNER)
+
+
+class TestBoardTopology(unittest.TestCase):
+    def test_shared_between_boards(self):
+        a = create_standard_board()
+        b = create_standard_board()
+        self.assertIs(a.topology, STANDARD_TOPOLOGY)
+        self.assertIs(a.core.topology, b.core.topology)
+        self.assertIsNot(a.core.vertex_owner, b.core.vertex_owner)
+
+    def test_edge_numbering_unchanged(self):
+        # Same numbering build_catan_board has always produced
+        expected = []
+        seen = set()
+        for v1, neighbours in catan_graph.items():
+            for v2 in neighbours:
+                key = tuple(sorted([v1, v2]))
+                if key not in seen:
+                    seen.add(key)
+                    expected.append((v1, v2))
+        self.assertEqual(list(STANDARD_TOPOLOGY.edge_vertices), expected)
+
+    def test_hex_lookups(self):
+        board = create_standard_board()
+        for hex_id, corners in HEX_LAYOUT.items():
+            self.assertEqual(board.vertices_of_hex(hex_id), corners)
+            for name in corners:
+                self.assertIn(hex_id, board.vertices[name].hex_ids)
+
+    def test_neighbourhoods(self):
+        topo = STANDARD_TOPOLOGY
+        for v in range(topo.num_vertices):
+            self.assertEqual(topo.closed_neighbourhood[v][0], v)
+            self.assertEqual(set(topo.closed_neighbourhood[v][1:]), set(topo.vertex_neighbours[v]))
+            self.assertNotIn(v, topo.two_hop[v])
+            self.assertTrue(set(topo.vertex_neighbours[v]) <= set(topo.two_hop[v]))
+
+
+class TestBitboards(unittest.TestCase):
+    def _random_position(self, seed):
+        rng = random.Random(seed)
+        board = create_standard_board()
+        names = list(board.vertices)
+        for _ in range(10):
+            v = rng.choice(names)
+            if board.core.bits.distance_ok(board.core.vertex_idx(v)):
+                board.set_vertex_owner(v, rng.randrange(3), is_city=rng.random() < 0.3)
+        for _ in range(25):
+            e = rng.randrange(len(board.edges))
+            if board.edges[e].owner is None:
+                board.set_edge_owner(e, rng.randrange(3))
+        return board
+
+    def _naive_network(self, board, pid):
+        network = set()
+        for vid, vertex in board.vertices.items():
+            if vertex.owner == pid:
+                network.add(vid)
+            elif vertex.owner is None and any(board.edges[e].owner == pid for e in vertex.edge_ids):
+                network.add(vid)
+        return network
+
+    def test_matches_naive_rules(self):
+        for seed in range(20):
+            board = self._random_position(seed)
+            bits = board.core.bits
+            names = board.core.vertex_names
+            for vid, vertex in board.vertices.items():
+                naive_ok = vertex.owner is None and all(
+                    board.vertices[n].owner is None for n in board.neighbors(vid)
+                )
+                self.assertEqual(bits.distance_ok(board.core.vertex_idx(vid)), naive_ok)
+            for pid in range(3):
+                network = self._naive_network(board, pid)
+                self.assertEqual({names[v] for v in iter_bits(bits.network(pid))}, network)
+                naive_roads = {
+                    e for e, edge in board.edges.items()
+                    if edge.owner is None and (edge.v1 in network or edge.v2 in network)
+                }
+                self.assertEqual(set(iter_bits(bits.legal_roads(pid))), naive_roads)
+                naive_settlements = {
+                    vid for vid, vertex in board.vertices.items()
+                    if any(board.edges[e].owner == pid for e in vertex.edge_ids)
+                    and bits.distance_ok(board.core.vertex_idx(vid))
+                }
+                self.assertEqual({names[v] for v in iter_bits(bits.legal_settlements(pid))}, naive_settlements)
+
+    def test_clearing_restores_masks(self):
+        board = create_standard_board()
+        before_blocked = board.core.bits.blocked
+        board.set_vertex_owner("E", 0)
+        board.set_edge_owner(3, 0)
+        board.set_vertex_owner("E", None)
+        board.set_edge_owner(3, None)
+        bits = board.core.bits
+        self.assertEqual(bits.blocked, before_blocked)
+        self.assertEqual(bits.occupied, 0)
+        self.assertEqual(bits.all_roads, 0)
+        self.assertEqual(bits.road_vertices.get(0, 0), 0)
+
+
+class TestMoveGenerator(unittest.TestCase):
+    def _assert_frontiers_match(self, board):
+        bits = board.core.bits
+        moves = board.core.moves
+        for pid in range(3):
+            self.assertEqual(moves.legal_roads(pid), bits.legal_roads(pid))
+            self.assertEqual(moves.legal_settlements(pid), bits.legal_settlements(pid))
+            self.assertEqual(moves.upgradeable(pid), bits.upgradeable(pid))
+
+    def test_frontiers_match_full_recompute(self):
+        rng = random.Random(4)
+        board = create_standard_board(rng)
+        names = list(board.vertices)
+        for _ in range(300):
+            roll = rng.random()
+            if roll < 0.35:
+                board.set_vertex_owner(rng.choice(names), rng.randrange(3), is_city=rng.random() < 0.3)
+            elif roll < 0.45:
+                board.set_vertex_owner(rng.choice(names), None)
+            elif roll < 0.9:
+                board.set_edge_owner(rng.randrange(len(board.edges)), rng.randrange(3))
+            else:
+                board.set_edge_owner(rng.randrange(len(board.edges)), None)
+            self._assert_frontiers_match(board)
+
+    def test_opponent_building_cuts_frontier(self):
+        board = create_standard_board()
+        core = board.core
+        e = core.edges_at(core.vertex_idx("E"))[0]
+        board.set_edge_owner(e, 0)
+        end = core.other_end(e, core.vertex_idx("E"))
+        board.set_vertex_owner(core.vertex_name(end), 1)
+        far_edges = [f for f in core.edges_at(end) if f != e]
+        for f in far_edges:
+            self.assertFalse((core.moves.legal_roads(0) >> f) & 1)
+        self._assert_frontiers_match(board)
+
+
+class TestNetworkIndex(unittest.TestCase):
+    def _naive_network(self, core, pid):
+        """BFS from the player's buildings along their roads, stopping at opponent buildings."""
+        reached = {v for v in range(core.num_vertices) if core.vertex_owner[v] == pid}
+        queue = list(reached)
+        while queue:
+            v = queue.pop()
+            for e, other in zip(core.edges_at(v), core.neighbours(v)):
+                if core.edge_owner[e] != pid or other in reached:
+                    continue
+                if core.vertex_owner[other] not in (NO_OWNER, pid):
+                    continue
+                reached.add(other)
+                queue.append(other)
+        return reached
+
+    def test_matches_bfs_through_placements_and_removals(self):
+        rng = random.Random(9)
+        board = create_standard_board(rng)
+        core = board.core
+        names = list(board.vertices)
+        for _ in range(400):
+            roll = rng.random()
+            if roll < 0.3:
+                board.set_vertex_owner(rng.choice(names), rng.randrange(3), is_city=rng.random() < 0.3)
+            elif roll < 0.35:
+                board.set_vertex_owner(rng.choice(names), None)
+            elif roll < 0.95:
+                board.set_edge_owner(rng.randrange(len(board.edges)), rng.randrange(3))
+            else:
+                board.set_edge_owner(rng.randrange(len(board.edges)), None)
+            for pid in range(3):
+                self.assertEqual(set(iter_bits(core.networks.network(pid))), self._naive_network(core, pid))
+
+    def test_opponent_settlement_cuts_network(self):
+        board = create_standard_board()
+        core = board.core
+        # Player 0: settlement on E, then a chain of three roads away from it
+        path = [core.vertex_idx("E")]
+        edges = []
+        for _ in range(3):
+            e = next(f for f in core.edges_at(path[-1]) if f not in edges)
+            edges.append(e)
+            path.append(core.other_end(e, path[-1]))
+        board.set_vertex_owner("E", 0)
+        for e in edges:
+            board.set_edge_owner(e, 0)
+        self.assertTrue(all(core.networks.is_connected(0, v) for v in path))
+
+        board.set_vertex_owner(core.vertex_name(path[2]), 1)
+        self.assertTrue(core.networks.is_connected(0, path[1]))
+        self.assertFalse(core.networks.is_connected(0, path[2]))
+        self.assertFalse(core.networks.is_connected(0, path[3]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import random
+import unittest
+
+from engine.headless import HeadlessGame
+from model.board_core import BoardCore
+from model.enums import Resource
+from rules.building_rules import ROAD_COST, SETTLEMENT_COST
+from services.building_service import BuildingService
+
+
+def _indexes(core):
+    """Everything the board core derives from ownership, in comparable form."""
+    players = set(core.bits.roads) | set(core.bits.settlements) | set(core.bits.cities)
+    return (
+        list(core.vertex_owner),
+        list(core.vertex_is_city),
+        list(core.edge_owner),
+        core.bits.occupied,
+        core.bits.blocked,
+        {p: core.bits.network(p) for p in players},
+        {p: core.moves.legal_roads(p) for p in players},
+        {p: core.moves.legal_settlements(p) for p in players},
+        {p: core.networks.network(p) for p in players},
+        {p: core.longest.length(p) for p in players},
+    )
+
+
+class TestGameStateClone(unittest.TestCase):
+    def setUp(self):
+        runner = HeadlessGame(num_players=4, max_turns=20, seed=5)
+        runner.play()
+        self.game = runner.game
+
+    def _play_randomly(self, game, rng, moves=30):
+        service = BuildingService(game)
+        for _ in range(moves):
+            player = rng.choice(game.players)
+            for resource in Resource:
+                if resource in player.resources:
+                    player.add_resource(resource, 2)
+            roads = list(service.rules.legal_road_edges(player.id))
+            if roads:
+                service.build_road(player.id, rng.choice(roads))
+            core = game.board.core
+            sites = [core.vertex_name(v) for v in range(core.num_vertices)
+                     if (core.moves.legal_settlements(player.id) >> v) & 1]
+            if sites:
+                service.build_settlement(player.id, rng.choice(sites))
+            game.move_robber(rng.choice(list(game.board.hexes)))
+            game.next_turn()
+
+    def test_clone_is_independent(self):
+        original = _indexes(self.game.board.core)
+        original_hash = self.game.position_hash()
+        original_hands = [dict(p.resources) for p in self.game.players]
+        original_robber = self.game.robber_hex_id
+
+        clone = self.game.clone()
+        self.assertEqual(clone.position_hash(), original_hash)
+        self._play_randomly(clone, random.Random(1))
+
+        self.assertNotEqual(clone.position_hash(), original_hash)
+        self.assertEqual(_indexes(self.game.board.core), original)
+        self.assertEqual(self.game.position_hash(), original_hash)
+        self.assertEqual([dict(p.resources) for p in self.game.players], original_hands)
+        self.assertEqual(self.game.robber_hex_id, original_robber)
+        self.assertEqual(self.game.board.pip_cache.robber_hex_id, original_robber)
+
+    def test_clone_matches_a_rebuilt_state(self):
+        clone = self.game.clone()
+        self._play_randomly(clone, random.Random(2))
+        self.assertEqual(_indexes(clone.board.core), _indexes(BoardCore.from_board(clone.board)))
+        self.assertEqual(clone.position_hash(), clone.zobrist.recompute())
+        for vertex_id, vertex in clone.board.vertices.items():
+            core = clone.board.core
+            owner = core.vertex_owner[core.vertex_index[vertex_id]]
+            self.assertEqual(vertex.owner, None if owner < 0 else owner)
+        # The pip cache follows the clone's robber, not the original's
+        fresh = type(clone.board.pip_cache)(clone.board, clone.robber_hex_id)
+        self.assertEqual(clone.board.pip_cache.pips, fresh.pips)
+
+    def test_clone_shares_static_data(self):
+        clone = self.game.clone()
+        self.assertIs(clone.board.hexes, self.game.board.hexes)
+        self.assertIs(clone.board.core.topology, self.game.board.core.topology)
+        self.assertIsNot(clone.board.vertices, self.game.board.vertices)
+        self.assertIsNot(clone.players[0].resources, self.game.players[0].resources)
+
+
+if __name__ == '__main__':
+    unittest.main()
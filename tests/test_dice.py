@@ -1,3 +1,4 @@
+import random
 import unittest
 from engine.dice import Dice
 
@@ -10,5 +11,10 @@ class TestDice(unittest.TestCase):
             self.assertTrue(1 <= d2 <= 6)
             self.assertTrue(2 <= total <= 12)
 
+    def test_seeded_rolls_repeat(self):
+        first = Dice(random.Random(7))
+        second = Dice(random.Random(7))
+        self.assertEqual([first.roll() for _ in range(20)], [second.roll() for _ in range(20)])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,105 @@
+import heapq
+import random
+import unittest
+
+from model.bitboard import iter_bits
+from model.board import create_standard_board
+from model.board_core import NO_OWNER
+from search.distance_field import UNREACHABLE, RoadDistanceField
+from search.pathfinding import DIJKSTRA, ZERO_ONE_BFS, Pathfinding
+
+
+def _random_position(seed):
+    rng = random.Random(seed)
+    board = create_standard_board(rng)
+    names = list(board.vertices)
+    for pid in range(3):
+        for _ in range(2):
+            v = board.core.vertex_idx(rng.choice(names))
+            if board.core.bits.distance_ok(v):
+                board.set_vertex_owner(board.core.vertex_names[v], pid)
+    for _ in range(30):
+        e = rng.randrange(len(board.edges))
+        if board.edges[e].owner is None:
+            board.set_edge_owner(e, rng.randrange(3))
+    return board
+
+
+def _dijkstra(core, pid):
+    """Reference distances: Dijkstra from the network, stopping at opponent buildings."""
+    distance = [UNREACHABLE] * core.num_vertices
+    heap = [(0, v) for v in iter_bits(core.networks.network(pid))]
+    for _, v in heap:
+        distance[v] = 0
+    while heap:
+        d, v = heapq.heappop(heap)
+        if d > distance[v] or core.vertex_owner[v] not in (NO_OWNER, pid):
+            continue
+        for e, other in zip(core.edges_at(v), core.neighbours(v)):
+            owner = core.edge_owner[e]
+            if owner not in (NO_OWNER, pid):
+                continue
+            nd = d + (owner == NO_OWNER)
+            if nd < distance[other]:
+                distance[other] = nd
+                heapq.heappush(heap, (nd, other))
+    return distance
+
+
+class TestRoadDistanceField(unittest.TestCase):
+    def test_matches_reference_search(self):
+        for seed in range(10):
+            board = _random_position(seed)
+            field = RoadDistanceField(board)
+            for pid in range(3):
+                self.assertEqual(list(field.distances(pid)), _dijkstra(board.core, pid))
+
+    def test_agrees_with_one_off_searches(self):
+        for seed in range(6):
+            board = _random_position(seed)
+            pathfinding = Pathfinding(board)
+            for pid in range(3):
+                starts = pathfinding.get_player_connected_vertices(pid)
+                distances = pathfinding.distances.distances(pid)
+                for v, name in enumerate(board.core.vertex_names):
+                    for algorithm in (DIJKSTRA, ZERO_ONE_BFS):
+                        result = pathfinding.shortest_path_to_vertex(starts, name, pid, algorithm)
+                        expected = None if distances[v] == UNREACHABLE else distances[v]
+                        self.assertEqual(result and result[1], expected)
+
+    def test_paths_have_field_length(self):
+        board = _random_position(3)
+        core = board.core
+        field = RoadDistanceField(board)
+        for pid in range(3):
+            distances = field.distances(pid)
+            for v in range(core.num_vertices):
+                path = field.path_to(pid, v)
+                if distances[v] == UNREACHABLE:
+                    self.assertIsNone(path)
+                    continue
+                self.assertEqual(len(path), distances[v])
+                self.assertTrue(all(core.edge_owner[e] == NO_OWNER for e in path))
+
+    def test_cached_until_ownership_changes(self):
+        board = _random_position(1)
+        field = RoadDistanceField(board)
+        before = field.distances(0)
+        self.assertIs(field.distances(0), before)
+        path = field.path_to(0, field.nearest(0, [v for v, d in field.site_distances(0).items() if d > 0]))
+        board.set_edge_owner(path[0], 0)
+        after = field.distances(0)
+        self.assertIsNot(after, before)
+        self.assertEqual(list(after), _dijkstra(board.core, 0))
+
+    def test_site_distances_only_lists_settleable_vertices(self):
+        board = _random_position(2)
+        field = RoadDistanceField(board)
+        bits = board.core.bits
+        for v, d in field.site_distances(1).items():
+            self.assertTrue(bits.distance_ok(v))
+            self.assertEqual(d, field.distances(1)[v])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import io
+import random
+import unittest
+from contextlib import redirect_stdout
+
+from engine.headless import HeadlessGame, VICTORY_POINTS_TO_WIN
+
+
+class TestHeadlessGame(unittest.TestCase):
+    def test_plays_without_printing(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            result = HeadlessGame(num_players=3, max_turns=400).play()
+        self.assertEqual(out.getvalue(), "")
+        self.assertGreater(result.turns, 0)
+        if result.finished:
+            self.assertGreaterEqual(result.victory_points[result.winner_id], VICTORY_POINTS_TO_WIN)
+
+    def test_records_structured_events(self):
+        game = HeadlessGame(num_players=4, max_turns=50)
+        result = game.play()
+        kinds = [event.kind for event in result.events]
+        self.assertEqual(kinds[0], "turn_order")
+        self.assertEqual(kinds.count("settlement_placed"), 8)
+        self.assertEqual(kinds.count("road_placed"), 8)
+        self.assertIn("dice", kinds)
+        for event in result.events:
+            if event.kind == "dice":
+                self.assertGreaterEqual(event.turn, 1)
+                self.assertIn("roll", event.data["events"])
+
+    def test_setup_gives_every_player_two_settlements(self):
+        game = HeadlessGame(num_players=4, max_turns=0)
+        result = game.play()
+        for player in game.game.players:
+            self.assertEqual(player.settlements_remaining, 3)
+            self.assertEqual(player.roads_remaining, 13)
+        self.assertIsNone(result.winner_id)
+        self.assertIsNone(game.game.board.hexes[game.game.robber_hex_id].number)  # robber starts on the desert
+
+    def test_same_seed_replays_the_same_game(self):
+        first = HeadlessGame(num_players=4, max_turns=120, seed=42).play()
+        second = HeadlessGame(num_players=4, max_turns=120, seed=42).play()
+        self.assertEqual(first.turns, second.turns)
+        self.assertEqual(first.victory_points, second.victory_points)
+        self.assertEqual(
+            [(e.kind, e.turn, e.data) for e in first.events],
+            [(e.kind, e.turn, e.data) for e in second.events],
+        )
+
+    def test_seeded_game_ignores_global_random(self):
+        random.seed(1)
+        first = HeadlessGame(num_players=3, max_turns=80, seed=5).play()
+        random.seed(2)
+        second = HeadlessGame(num_players=3, max_turns=80, seed=5).play()
+        self.assertEqual(first.victory_points, second.victory_points)
+
+    def test_no_events_kept_when_recording_disabled(self):
+        result = HeadlessGame(num_players=3, max_turns=20, record_events=False).play()
+        self.assertEqual(result.events, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
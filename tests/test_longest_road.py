@@ -0,0 +1,138 @@
+import random
+import unittest
+
+from model.board import create_standard_board
+from model.board_core import NO_OWNER
+from model.game import GameState, Player
+from model.longest_road import LONGEST_ROAD_VP
+
+
+def _naive_longest(core, pid):
+    """
+    Longest trail over all of the player's roads, by growing every trail
+    edge by edge from every road in both directions. Only the vertices a
+    trail passes through must be free of opponent buildings; its two ends
+    may sit on them.
+    """
+    roads = [e for e in range(core.num_edges) if core.edge_owner[e] == pid]
+
+    def cut(v):
+        return core.vertex_owner[v] not in (NO_OWNER, pid)
+
+    def grow(tip, used):
+        if cut(tip):
+            return len(used)  # can end here, but not pass through
+        best = len(used)
+        for e in roads:
+            if e not in used and tip in (core.edge_v1[e], core.edge_v2[e]):
+                best = max(best, grow(core.other_end(e, tip), used | {e}))
+        return best
+
+    best = 0
+    for e in roads:
+        for tip in (core.edge_v1[e], core.edge_v2[e]):  # either end can be the start
+            best = max(best, grow(tip, frozenset([e])))
+    return best
+
+
+def _chain(core, start, length):
+    """Edges and vertices of a simple path of `length` empty edges from vertex `start`."""
+    edges, path = [], [start]
+    for _ in range(length):
+        v = path[-1]
+        e = next(f for f in core.edges_at(v)
+                 if core.edge_owner[f] == NO_OWNER and core.other_end(f, v) not in path)
+        edges.append(e)
+        path.append(core.other_end(e, v))
+    return edges, path
+
+
+class TestLongestRoadIndex(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = random.Random(5)
+        board = create_standard_board(rng)
+        core = board.core
+        names = list(board.vertices)
+        for _ in range(250):
+            roll = rng.random()
+            if roll < 0.2:
+                board.set_vertex_owner(rng.choice(names), rng.randrange(3))
+            elif roll < 0.25:
+                board.set_vertex_owner(rng.choice(names), None)
+            elif roll < 0.95:
+                board.set_edge_owner(rng.randrange(core.num_edges), rng.randrange(3))
+            else:
+                board.set_edge_owner(rng.randrange(core.num_edges), None)
+            for pid in range(3):
+                self.assertEqual(core.longest.length(pid), _naive_longest(core, pid))
+
+    def test_longest_with_matches_building_each_edge(self):
+        rng = random.Random(11)
+        for _ in range(5):
+            board = create_standard_board(rng)
+            core = board.core
+            for _ in range(30):
+                board.set_edge_owner(rng.randrange(core.num_edges), rng.randrange(2))
+            for _ in range(3):
+                board.set_vertex_owner(rng.choice(list(board.vertices)), 1)
+            candidates = [e for e in range(core.num_edges) if core.edge_owner[e] == NO_OWNER]
+            predicted = core.longest.longest_with(0, candidates)
+            for e in candidates:
+                board.set_edge_owner(e, 0)
+                self.assertEqual(predicted[e], core.longest.length(0))
+                board.set_edge_owner(e, None)
+
+    def test_chain_between_opponent_buildings_counts_whole(self):
+        board = create_standard_board()
+        core = board.core
+        for length in (2, 5):
+            edges, path = _chain(core, core.vertex_idx("E"), length)
+            for e in edges:
+                board.set_edge_owner(e, 0)
+            board.set_vertex_owner(core.vertex_name(path[0]), 1)
+            board.set_vertex_owner(core.vertex_name(path[-1]), 1)
+            self.assertEqual(core.longest.length(0), length)
+            core.longest._recompute_all()
+            self.assertEqual(core.longest.length(0), length)
+            for v in (path[0], path[-1]):
+                board.set_vertex_owner(core.vertex_name(v), None)
+            for e in edges:
+                board.set_edge_owner(e, None)
+
+    def test_opponent_settlement_breaks_road(self):
+        board = create_standard_board()
+        core = board.core
+        edges, path = _chain(core, core.vertex_idx("E"), 6)
+        for e in edges:
+            board.set_edge_owner(e, 0)
+        self.assertEqual(core.longest.length(0), 6)
+        board.set_vertex_owner(core.vertex_name(path[3]), 1)
+        self.assertEqual(core.longest.length(0), 3)
+
+
+class TestLongestRoadAward(unittest.TestCase):
+    def setUp(self):
+        self.board = create_standard_board()
+        self.core = self.board.core
+        self.game = GameState(self.board, [Player(i, f"P{i}", "red") for i in range(2)])
+
+    def test_award_moves_only_when_strictly_beaten(self):
+        p0, p1 = self.game.players
+        for e in _chain(self.core, self.core.vertex_idx("E"), 5)[0]:
+            self.board.set_edge_owner(e, 0)
+        self.assertEqual(self.game.update_longest_road(), 0)
+        self.assertTrue(p0.has_longest_road)
+        self.assertEqual(p0.victory_points, LONGEST_ROAD_VP)
+
+        far, _ = _chain(self.core, self.core.vertex_idx("Z"), 6)
+        for e in far[:5]:
+            self.board.set_edge_owner(e, 1)
+        self.assertEqual(self.game.update_longest_road(), 0)  # a tie keeps the holder
+        self.board.set_edge_owner(far[5], 1)
+        self.assertEqual(self.game.update_longest_road(), 1)
+        self.assertFalse(p0.has_longest_road)
+        self.assertEqual((p0.victory_points, p1.victory_points), (0, LONGEST_ROAD_VP))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from unittest import mock
+
+from engine.cpu_player import ActionType
+from engine.headless import HeadlessGame
+from engine import mcts
+from engine.mcts import MCTSConfig, MCTSPlayer
+
+
+class TestMCTSPlayer(unittest.TestCase):
+    def setUp(self):
+        runner = HeadlessGame(num_players=4, max_turns=20, seed=3)
+        runner.play()
+        self.game = runner.game
+        self.adapter = runner.setup.rules_adapter
+        for player in self.game.players:
+            for resource in list(player.resources):
+                player.add_resource(resource, 3)
+        self.adapter.start_turn()
+
+    def _snapshot(self):
+        return (
+            self.game.position_hash(),
+            self.game.current_player_idx,
+            [(p.victory_points, p.roads_remaining, p.has_longest_road) for p in self.game.players],
+        )
+
+    def test_search_leaves_the_live_game_alone(self):
+        before = self._snapshot()
+        action = MCTSPlayer(self.adapter, config=MCTSConfig(iterations=12)).choose_action()
+        self.assertEqual(self._snapshot(), before)
+        legal = [(a.action_type, a.params) for a in MCTSPlayer(self.adapter).generate_candidate_actions()]
+        self.assertIn((action.action_type, action.params), legal)
+
+    def test_iteration_budget_and_counters(self):
+        player = MCTSPlayer(self.adapter, config=MCTSConfig(iterations=10, rollout_turns=2))
+        player.choose_action()
+        stats = player.stats
+        self.assertEqual(stats.iterations, 10)
+        self.assertEqual(stats.rollouts, 10)
+        self.assertLessEqual(stats.rollout_turns, 20)
+        self.assertGreater(stats.simulated_actions, 0)
+        self.assertGreater(stats.rollouts_per_second, 0)
+        player.choose_action()
+        self.assertEqual(player.total_stats.decisions, 2)
+        self.assertEqual(player.total_stats.iterations, 20)
+
+    def test_time_budget(self):
+        player = MCTSPlayer(self.adapter, config=MCTSConfig(iterations=None, time_limit=0.05))
+        player.choose_action()
+        self.assertGreaterEqual(player.stats.iterations, 1)
+        self.assertLess(player.stats.elapsed, 0.5)
+
+    def test_decisions_replay_exactly(self):
+        config = MCTSConfig(iterations=16, seed=7)
+        first = MCTSPlayer(self.adapter, config=config).choose_action()
+        second = MCTSPlayer(self.adapter, config=config).choose_action()
+        self.assertEqual((first.action_type, first.params, first.score),
+                         (second.action_type, second.params, second.score))
+
+    def test_expansion_can_be_capped_to_the_best_candidates(self):
+        player = MCTSPlayer(self.adapter, config=MCTSConfig(iterations=12, max_children=2))
+        action = player.choose_action()
+        best_two = [(a.action_type, a.params) for a in MCTSPlayer(self.adapter).rank_actions(2)]
+        self.assertIn((action.action_type, action.params), best_two)
+
+    def test_failed_expansion_move_is_a_dead_end(self):
+        begin, play = mcts._Simulation.begin, mcts._Simulation.play
+
+        def counting_begin(sim):
+            begin(sim)
+            sim.played = 0
+
+        def second_move_fails(sim, action):
+            sim.played += 1
+            return sim.played != 2 and play(sim, action)
+
+        with mock.patch.object(mcts._Simulation, "begin", counting_begin), \
+                mock.patch.object(mcts._Simulation, "play", second_move_fails):
+            player = MCTSPlayer(self.adapter, config=MCTSConfig(iterations=1))
+            player.stats = mcts.SearchStats()
+            root = player._search(0.0)
+        # The one iteration expanded a child and played a failing move below it
+        expanded = [node for child in root.children for node in (child.children or ()) if node.visits]
+        self.assertEqual(len(expanded), 1)
+        self.assertEqual(expanded[0].children, [])
+
+    def test_passes_without_searching_when_nothing_is_legal(self):
+        for player in self.game.players:
+            for resource in list(player.resources):
+                player.set_resource(resource, 0)
+        player = MCTSPlayer(self.adapter)
+        self.assertEqual(player.choose_action().action_type, ActionType.PASS)
+        self.assertEqual(player.total_stats.decisions, 0)
+
+    def test_plays_a_full_headless_game(self):
+        result = HeadlessGame(num_players=4, seed=2, record_events=False,
+                              seat_search={0: MCTSConfig(iterations=8, rollout_turns=2)}).play()
+        self.assertTrue(result.finished)
+
+
+if __name__ == '__main__':
+    unittest.main()
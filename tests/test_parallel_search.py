@@ -0,0 +1,86 @@
+import unittest
+
+from engine.cpu_player import CPUPlayer
+from engine.headless import HeadlessGame
+from engine.mcts import MCTSConfig, MCTSPlayer, action_key
+from engine.parallel_search import LEAF_PARALLEL, ROOT_PARALLEL, ParallelMCTSPlayer, search_player, shutdown_pools
+from model.codec import decode_game, encode_game
+
+
+class TestCodec(unittest.TestCase):
+    def test_round_trip_keeps_the_position(self):
+        runner = HeadlessGame(num_players=4, max_turns=30, seed=5)
+        runner.play()
+        game = runner.game
+        data = encode_game(game)
+        self.assertLess(len(data), 400)
+
+        decoded = decode_game(data)
+        self.assertEqual(decoded.position_hash(), game.position_hash())
+        self.assertEqual(encode_game(decoded), data)
+        self.assertEqual([decoded.board.core.longest.length(p.id) for p in decoded.players],
+                         [game.board.core.longest.length(p.id) for p in game.players])
+        self.assertEqual([dict(p.resources) for p in decoded.players], [dict(p.resources) for p in game.players])
+
+    def test_rejects_unknown_versions(self):
+        runner = HeadlessGame(num_players=3, max_turns=1, seed=1)
+        runner.play()
+        data = bytearray(encode_game(runner.game))
+        data[0] = 0xFF
+        with self.assertRaises(ValueError):
+            decode_game(bytes(data))
+
+
+class TestParallelSearch(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_pools()
+
+    def setUp(self):
+        runner = HeadlessGame(num_players=4, max_turns=20, seed=3)
+        runner.play()
+        self.game = runner.game
+        self.adapter = runner.setup.rules_adapter
+        for player in self.game.players:
+            for resource in list(player.resources):
+                player.add_resource(resource, 3)
+        self.adapter.start_turn()
+        self.legal = [action_key(a) for a in CPUPlayer(self.adapter).generate_candidate_actions()]
+
+    def _search(self, mode, **budget):
+        before = self.game.position_hash()
+        player = ParallelMCTSPlayer(self.adapter, config=MCTSConfig(workers=2, parallel=mode, **budget))
+        action = player.choose_action()
+        self.assertEqual(self.game.position_hash(), before)
+        self.assertIn(action_key(action), self.legal)
+        return player
+
+    def test_root_parallel_splits_the_budget(self):
+        player = self._search(ROOT_PARALLEL, iterations=10)
+        self.assertEqual(player.stats.iterations, 10)
+        self.assertEqual(player.stats.rollouts, 10)
+
+    def test_leaf_parallel_batches_rollouts(self):
+        player = self._search(LEAF_PARALLEL, iterations=9, leaf_batch=4)
+        self.assertEqual(player.stats.iterations, 9)
+        self.assertEqual(player.stats.rollouts, 9)
+
+    def test_time_budget(self):
+        player = self._search(ROOT_PARALLEL, iterations=None, time_limit=0.05)
+        self.assertGreaterEqual(player.stats.iterations, 2)
+
+    def test_root_parallel_replays_exactly(self):
+        config = MCTSConfig(iterations=8, workers=2, seed=4)
+        first = ParallelMCTSPlayer(self.adapter, config=config).choose_action()
+        second = ParallelMCTSPlayer(self.adapter, config=config).choose_action()
+        self.assertEqual((action_key(first), first.score), (action_key(second), second.score))
+
+    def test_one_worker_searches_in_process(self):
+        self.assertIs(type(search_player(self.adapter, None, MCTSConfig())), MCTSPlayer)
+        self.assertIsInstance(search_player(self.adapter, None, MCTSConfig(workers=2)), ParallelMCTSPlayer)
+        with self.assertRaises(ValueError):
+            self._search("tree", iterations=4)
+
+
+if __name__ == '__main__':
+    unittest.main()
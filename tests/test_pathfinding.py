@@ -0,0 +1,106 @@
+import random
+import unittest
+
+from model.board import create_standard_board
+from model.board_core import NO_OWNER
+from model.enums import Resource
+from search.pathfinding import DIJKSTRA, ZERO_ONE_BFS, Pathfinding
+
+
+def _random_position(seed):
+    rng = random.Random(seed)
+    board = create_standard_board(rng)
+    names = list(board.vertices)
+    for pid in range(3):
+        board.set_vertex_owner(rng.choice(names), pid)
+    for _ in range(30):
+        e = rng.randrange(len(board.edges))
+        if board.edges[e].owner is None:
+            board.set_edge_owner(e, rng.randrange(3))
+    return board
+
+
+class TestZeroOneBFS(unittest.TestCase):
+    def _assert_valid_path(self, board, starts, path_edges, distance, player_id):
+        """The edges to build plus the player's roads must link a start to the path's end."""
+        core = board.core
+        self.assertEqual(len(path_edges), distance)
+        for e in path_edges:
+            self.assertEqual(core.edge_owner[e], NO_OWNER)
+        usable = set(path_edges) | {e for e in range(core.num_edges) if core.edge_owner[e] == player_id}
+        reached = {core.vertex_idx(v) for v in starts}
+        frontier = list(reached)
+        while frontier:
+            v = frontier.pop()
+            for e, other in zip(core.edges_at(v), core.neighbours(v)):
+                if e in usable and other not in reached:
+                    reached.add(other)
+                    frontier.append(other)
+        for e in path_edges:
+            self.assertIn(core.edge_v1[e], reached)
+            self.assertIn(core.edge_v2[e], reached)
+
+    def test_same_distances_as_dijkstra(self):
+        for seed in range(15):
+            board = _random_position(seed)
+            pathfinding = Pathfinding(board)
+            for pid in range(3):
+                starts = pathfinding.get_player_connected_vertices(pid)
+                for resource in (Resource.LUMBER, Resource.BRICK, Resource.ORE):
+                    heap = pathfinding.shortest_path_to_resource(starts, resource, pid, DIJKSTRA)
+                    deque_result = pathfinding.shortest_path_to_resource(starts, resource, pid, ZERO_ONE_BFS)
+                    self.assertEqual(heap is None, deque_result is None)
+                    if heap is not None:
+                        self.assertEqual(heap[1], deque_result[1])
+                        self._assert_valid_path(board, starts, deque_result[0], deque_result[1], pid)
+
+    def test_own_roads_are_free(self):
+        board = create_standard_board()
+        core = board.core
+        board.set_vertex_owner("E", 0)
+        v = core.vertex_idx("E")
+        e = core.edges_at(v)[0]
+        board.set_edge_owner(e, 0)
+        target = core.vertex_name(core.other_end(e, v))
+        path, distance = Pathfinding(board).shortest_path_to_vertex(["E"], target, 0, ZERO_ONE_BFS)
+        self.assertEqual((path, distance), ([], 0))
+
+    def test_unknown_algorithm_rejected(self):
+        board = create_standard_board()
+        with self.assertRaises(ValueError):
+            Pathfinding(board).shortest_path_to_vertex(["E"], "A", 0, "a-star")
+
+
+class TestBestExpansionSites(unittest.TestCase):
+    def test_top_k_matches_brute_force_ranking(self):
+        for seed in range(10):
+            board = _random_position(seed)
+            core = board.core
+            pathfinding = Pathfinding(board)
+            pips = board.pip_cache.pips
+            for pid in range(3):
+                distances = pathfinding.distances.distances(pid)
+                expected = sorted(
+                    (v for v in range(core.num_vertices)
+                     if core.bits.distance_ok(v) and distances[v] != 255 and pips[v] > 0),
+                    key=lambda v: (-pips[v] / (distances[v] + 1), -pips[v], v),
+                )[:4]
+                plans = pathfinding.best_expansion_sites(pid, k=4)
+                self.assertEqual([p.vertex_id for p in plans], [core.vertex_names[v] for v in expected])
+                for plan in plans:
+                    self.assertEqual(len(plan.path_edges), plan.cost)
+                    self.assertAlmostEqual(plan.ratio, plan.value / (plan.cost + 1))
+
+    def test_custom_values_and_min_roads(self):
+        board = create_standard_board()
+        board.set_vertex_owner("E", 0)
+        pathfinding = Pathfinding(board)
+        sites = {board.core.vertex_names[v]: d for v, d in pathfinding.distances.site_distances(0).items()}
+        far = [vertex_id for vertex_id, d in sites.items() if d >= 2]
+        plans = pathfinding.best_expansion_sites(0, k=10, site_values={v: 1.0 for v in sites}, min_roads=2)
+        self.assertTrue(plans)
+        self.assertTrue(all(plan.vertex_id in far and plan.cost >= 2 for plan in plans))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from model.board import create_standard_board
+from model.enums import Resource
+from model.pip_cache import DICE_PIPS, PipCache
+
+
+def _naive_pips(board, vertex_id, robber_hex_id):
+    return sum(
+        DICE_PIPS.get(board.hexes[h].number, 0)
+        for h in board.vertices[vertex_id].hex_ids
+        if h != robber_hex_id and board.hexes[h].resource is not None
+    )
+
+
+def _naive_score(board, vertex_id, preferred):
+    score = 0
+    seen = set()
+    for h in board.vertices[vertex_id].hex_ids:
+        resource = board.hexes[h].resource
+        if resource is None or resource == Resource.DESERT:
+            continue
+        seen.add(resource)
+        score += 3 if preferred and resource in preferred else 1
+    return score + 2 * len(seen)
+
+
+class TestPipCache(unittest.TestCase):
+    def test_matches_naive_scan(self):
+        rng = random.Random(1)
+        board = create_standard_board(rng)
+        cache = board.pip_cache
+        for vertex_id in board.vertices:
+            self.assertEqual(cache.pips_of(vertex_id), _naive_pips(board, vertex_id, None))
+            self.assertEqual(cache.settlement_score(vertex_id), _naive_score(board, vertex_id, None))
+            preferred = [Resource.ORE, Resource.GRAIN]
+            self.assertEqual(cache.settlement_score(vertex_id, preferred), _naive_score(board, vertex_id, preferred))
+            income = cache.income_of(vertex_id)
+            self.assertAlmostEqual(sum(income.values()), cache.pips_of(vertex_id) / 36)
+            self.assertEqual(set(income), set(cache.resources_of(vertex_id)) if cache.pips_of(vertex_id) else set())
+
+    def test_robber_moves_refresh_affected_vertices(self):
+        rng = random.Random(2)
+        board = create_standard_board(rng)
+        cache = PipCache(board)
+        for _ in range(30):
+            robber = rng.choice(list(board.hexes))
+            cache.move_robber(robber)
+            for vertex_id in board.vertices:
+                self.assertEqual(cache.pips_of(vertex_id), _naive_pips(board, vertex_id, robber))
+            totals = cache.resource_pips()
+            self.assertEqual(sum(totals.values()), sum(
+                DICE_PIPS.get(h.number, 0) for hid, h in board.hexes.items() if hid != robber and h.resource
+            ))
+
+
+if __name__ == '__main__':
+    unittest.main()
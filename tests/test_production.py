@@ -0,0 +1,70 @@
+import random
+import unittest
+from collections import Counter
+
+from engine.headless import HeadlessGame
+from engine.production import ROLL_WAYS
+
+
+def _naive_payouts(snapshot, roll):
+    totals = Counter()
+    for tile in snapshot.tiles.values():
+        if tile.number != roll or tile.resource is None or snapshot.robber_tile_id == tile.tile_id:
+            continue
+        for vertex_id in tile.vertices:
+            owner, structure = snapshot.vertex_owners.get(vertex_id, (None, None))
+            if owner is not None:
+                totals[(owner, tile.resource)] += 2 if structure == "city" else 1
+    return totals
+
+
+class TestProductionTable(unittest.TestCase):
+    def setUp(self):
+        runner = HeadlessGame(num_players=4, max_turns=0, seed=11)
+        runner.play()
+        self.game = runner.game
+        self.engine = runner.setup.turn_engine_adapter.engine
+        self.adapter = runner.setup.turn_engine_adapter
+
+    def _assert_matches_scan(self):
+        snapshot = self.engine.board
+        for roll in ROLL_WAYS:
+            table = Counter({(p, r): a for p, r, a in self.engine.production.payouts(roll)})
+            self.assertEqual(table, _naive_payouts(snapshot, roll), f"roll {roll}")
+
+    def test_matches_full_scan_through_random_changes(self):
+        rng = random.Random(0)
+        board = self.game.board
+        vertex_ids = list(board.vertices)
+        self._assert_matches_scan()
+        for _ in range(200):
+            if rng.random() < 0.3:
+                self.engine.move_robber(rng.choice(list(self.engine.board.tiles)))
+            else:
+                owner = rng.choice([None, 0, 1, 2, 3])
+                board.set_vertex_owner(rng.choice(vertex_ids), owner, is_city=rng.random() < 0.5)
+            self._assert_matches_scan()
+
+    def test_distribution_uses_table(self):
+        before = sum(sum(p.resources.values()) for p in self.game.players)
+        events = self.adapter.run_dice_phase(0, roll=8)
+        paid = sum(a for _, _, a in self.engine.production.payouts(8))
+        after = sum(sum(p.resources.values()) for p in self.game.players)
+        self.assertEqual(after - before, paid)
+        self.assertEqual(sum(sum(g.values()) for g in events["gains"].values()), paid)
+
+    def test_expected_income_matches_payout_view(self):
+        for player in self.game.players:
+            view = self.adapter.payout_view(player.id)
+            expected = Counter()
+            for roll, payouts in view.items():
+                for res, amount in payouts.items():
+                    expected[res] += amount * ROLL_WAYS[roll] / 36
+            profile = self.adapter.resource_production_profile(player.id)
+            self.assertEqual(set(profile), set(expected))
+            for res, value in profile.items():
+                self.assertAlmostEqual(value, expected[res])
+
+
+if __name__ == '__main__':
+    unittest.main()
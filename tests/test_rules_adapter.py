@@ -0,0 +1,136 @@
+import unittest
+
+from engine.cpu_player import ActionType, CPUAction, CPUPlayer
+from engine.headless import HeadlessGame
+from engine.rules_adapter import (
+    BLOCK_ROAD_REACH, EXPANSION_PLAN_BONUS, EXPANSION_PLANS, ROAD_VALUE_PIP_SCALE, GameRulesAdapter,
+)
+from model.bitboard import iter_bits
+from model.board import create_standard_board
+from model.enums import Resource
+from model.game import GameState, Player
+from rules.building_rules import CITY_COST, ROAD_COST, SETTLEMENT_COST
+from services.building_service import BuildingService
+
+
+def _give(player, cost, times=1):
+    for resource, amount in cost.items():
+        player.resources[resource] += amount * times
+
+
+class TestGameRulesAdapter(unittest.TestCase):
+    def setUp(self):
+        runner = HeadlessGame(num_players=4, max_turns=0, seed=8)
+        runner.play()
+        self.setup = runner.setup
+        self.game = runner.game
+        self.adapter = self.setup.rules_adapter
+        self.player = self.game.get_current_player()
+        for resource in self.player.resources:
+            self.player.resources[resource] = 0
+
+    def test_nothing_is_legal_without_resources(self):
+        pid = self.player.id
+        self.assertEqual(self.adapter.legal_settlement_vertices(pid), [])
+        self.assertEqual(self.adapter.legal_road_edges(pid), [])
+        self.assertEqual(self.adapter.upgradeable_vertices(pid), [])
+        self.assertEqual(self.adapter.bank_trade_options(pid), [])
+
+    def test_legal_moves_match_building_rules(self):
+        pid = self.player.id
+        _give(self.player, ROAD_COST)
+        _give(self.player, CITY_COST)
+        rules = self.setup.building_service.rules
+        roads = self.adapter.legal_road_edges(pid)
+        self.assertEqual(sorted(roads), sorted(rules.legal_road_edges(pid)))
+        cities = [self.adapter.vertex_name(v) for v in self.adapter.upgradeable_vertices(pid)]
+        own = [v for v, vertex in self.game.board.vertices.items() if vertex.owner == pid and not vertex.is_city]
+        self.assertEqual(sorted(cities), sorted(own))
+
+    def test_memo_refreshes_after_execute(self):
+        pid = self.player.id
+        _give(self.player, ROAD_COST, times=2)
+        before = self.adapter.legal_road_edges(pid)
+        self.assertIs(self.adapter.legal_road_edges(pid), before)  # memoised
+        success, _ = self.adapter.execute(CPUAction(
+            score=0.0, action_type=ActionType.BUILD_ROAD, params={"edge_id": before[0]}
+        ))
+        self.assertTrue(success)
+        after = self.adapter.legal_road_edges(pid)
+        self.assertNotIn(before[0], after)
+
+    def test_traded_card_is_not_offered_back(self):
+        pid = self.player.id
+        self.player.resources[Resource.ORE] = 4
+        self.player.resources[Resource.WOOL] = 4
+        self.adapter.start_turn()
+        success, _ = self.adapter.execute(CPUAction(
+            score=0.0, action_type=ActionType.BANK_TRADE,
+            params={"give": Resource.ORE, "get": Resource.WOOL, "rate": 4},
+        ))
+        self.assertTrue(success)
+        gives = {give for give, _, _ in self.adapter.bank_trade_options(pid)}
+        self.assertNotIn(Resource.WOOL, gives)
+        self.adapter.start_turn()
+        gives = {give for give, _, _ in self.adapter.bank_trade_options(pid)}
+        self.assertIn(Resource.WOOL, gives)
+
+    def test_best_road_leads_to_the_best_site_per_road(self):
+        pid = self.player.id
+        field = self.setup.building_service.pathfinding.distances
+        pips = self.game.board.pip_cache.pips
+        sites = [(pips[v] / d, v) for v, d in field.site_distances(pid).items() if d > 0]
+        value, site = max(sites)
+        first = field.path_to(pid, site)[0]
+        towards = self.adapter._road_towards(pid)  # without the expansion-plan bonus
+        self.assertAlmostEqual(towards[first], value / ROAD_VALUE_PIP_SCALE)
+        self.assertAlmostEqual(max(towards.values()), value / ROAD_VALUE_PIP_SCALE)
+
+    def test_road_following_the_winning_plan_scores_highest(self):
+        pid = self.player.id
+        plans = self.setup.building_service.pathfinding.best_expansion_sites(pid, k=EXPANSION_PLANS, min_roads=1)
+        first = plans[0].path_edges[0]
+        towards = self.adapter._road_towards(pid)
+        score = self.adapter.road_expands_towards_value(first)
+        self.assertAlmostEqual(score, towards.get(first, 0.0) + EXPANSION_PLAN_BONUS)
+        on_plans = {plan.path_edges[0] for plan in plans}
+        for e in iter_bits(self.game.board.core.moves.legal_roads(pid)):
+            if e not in on_plans:
+                self.assertGreater(score, self.adapter.road_expands_towards_value(e))
+
+    def test_blocking_weighs_opponents_by_roads_needed(self):
+        board = create_standard_board()
+        game = GameState(board, [Player(i, f"P{i}", "red") for i in range(2)], turn_order=[0, 1])
+        adapter = GameRulesAdapter(game, BuildingService(game))
+        core = board.core
+        board.set_vertex_owner("E", 1)
+        # Graph distance from the opponent's settlement = roads they need on an empty board
+        hops = {core.vertex_idx("E"): 0}
+        frontier = list(hops)
+        while frontier:
+            v = frontier.pop(0)
+            for other in core.neighbours(v):
+                if other not in hops:
+                    hops[other] = hops[v] + 1
+                    frontier.append(other)
+        for v, d in hops.items():
+            roads = max(d - 1, 0)  # a neighbour of v is one hop closer
+            expected = 1.0 / (roads + 1) if roads <= BLOCK_ROAD_REACH else 0.0
+            self.assertAlmostEqual(adapter.settlement_blocks_opponent_value(v), expected)
+
+    def test_cpu_player_drives_a_turn(self):
+        _give(self.player, SETTLEMENT_COST, times=2)
+        _give(self.player, ROAD_COST, times=3)
+        _give(self.player, CITY_COST)
+        events = []
+        self.setup.on_event = lambda kind, data: events.append((kind, data))
+        vp_before = self.player.victory_points
+        self.setup._run_cpu_turn(self.player)
+        builds = [data["structure"] for kind, data in events if kind == "build"]
+        self.assertIn("city", builds)
+        self.assertGreater(self.player.victory_points, vp_before)
+        self.assertEqual(CPUPlayer(self.adapter).choose_action().action_type, ActionType.PASS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+from engine.cpu_player import CPUWeights
+from engine.tournament import make_tasks, play_task, run_tournament
+
+
+class TestTournament(unittest.TestCase):
+    def test_seeded_games_replay_identically(self):
+        task = make_tasks({"default": CPUWeights()}, games_per_set=1, max_turns=150)[0]
+        self.assertEqual(play_task(task), play_task(task))
+
+    def test_tasks_share_seeds_and_rotate_seats(self):
+        tasks = make_tasks({"a": CPUWeights(), "b": CPUWeights()}, games_per_set=5, num_players=4, base_seed=10)
+        seeds_a = [t.seed for t in tasks if t.weight_set == "a"]
+        seeds_b = [t.seed for t in tasks if t.weight_set == "b"]
+        self.assertEqual(seeds_a, [10, 11, 12, 13, 14])
+        self.assertEqual(seeds_a, seeds_b)
+        self.assertEqual([t.seat for t in tasks[:5]], [0, 1, 2, 3, 0])
+
+    def test_report_aggregates_every_game(self):
+        report = run_tournament(
+            {"a": CPUWeights(), "b": CPUWeights(base_value_city=14.0)},
+            games_per_set=3,
+            num_players=3,
+            max_turns=60,
+            workers=1,
+            verbose=False,
+        )
+        self.assertEqual(report.total_games, 6)
+        for stats in report.stats.values():
+            self.assertEqual(stats.games, 3)
+            self.assertEqual(sum(stats.vp_distribution.values()), 3)
+            self.assertLessEqual(stats.wins + stats.unfinished, 3)
+        self.assertGreater(report.games_per_second, 0)
+        self.assertIn("games/sec", report.format())
+
+
+if __name__ == '__main__':
+    unittest.main()
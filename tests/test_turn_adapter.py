@@ -0,0 +1,55 @@
+import unittest
+
+from engine.headless import HeadlessGame
+from engine.turn_adapter import STR_TO_RESOURCE
+
+
+def _set_up_game(seed=3):
+    runner = HeadlessGame(num_players=4, max_turns=0, seed=seed)
+    runner.play()
+    return runner.game, runner.setup.turn_engine_adapter
+
+
+class TestTurnEngineAdapter(unittest.TestCase):
+    def test_engine_is_built_once(self):
+        game, adapter = _set_up_game()
+        engine = adapter.engine
+        adapter.run_dice_phase(0, roll=6)
+        adapter.run_dice_phase(1, roll=8)
+        self.assertIs(adapter.engine, engine)
+
+    def test_gains_land_directly_on_players(self):
+        game, adapter = _set_up_game()
+        before = {p.id: dict(p.resources) for p in game.players}
+        events = adapter.run_dice_phase(0, roll=6)
+        for pid, gains in events["gains"].items():
+            player = game.players[int(pid)]
+            for name, amount in gains.items():
+                res = STR_TO_RESOURCE[name]
+                self.assertEqual(player.resources[res], before[player.id][res] + amount)
+
+    def test_snapshot_follows_board_changes(self):
+        game, adapter = _set_up_game()
+        snapshot = adapter.engine.board
+        vertex_id = next(v for v, vertex in game.board.vertices.items() if vertex.owner is not None)
+        owner = game.board.vertices[vertex_id].owner
+        game.board.set_vertex_owner(vertex_id, owner, is_city=True)
+        self.assertEqual(snapshot.vertex_owners[vertex_id], (str(owner), "city"))
+        game.board.set_vertex_owner(vertex_id, None)
+        self.assertEqual(snapshot.vertex_owners[vertex_id], (None, None))
+
+    def test_robber_moves_are_shared_both_ways(self):
+        game, adapter = _set_up_game()
+        snapshot = adapter.engine.board
+        game.robber_hex_id = 0
+        adapter.run_dice_phase(0, roll=6)
+        self.assertEqual(snapshot.robber_tile_id, 0)
+        self.assertTrue(snapshot.tiles[0].has_robber)
+        self.assertEqual(sum(tile.has_robber for tile in snapshot.tiles.values()), 1)
+
+        adapter.run_dice_phase(0, roll=7)
+        self.assertEqual(game.robber_hex_id, snapshot.robber_tile_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import random
+import unittest
+
+from engine.headless import HeadlessGame
+from model.board_core import BoardCore
+from model.enums import Resource
+from services.building_service import MoveRecord
+from .test_clone import _indexes
+
+
+def _snapshot(game):
+    return (
+        _indexes(game.board.core),
+        [(v.owner, v.is_city) for v in game.board.vertices.values()],
+        [e.owner for e in game.board.edges.values()],
+        [(dict(p.resources), p.victory_points, p.settlements_remaining, p.cities_remaining,
+          p.roads_remaining, p.has_longest_road) for p in game.players],
+        game.robber_hex_id,
+        game.board.pip_cache.pips[:],
+        game.position_hash(),
+    )
+
+
+class TestUndo(unittest.TestCase):
+    def setUp(self):
+        runner = HeadlessGame(num_players=4, max_turns=10, seed=9)
+        runner.play()
+        self.game = runner.game
+        self.service = runner.setup.building_service
+
+    def _random_move(self, rng):
+        game, service = self.game, self.service
+        player = rng.choice(game.players)
+        core = game.board.core
+        choice = rng.randrange(6)
+        if choice == 0:
+            roads = list(service.rules.legal_road_edges(player.id))
+            if roads:
+                service.build_road(player.id, rng.choice(roads))
+        elif choice == 1:
+            sites = [core.vertex_name(v) for v in range(core.num_vertices)
+                     if (core.moves.legal_settlements(player.id) >> v) & 1]
+            if sites:
+                service.build_settlement(player.id, rng.choice(sites))
+        elif choice == 2:
+            own = [core.vertex_name(v) for v in range(core.num_vertices)
+                   if (core.bits.upgradeable(player.id) >> v) & 1]
+            if own:
+                service.upgrade_to_city(player.id, rng.choice(own))
+        elif choice == 3:
+            give, get = rng.sample([r for r in Resource if r != Resource.DESERT], 2)
+            service.bank_trade(player.id, give, get)
+        elif choice == 4:
+            service.move_robber(rng.choice(list(game.board.hexes)))
+        else:
+            service.distribute_resources(rng.choice([2, 3, 4, 5, 6, 8, 9, 10, 11, 12]))
+
+    def test_undo_restores_every_intermediate_state(self):
+        rng = random.Random(4)
+        for player in self.game.players:
+            for resource in list(player.resources):
+                player.add_resource(resource, 20)
+        depth = len(self.service.undo_stack)
+        states = [_snapshot(self.game)]
+        for _ in range(80):
+            before = len(self.service.undo_stack)
+            self._random_move(rng)
+            if len(self.service.undo_stack) > before:
+                states.append(_snapshot(self.game))
+        self.assertGreater(len(states), 40)
+
+        while len(self.service.undo_stack) > depth:
+            states.pop()
+            self.service.undo()
+            self.assertEqual(_snapshot(self.game), states[-1])
+        self.assertEqual(_indexes(self.game.board.core), _indexes(BoardCore.from_board(self.game.board)))
+
+    def test_longest_road_card_is_handed_back(self):
+        game, service = self.game, self.service
+        player = game.players[0]
+        for resource in list(player.resources):
+            player.add_resource(resource, 40)
+        depth = len(service.undo_stack)
+        before = _snapshot(game)
+        while not player.has_longest_road and player.roads_remaining:
+            roads = list(service.rules.legal_road_edges(player.id))
+            if not roads:
+                break
+            longest = game.board.core.longest.longest_with(player.id, roads)
+            service.build_road(player.id, max(roads, key=lambda e: (longest[e], -e)))
+        self.assertTrue(player.has_longest_road)
+        service.undo_to(depth)
+        self.assertEqual(_snapshot(game), before)
+
+    def test_records_are_compact(self):
+        record = self.service.move_robber(0)
+        self.assertIsInstance(record, MoveRecord)
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertIs(self.service.undo(), record)
+
+    def test_failed_moves_are_not_recorded(self):
+        player = self.game.players[0]
+        for resource in list(player.resources):
+            player.set_resource(resource, 0)
+        depth = len(self.service.undo_stack)
+        success, _ = self.service.bank_trade(player.id, Resource.ORE, Resource.WOOL)
+        self.assertFalse(success)
+        self.assertEqual(len(self.service.undo_stack), depth)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import random
+import unittest
+
+from engine.headless import HeadlessGame
+from model.enums import Resource
+from model.zobrist import zobrist_key
+
+
+class TestZobristHash(unittest.TestCase):
+    def setUp(self):
+        runner = HeadlessGame(num_players=4, max_turns=0, seed=11)
+        runner.play()
+        self.setup = runner.setup
+        self.game = runner.game
+
+    def _check(self):
+        incremental = self.game.position_hash()
+        self.assertEqual(incremental, self.game.zobrist.recompute())
+
+    def test_matches_full_recompute_through_a_game(self):
+        self._check()
+        for _ in range(40):
+            if self.setup.play_turn(self.game.get_current_player()):
+                break
+            self._check()
+            self.game.next_turn()
+            self._check()
+
+    def test_hand_changes_are_reversible(self):
+        player = self.game.players[0]
+        before = self.game.position_hash()
+        player.add_resource(Resource.ORE, 2)
+        self.assertNotEqual(self.game.position_hash(), before)
+        self.assertTrue(player.remove_resource(Resource.ORE, 2))
+        self.assertEqual(self.game.position_hash(), before)
+
+    def test_robber_and_player_to_move_change_the_hash(self):
+        before = self.game.position_hash()
+        old_robber = self.game.robber_hex_id
+        other = next(h for h in self.game.board.hexes if h != old_robber)
+        self.game.move_robber(other)
+        self.assertNotEqual(self.game.position_hash(), before)
+        self.game.move_robber(old_robber)
+        self.assertEqual(self.game.position_hash(), before)
+
+        self.game.current_player_idx += 1
+        self.assertNotEqual(self.game.position_hash(), before)
+
+    def test_building_and_undoing_a_road(self):
+        board = self.game.board
+        free = next(e for e in range(board.core.num_edges) if board.core.edge_owner[e] < 0)
+        before = self.game.position_hash()
+        board.set_edge_owner(free, 0)
+        self.assertNotEqual(self.game.position_hash(), before)
+        self._check()
+        board.set_edge_owner(free, None)
+        self.assertEqual(self.game.position_hash(), before)
+
+    def test_keys_are_stable_and_distinct(self):
+        rng = random.Random(3)
+        features = {(rng.randrange(1, 6), rng.randrange(72), rng.randrange(4), rng.randrange(2)) for _ in range(500)}
+        keys = {zobrist_key(*f) for f in features}
+        self.assertEqual(len(keys), len(features))
+        self.assertEqual(zobrist_key(1, 2, 3, 0), zobrist_key(1, 2, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()